@@ -1 +1,20 @@
-from astrotraders.api.client import AstroTradersClient
+from typing import Any, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from astrotraders.api.client import AstroTradersClient, AsyncAstroTradersClient
+
+__all__ = ["AstroTradersClient", "AsyncAstroTradersClient"]
+
+
+def __getattr__(name: str) -> Any:
+    # the client, httpx and pydantic are imported on first use, see PEP 562,
+    # so importing the package alone, or a module from it, stays cheap
+    if name in __all__:
+        from astrotraders.api import client
+
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *__all__])
@@ -0,0 +1,97 @@
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Any, Callable, Iterable, Tuple, Hashable
+
+# (path regex, seconds to keep) pairs, first match wins
+DEFAULT_POLICIES: Tuple[Tuple[str, float], ...] = (
+    (r"^/systems/[^/]+/waypoints/[^/]+/market$", 30.0),
+    (r"^/systems/[^/]+/waypoints/[^/]+/shipyard$", 300.0),
+    (r"^/systems/[^/]+/waypoints/[^/]+/jump-gate$", 3600.0),
+    (r"^/systems/[^/]+/waypoints/[^/]+$", 3600.0),
+    (r"^/systems/[^/]+/waypoints$", 3600.0),
+    (r"^/systems/[^/]+$", 3600.0),
+    (r"^/systems$", 3600.0),
+    (r"^/factions(/[^/]+)?$", 3600.0),
+)
+
+
+class ResponseCache:
+    """
+    In-memory cache of decoded GET responses with per-endpoint freshness and LRU eviction.
+
+    ``policies`` map request paths to time to live in seconds; paths that match no policy,
+    or match one with zero TTL, are never cached. Actions are never cached, because only
+    GET requests go through the cache. Cached objects are shared between callers,
+    so they must not be mutated.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        policies: Optional[Iterable[Tuple[str, float]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.maxsize = maxsize
+        self._policies = [
+            (re.compile(pattern), ttl)
+            for pattern, ttl in (DEFAULT_POLICIES if policies is None else policies)
+        ]
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: OrderedDict[Hashable, Tuple[float, str, Any]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def ttl(self, path: str) -> Optional[float]:
+        """
+        Time to live for responses of a path, or None if they should not be cached.
+        """
+        for pattern, ttl in self._policies:
+            if pattern.match(path):
+                return ttl if ttl > 0 else None
+        return None
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires, _, value = entry
+                if expires > self._clock():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+            self.misses += 1
+            return None
+
+    def set(self, key: Hashable, path: str, value: Any, ttl: float) -> None:
+        with self._lock:
+            self._entries[key] = (self._clock() + ttl, path, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, pattern: Optional[str] = None) -> int:
+        """
+        Drop entries whose path matches regex ``pattern``, or all entries.
+        Returns number of dropped entries.
+        """
+        with self._lock:
+            if pattern is None:
+                count = len(self._entries)
+                self._entries.clear()
+                return count
+            regex = re.compile(pattern)
+            keys = [
+                key for key, (_, path, _) in self._entries.items() if regex.search(path)
+            ]
+            for key in keys:
+                del self._entries[key]
+            return len(keys)
@@ -1,38 +1,182 @@
-from httpx import Client
+from __future__ import annotations
 
-from astrotraders.api.resources import (
-    AgentsResource,
-    SystemsResource,
-    ContractsResource,
-    FactionsResource,
-    FleetResource,
-    ServerResource,
-)
-from astrotraders.api.exceptions import exception_hook
-from astrotraders.api.wrapper import HttpxClientWrapper
+import importlib
+from typing import Optional, Union, TYPE_CHECKING, Any, Dict
+
+from httpx import AsyncBaseTransport, AsyncClient, BaseTransport, Client
+
+from astrotraders.api.ratelimit import RateLimiter
+from astrotraders.api.retry import RetryPolicy
+from astrotraders.api.wrapper import HttpxClientWrapper, AsyncHttpxClientWrapper
+
+if TYPE_CHECKING:
+    from astrotraders.api.cache import ResponseCache
+    from astrotraders.api.fleet_state import FleetState
+    from astrotraders.api.markets import MarketStore
+    from astrotraders.api.resources import (
+        AgentsResource,
+        SystemsResource,
+        ContractsResource,
+        FactionsResource,
+        FleetResource,
+        ServerResource,
+        AsyncAgentsResource,
+        AsyncSystemsResource,
+        AsyncContractsResource,
+        AsyncFactionsResource,
+        AsyncFleetResource,
+        AsyncServerResource,
+    )
+    from astrotraders.api.structs import StructBackend
+    from astrotraders.api.universe import UniverseCache
+
+# resource modules import the schemas, so each one is loaded when it is first used
+_RESOURCES = {
+    "agents": "AgentsResource",
+    "systems": "SystemsResource",
+    "contracts": "ContractsResource",
+    "factions": "FactionsResource",
+    "fleet": "FleetResource",
+    "server": "ServerResource",
+}
+
+
+def _make_resource(name: str, client: Any, prefix: str = "") -> Any:
+    module = importlib.import_module(f"astrotraders.api.resources.{name}")
+    return getattr(module, prefix + _RESOURCES[name])(client)
 
 
 class AstroTradersClient:
-    def __init__(self, httpx_instance: Client):
+    def __init__(
+        self,
+        httpx_instance: Client,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        universe_cache: Optional[UniverseCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        market_store: Optional[MarketStore] = None,
+        fleet_state: Optional[FleetState] = None,
+        validate: Union[bool, float] = True,
+        lazy: bool = False,
+        backend: Optional["StructBackend"] = None,
+    ):
         self._httpx_instance = httpx_instance
-        self._client = HttpxClientWrapper(self._httpx_instance)
-        self._agents = AgentsResource(self._client)
-        self._systems = SystemsResource(self._client)
-        self._contracts = ContractsResource(self._client)
-        self._factions = FactionsResource(self._client)
-        self._fleet = FleetResource(self._client)
-        self._server = ServerResource(self._client)
+        self._client = HttpxClientWrapper(
+            self._httpx_instance,
+            rate_limiter,
+            retry_policy,
+            universe_cache,
+            response_cache,
+            market_store,
+            fleet_state,
+            validate,
+            lazy,
+            backend,
+        )
+        self._resources: Dict[str, Any] = {}
+
+    def _resource(self, name: str) -> Any:
+        resource = self._resources.get(name)
+        if resource is None:
+            resource = self._resources[name] = _make_resource(name, self._client)
+        return resource
 
     @classmethod
     def set_up(
-        cls, token: str, url: str = "https://api.spacetraders.io/v2"
+        cls,
+        token: str,
+        url: str = "https://api.spacetraders.io/v2",
+        rate: Optional[float] = None,
+        burst: int = 30,
+        retries: int = 0,
+        universe_cache: Optional[UniverseCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        market_store: Optional[MarketStore] = None,
+        fleet_state: Optional[FleetState] = None,
+        validate: Union[bool, float] = True,
+        lazy: bool = False,
+        backend: Optional["StructBackend"] = None,
+        transport: Optional[BaseTransport] = None,
     ) -> "AstroTradersClient":
+        """
+        Create client with default httpx settings.
+        With ``rate``, requests are throttled to that many per second with a pool of ``burst``
+        extra requests per minute; the SpaceTraders API allows ``rate=2``.
+        With ``retries``, rate limited and failed idempotent requests are retried
+        up to that many times. Both are off by default.
+        Pass ``universe_cache`` to keep systems, waypoints, jump gates and factions between runs
+        and ``response_cache`` to reuse fresh GET responses in memory.
+        Pass ``market_store`` to record market prices and trade transactions
+        and ``fleet_state`` to serve ship reads from states known from earlier responses.
+        ``validate=False`` builds models from responses without validation, which is much
+        faster, and a number between 0 and 1 validates only that share of responses.
+        With ``lazy=True``, model fields are only built and validated when they are read.
+        Pass ``backend=StructBackend()`` to decode ships, markets, systems and waypoints
+        into msgspec structs instead of models, which requires the ``fast`` extra.
+        ``transport`` replaces the network, e.g. with ``MockServer().transport()``
+        from :mod:`astrotraders.mock`.
+        """
         client = Client(
             base_url=url,
-            event_hooks={"response": [exception_hook]},
             headers={"Authorization": f"Bearer {token}"},
+            transport=transport,
+        )
+        rate_limiter = RateLimiter(rate, burst) if rate is not None else None
+        retry_policy = RetryPolicy(max_retries=retries) if retries else None
+        return cls(
+            client,
+            rate_limiter,
+            retry_policy,
+            universe_cache,
+            response_cache,
+            market_store,
+            fleet_state,
+            validate,
+            lazy,
+            backend,
         )
-        return cls(client)
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """
+        Client-side rate limiter, which also exposes time spent waiting for the request budget.
+        """
+        return self._client.rate_limiter
+
+    @property
+    def universe_cache(self) -> Optional[UniverseCache]:
+        """
+        Persistent cache of rarely changing universe data, if enabled.
+        """
+        return self._client.universe_cache
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """
+        In-memory cache of GET responses with hit and miss counters, if enabled.
+        """
+        return self._client.response_cache
+
+    @property
+    def market_store(self) -> Optional[MarketStore]:
+        """
+        History of observed market prices and transactions, if enabled.
+        """
+        return self._client.market_store
+
+    @property
+    def fleet_state(self) -> Optional[FleetState]:
+        """
+        Latest known state of ships, kept up to date from action responses, if enabled.
+        """
+        return self._client.fleet_state
+
+    @property
+    def backend(self) -> Optional["StructBackend"]:
+        """
+        Backend decoding the hot schemas into msgspec structs, if enabled.
+        """
+        return self._client.backend
 
     @property
     def agents(self) -> AgentsResource:
@@ -40,7 +184,7 @@ class AstroTradersClient:
         Agents are the primary entity in SpaceTraders.
         Player controls a single agent which can be used to manage a fleet of ships and conduct trade with factions
         """
-        return self._agents
+        return self._resource("agents")
 
     @property
     def systems(self) -> SystemsResource:
@@ -48,7 +192,7 @@ class AstroTradersClient:
         Systems are the primary locations in the SpaceTraders universe.
         Every system has a type, which is typically a type of star, and a set of x, y coordinates.
         """
-        return self._systems
+        return self._resource("systems")
 
     @property
     def contracts(self) -> ContractsResource:
@@ -56,7 +200,7 @@ class AstroTradersClient:
         Faction contracts are a good way to earn credits and faction reputation.
         Your contract will have a set of terms, which describe the requirements for completing the contract.
         """
-        return self._contracts
+        return self._resource("contracts")
 
     @property
     def factions(self) -> FactionsResource:
@@ -64,21 +208,210 @@ class AstroTradersClient:
         Factions are the primary NPC organizations in SpaceTraders.
         Each faction will have a unique set of ships, contracts, and trade routes for you to explore.
         """
-        return self._factions
+        return self._resource("factions")
 
     @property
     def fleet(self) -> FleetResource:
         """
         Fleet is the collection of your ships.
         """
-        return self._fleet
+        return self._resource("fleet")
 
     @property
     def server(self) -> ServerResource:
         """
         Server resources like leaderboards.
         """
-        return self._server
+        return self._resource("server")
 
     def close(self) -> "None":
         self._httpx_instance.close()
+
+
+class AsyncAstroTradersClient:
+    """
+    Asyncio counterpart of :class:`AstroTradersClient`.
+    Every resource method is a coroutine, so many requests can be in flight at once.
+    """
+
+    def __init__(
+        self,
+        httpx_instance: AsyncClient,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        universe_cache: Optional[UniverseCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        market_store: Optional[MarketStore] = None,
+        fleet_state: Optional[FleetState] = None,
+        validate: Union[bool, float] = True,
+        lazy: bool = False,
+        backend: Optional["StructBackend"] = None,
+    ):
+        self._httpx_instance = httpx_instance
+        self._client = AsyncHttpxClientWrapper(
+            self._httpx_instance,
+            rate_limiter,
+            retry_policy,
+            universe_cache,
+            response_cache,
+            market_store,
+            fleet_state,
+            validate,
+            lazy,
+            backend,
+        )
+        self._resources: Dict[str, Any] = {}
+
+    def _resource(self, name: str) -> Any:
+        resource = self._resources.get(name)
+        if resource is None:
+            resource = self._resources[name] = _make_resource(
+                name, self._client, "Async"
+            )
+        return resource
+
+    @classmethod
+    def set_up(
+        cls,
+        token: str,
+        url: str = "https://api.spacetraders.io/v2",
+        rate: Optional[float] = None,
+        burst: int = 30,
+        retries: int = 0,
+        universe_cache: Optional[UniverseCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        market_store: Optional[MarketStore] = None,
+        fleet_state: Optional[FleetState] = None,
+        validate: Union[bool, float] = True,
+        lazy: bool = False,
+        backend: Optional["StructBackend"] = None,
+        transport: Optional[AsyncBaseTransport] = None,
+    ) -> "AsyncAstroTradersClient":
+        """
+        Create client with default httpx settings.
+        With ``rate``, requests are throttled to that many per second with a pool of ``burst``
+        extra requests per minute; the SpaceTraders API allows ``rate=2``.
+        With ``retries``, rate limited and failed idempotent requests are retried
+        up to that many times. Both are off by default.
+        Pass ``universe_cache`` to keep systems, waypoints, jump gates and factions between runs
+        and ``response_cache`` to reuse fresh GET responses in memory.
+        Pass ``market_store`` to record market prices and trade transactions
+        and ``fleet_state`` to serve ship reads from states known from earlier responses.
+        ``validate=False`` builds models from responses without validation, which is much
+        faster, and a number between 0 and 1 validates only that share of responses.
+        With ``lazy=True``, model fields are only built and validated when they are read.
+        Pass ``backend=StructBackend()`` to decode ships, markets, systems and waypoints
+        into msgspec structs instead of models, which requires the ``fast`` extra.
+        ``transport`` replaces the network, e.g. with ``MockServer().transport()``
+        from :mod:`astrotraders.mock`.
+        """
+        client = AsyncClient(
+            base_url=url,
+            headers={"Authorization": f"Bearer {token}"},
+            transport=transport,
+        )
+        rate_limiter = RateLimiter(rate, burst) if rate is not None else None
+        retry_policy = RetryPolicy(max_retries=retries) if retries else None
+        return cls(
+            client,
+            rate_limiter,
+            retry_policy,
+            universe_cache,
+            response_cache,
+            market_store,
+            fleet_state,
+            validate,
+            lazy,
+            backend,
+        )
+
+    @property
+    def rate_limiter(self) -> Optional[RateLimiter]:
+        """
+        Client-side rate limiter, which also exposes time spent waiting for the request budget.
+        """
+        return self._client.rate_limiter
+
+    @property
+    def universe_cache(self) -> Optional[UniverseCache]:
+        """
+        Persistent cache of rarely changing universe data, if enabled.
+        """
+        return self._client.universe_cache
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        """
+        In-memory cache of GET responses with hit and miss counters, if enabled.
+        """
+        return self._client.response_cache
+
+    @property
+    def market_store(self) -> Optional[MarketStore]:
+        """
+        History of observed market prices and transactions, if enabled.
+        """
+        return self._client.market_store
+
+    @property
+    def fleet_state(self) -> Optional[FleetState]:
+        """
+        Latest known state of ships, kept up to date from action responses, if enabled.
+        """
+        return self._client.fleet_state
+
+    @property
+    def backend(self) -> Optional["StructBackend"]:
+        """
+        Backend decoding the hot schemas into msgspec structs, if enabled.
+        """
+        return self._client.backend
+
+    @property
+    def agents(self) -> AsyncAgentsResource:
+        """
+        Agents are the primary entity in SpaceTraders.
+        Player controls a single agent which can be used to manage a fleet of ships and conduct trade with factions
+        """
+        return self._resource("agents")
+
+    @property
+    def systems(self) -> AsyncSystemsResource:
+        """
+        Systems are the primary locations in the SpaceTraders universe.
+        Every system has a type, which is typically a type of star, and a set of x, y coordinates.
+        """
+        return self._resource("systems")
+
+    @property
+    def contracts(self) -> AsyncContractsResource:
+        """
+        Faction contracts are a good way to earn credits and faction reputation.
+        Your contract will have a set of terms, which describe the requirements for completing the contract.
+        """
+        return self._resource("contracts")
+
+    @property
+    def factions(self) -> AsyncFactionsResource:
+        """
+        Factions are the primary NPC organizations in SpaceTraders.
+        Each faction will have a unique set of ships, contracts, and trade routes for you to explore.
+        """
+        return self._resource("factions")
+
+    @property
+    def fleet(self) -> AsyncFleetResource:
+        """
+        Fleet is the collection of your ships.
+        """
+        return self._resource("fleet")
+
+    @property
+    def server(self) -> AsyncServerResource:
+        """
+        Server resources like leaderboards.
+        """
+        return self._resource("server")
+
+    async def close(self) -> "None":
+        await self._httpx_instance.aclose()
@@ -0,0 +1,272 @@
+from datetime import datetime
+from enum import Enum
+from typing import (
+    Optional,
+    Any,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel, ValidationError
+from pydantic.datetime_parse import parse_datetime
+from pydantic.error_wrappers import ErrorWrapper
+from pydantic.errors import MissingError
+from pydantic.fields import ModelField, SHAPE_LIST, SHAPE_SINGLETON
+
+M = TypeVar("M", bound=BaseModel)
+
+Converter = Callable[[Any], Any]
+# field name, key in data, converter (None keeps the value), field
+FieldPlan = Tuple[str, str, Optional[Converter], ModelField]
+
+_plans: Dict[Type[BaseModel], List[FieldPlan]] = {}
+
+
+def construct(model: Type[M], data: Mapping[str, Any]) -> M:
+    """
+    Build a model from trusted data, like a decoded API response, without validation.
+
+    Unlike ``BaseModel.construct``, nested models, lists of models, enums and datetimes
+    are built recursively from their JSON forms, so the result looks exactly like
+    a validated one, but constraints aren't checked and unknown keys are dropped.
+    """
+    plan = _plans.get(model)
+    if plan is None:
+        plan = _plans[model] = [
+            (name, field.alias, _converter(field), field)
+            for name, field in model.__fields__.items()
+        ]
+    values: Dict[str, Any] = {}
+    fields_set = set()
+    for name, key, convert, field in plan:
+        if key in data:
+            value = data[key]
+            if convert is not None and value is not None:
+                value = convert(value)
+            values[name] = value
+            fields_set.add(name)
+        elif not field.required:
+            values[name] = field.get_default()
+    instance = model.__new__(model)
+    object.__setattr__(instance, "__dict__", values)
+    object.__setattr__(instance, "__fields_set__", fields_set)
+    if model.__private_attributes__:
+        instance._init_private_attributes()
+    return instance
+
+
+def _converter(field: ModelField) -> Optional[Converter]:
+    convert = _type_converter(field.type_)
+    if field.shape == SHAPE_SINGLETON:
+        return convert
+    if field.shape == SHAPE_LIST:
+        if convert is None:
+            return None
+        item_convert: Converter = convert
+        return lambda items: [item_convert(item) for item in items]
+
+    # shapes the schemas don't use yet go through regular validation
+    def validate(value: Any) -> Any:
+        result, errors = field.validate(value, {}, loc=field.alias)
+        return value if errors else result
+
+    return validate
+
+
+def _type_converter(type_: Any) -> Optional[Converter]:
+    if not isinstance(type_, type):
+        return None
+    if issubclass(type_, BaseModel):
+        if type_.__custom_root_type__:
+            return lambda value: construct(type_, {"__root__": value})
+        return lambda value: construct(type_, value)
+    if issubclass(type_, Enum):
+        members = type_._value2member_map_
+
+        def member(value: Any) -> Any:
+            # skips Enum.__call__, values which aren't hashable or known fall back to it
+            try:
+                return members[value]
+            except (KeyError, TypeError):
+                return type_(value)
+
+        return member
+    if issubclass(type_, datetime):
+        return parse_datetime
+    if issubclass(type_, float):
+        return float
+    return None
+
+
+class _Lazy:
+    """
+    Mixin of model classes made by :func:`lazy`. Instances keep decoded data in ``__raw__``
+    and move fields into ``__dict__`` when they are read for the first time,
+    so reading them again costs nothing.
+    """
+
+    __slots__ = ()
+
+    def __getattr__(self, name: str) -> Any:
+        load = _loaders[type(self)].get(name)
+        if load is None:
+            raise AttributeError(
+                f"{type(self).__name__!r} object has no attribute {name!r}"
+            )
+        try:
+            raw = object.__getattribute__(self, "__raw__")
+        except AttributeError:
+            # copies get every field at once and no raw data
+            raise AttributeError(name) from None
+        value = load(raw)
+        self.__dict__[name] = value
+        return value
+
+    def _load_all(self) -> None:
+        values = self.__dict__
+        loaders = _loaders[type(self)]
+        if len(values) == len(loaders):
+            return
+        for name in loaders:
+            if name not in values:
+                try:
+                    getattr(self, name)
+                except AttributeError:
+                    # missing in trusted data
+                    pass
+        # in field order, like in a model built at once
+        ordered = {name: values[name] for name in loaders if name in values}
+        object.__setattr__(self, "__dict__", ordered)
+
+    # everything which walks all fields loads them first
+
+    def _iter(self, *args: Any, **kwargs: Any) -> Any:
+        self._load_all()
+        return super()._iter(*args, **kwargs)  # type: ignore[misc]
+
+    def __iter__(self) -> Iterator[Tuple[str, Any]]:
+        self._load_all()
+        return super().__iter__()  # type: ignore[misc]
+
+    def __repr_args__(self) -> Any:
+        self._load_all()
+        return super().__repr_args__()  # type: ignore[misc]
+
+    def __getstate__(self) -> Any:
+        self._load_all()
+        return super().__getstate__()  # type: ignore[misc]
+
+    def __reduce__(self) -> Any:
+        # lazy classes can't be imported by name, so they are pickled as plain models
+        return _restore, (_models[type(self)], self.__getstate__())
+
+
+Loader = Callable[[Mapping[str, Any]], Any]
+
+_lazy_classes: Dict[Tuple[Type[BaseModel], bool], Type[BaseModel]] = {}
+_loaders: Dict[type, Dict[str, Loader]] = {}
+_keys: Dict[type, List[Tuple[str, str]]] = {}
+_models: Dict[type, Type[BaseModel]] = {}
+
+
+def _restore(model: Type[M], state: Any) -> M:
+    instance = model.__new__(model)
+    instance.__setstate__(state)
+    return instance
+
+
+def lazy(model: Type[M], data: Mapping[str, Any], validate: bool = True) -> M:
+    """
+    Wrap decoded data in a model whose fields are built, and validated unless
+    ``validate`` is false, the first time they are read. Nested models are lazy as well,
+    so reading ``ship.nav.status`` never touches the frame, modules or mounts.
+
+    The result is an instance of a subclass of ``model`` and behaves like it;
+    validation errors are raised when a broken field is read, not here.
+    """
+    if model.__custom_root_type__:
+        return model(**data) if validate else construct(model, data)
+    cls = _lazy_classes.get((model, validate))
+    if cls is None:
+        cls = _lazy_classes[model, validate] = _lazy_class(model, validate)
+    instance = cls.__new__(cls)
+    object.__setattr__(instance, "__dict__", {})
+    object.__setattr__(instance, "__raw__", data)
+    object.__setattr__(
+        instance, "__fields_set__", {name for name, key in _keys[cls] if key in data}
+    )
+    if cls.__private_attributes__:
+        instance._init_private_attributes()
+    return instance  # type: ignore[return-value]
+
+
+def _lazy_class(model: Type[BaseModel], validate: bool) -> Type[BaseModel]:
+    cls = type(
+        model.__name__,
+        (_Lazy, model),
+        {
+            "__slots__": ("__raw__",),
+            "__module__": model.__module__,
+            "__qualname__": model.__qualname__,
+        },
+    )
+    _loaders[cls] = {
+        name: _loader(model, field, validate)
+        for name, field in model.__fields__.items()
+    }
+    _keys[cls] = [(name, field.alias) for name, field in model.__fields__.items()]
+    _models[cls] = model
+    return cls
+
+
+def _loader(model: Type[BaseModel], field: ModelField, validate: bool) -> Loader:
+    key = field.alias
+    if validate:
+
+        def convert(value: Any) -> Any:
+            result, errors = field.validate(value, {}, loc=key, cls=model)
+            if errors:
+                raise ValidationError([errors], model)
+            return result
+
+    else:
+        converter = _converter(field)
+
+        def convert(value: Any) -> Any:
+            if value is None or converter is None:
+                return value
+            return converter(value)
+
+    nested = field.type_
+    if (
+        not isinstance(nested, type)
+        or not issubclass(nested, BaseModel)
+        or nested.__custom_root_type__
+        or field.shape not in (SHAPE_SINGLETON, SHAPE_LIST)
+    ):
+        nested = None
+
+    def load(raw: Mapping[str, Any]) -> Any:
+        if key not in raw:
+            if not field.required:
+                return field.get_default()
+            if validate:
+                raise ValidationError([ErrorWrapper(MissingError(), loc=key)], model)
+            raise AttributeError(key)
+        value = raw[key]
+        if nested is not None:
+            if field.shape == SHAPE_SINGLETON and isinstance(value, Mapping):
+                return lazy(nested, value, validate)
+            if field.shape == SHAPE_LIST and isinstance(value, list):
+                if all(isinstance(item, Mapping) for item in value):
+                    return [lazy(nested, item, validate) for item in value]
+        # anything else, including None and data which doesn't look right
+        return convert(value)
+
+    return load
@@ -1,16 +1,31 @@
 from typing import Optional, Any
 
+import orjson
 from httpx import Response
 
-from astrotraders.api.utils import ORJSONDecoder
+
+def _check_response(response: Response) -> None:
+    if response.content:
+        data: Any = orjson.loads(response.content)
+        if isinstance(data, dict) and data.get("error"):
+            raise APIException(data["error"])
 
 
 def exception_hook(response: Response) -> None:
+    """
+    Raise APIException for error responses of a plain httpx client.
+    Client wrappers already check every response they parse, so they don't need this hook.
+    """
     response.read()
-    if response.content:
-        data: Any = response.json(cls=ORJSONDecoder)
-        if isinstance(response, dict) and data.get("error"):
-            raise APIException(data.get("error"))
+    _check_response(response)
+
+
+async def async_exception_hook(response: Response) -> None:
+    """
+    Asyncio version of :func:`exception_hook`.
+    """
+    await response.aread()
+    _check_response(response)
 
 
 class APIException(Exception):
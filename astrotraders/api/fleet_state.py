@@ -0,0 +1,211 @@
+import math
+from collections import Counter
+import threading
+import time
+from typing import Optional, Any, Callable, Dict, Tuple, TypeVar, Union, cast
+
+from pydantic import BaseModel
+
+from astrotraders.api.schemas import (
+    Cooldown,
+    ShipCargo,
+    ShipFuel,
+    ShipNav,
+    ShipNavFlightMode,
+    ShipNavStatus,
+    ShipSchema,
+)
+from astrotraders.api.utils import is_struct, model_type
+
+V = TypeVar("V")
+
+
+def _replace(value: V, update: Dict[str, Any]) -> V:
+    if is_struct(value):
+        # a struct from the struct backend
+        import msgspec
+
+        return cast(V, msgspec.structs.replace(cast(msgspec.Struct, value), **update))
+    return cast(V, cast(BaseModel, value).copy(update=update))
+
+
+class FleetState:
+    """
+    Latest known state of every ship, assembled from responses.
+
+    Besides full ships from ``FleetResource.get`` and listings, action results update
+    the parts they carry: ``orbit`` and ``dock`` bring the nav, ``extract`` the cargo and
+    cooldown, ``refuel`` the fuel and so on. Reads of ships, nav, cargo and cooldown are
+    then served from here. Time based changes are applied on read, so a ship in transit
+    is in orbit after its arrival and an expired cooldown is gone.
+    Anything done outside of the client isn't seen, use ``refresh=True`` or
+    :meth:`forget` then, or set ``max_age`` to re-fetch parts older than that many seconds.
+
+    With ``skip_redundant``, ``orbit``, ``dock`` and ``flight_mode`` calls for a ship
+    already known to be in the target state return the known nav without a request,
+    ``saved`` counts them per action.
+    """
+
+    SHIP = "ship"
+    NAV = "nav"
+    CARGO = "cargo"
+    FUEL = "fuel"
+    COOLDOWN = "cooldown"
+
+    def __init__(
+        self,
+        max_age: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+        skip_redundant: bool = False,
+    ):
+        self.max_age = max_age
+        self.skip_redundant = skip_redundant
+        self._clock = clock
+        self._lock = threading.Lock()
+        # ship symbol -> part -> (unix time of the update, value)
+        self._ships: Dict[str, Dict[str, Tuple[float, Any]]] = {}
+        self.hits = 0
+        self.misses = 0
+        self.saved: Counter[str] = Counter()
+
+    def __len__(self) -> int:
+        return len(self._ships)
+
+    def __contains__(self, ship: object) -> bool:
+        return ship in self._ships
+
+    def set(self, ship: str, part: str, value: Any) -> None:
+        """
+        Remember one part of a ship, ``None`` is a valid cooldown meaning there is none.
+        """
+        with self._lock:
+            self._ships.setdefault(ship, {})[part] = (self._clock(), value)
+
+    def update(self, ship: str, value: Any) -> None:
+        """
+        Remember state carried by a response: a ship, its nav, cargo, fuel or cooldown,
+        or an action result with some of ``nav``, ``cargo``, ``fuel`` and ``cooldown`` fields.
+        """
+        now = self._clock()
+        kind = model_type(value)
+        if issubclass(kind, ShipSchema):
+            parts = {
+                self.SHIP: value,
+                self.NAV: value.nav,
+                self.CARGO: value.cargo,
+                self.FUEL: value.fuel,
+            }
+        elif issubclass(kind, ShipNav):
+            parts = {self.NAV: value}
+        elif issubclass(kind, ShipCargo):
+            parts = {self.CARGO: value}
+        elif issubclass(kind, ShipFuel):
+            parts = {self.FUEL: value}
+        elif issubclass(kind, Cooldown):
+            parts = {self.COOLDOWN: value}
+        else:
+            parts = {
+                part: getattr(value, part)
+                for part in (self.NAV, self.CARGO, self.FUEL, self.COOLDOWN)
+                if getattr(value, part, None) is not None
+            }
+        with self._lock:
+            state = self._ships.setdefault(ship, {})
+            for part, item in parts.items():
+                state[part] = (now, item)
+
+    def forget(self, ship: Optional[str] = None, part: Optional[str] = None) -> None:
+        """
+        Drop what is known about a ship part, a whole ship, or every ship.
+        """
+        with self._lock:
+            if ship is None:
+                self._ships.clear()
+            elif part is None:
+                self._ships.pop(ship, None)
+            elif ship in self._ships:
+                self._ships[ship].pop(part, None)
+
+    def lookup(self, ship: str, part: str) -> Tuple[bool, Any]:
+        """
+        Whether a part of a ship is known and fresh, and its current value.
+        """
+        now = self._clock()
+        # a full ship is only as fresh as its parts which actions update
+        parts = [part]
+        if part == self.SHIP:
+            parts += [self.NAV, self.CARGO, self.FUEL]
+        oldest = -math.inf if self.max_age is None else now - self.max_age
+        with self._lock:
+            state = self._ships.get(ship, {})
+            entries = [state.get(name) for name in parts]
+            values = [entry[1] for entry in entries if entry and entry[0] >= oldest]
+            if len(values) < len(parts):
+                self.misses += 1
+                return False, None
+            self.hits += 1
+        if part == self.SHIP:
+            value, nav, cargo, fuel = values
+            update = {"nav": self._current_nav(nav, now), "cargo": cargo, "fuel": fuel}
+            return True, _replace(value, update)
+        if part == self.NAV:
+            return True, self._current_nav(values[0], now)
+        if part == self.COOLDOWN and values[0] is not None:
+            return True, self._current_cooldown(values[0], now)
+        return True, values[0]
+
+    def unchanged(
+        self,
+        ship: str,
+        action: str,
+        status: Optional[ShipNavStatus] = None,
+        mode: Union[ShipNavFlightMode, str, None] = None,
+    ) -> Optional[ShipNav]:
+        """
+        Known nav of a ship if it already has the given status and flight mode,
+        so the action would change nothing, otherwise None.
+        Only answers with ``skip_redundant`` enabled, each answer is a saved request.
+        """
+        if not self.skip_redundant:
+            return None
+        known, nav = self.lookup(ship, self.NAV)
+        if (
+            not known
+            or (status is not None and nav.status != status)
+            or (mode is not None and nav.flight_mode != mode)
+        ):
+            return None
+        with self._lock:
+            self.saved[action] += 1
+        return nav
+
+    @staticmethod
+    def _current_nav(nav: ShipNav, now: float) -> ShipNav:
+        if (
+            nav.status == ShipNavStatus.in_transit
+            and nav.route.arrival.timestamp() <= now
+        ):
+            return _replace(nav, {"status": ShipNavStatus.in_orbit})
+        return nav
+
+    @staticmethod
+    def _current_cooldown(cooldown: Cooldown, now: float) -> Optional[Cooldown]:
+        remaining = cooldown.expiration.timestamp() - now
+        if remaining <= 0:
+            return None
+        return _replace(cooldown, {"remaining_seconds": math.ceil(remaining)})
+
+    def ship(self, ship: str) -> Optional[ShipSchema]:
+        return self.lookup(ship, self.SHIP)[1]
+
+    def nav(self, ship: str) -> Optional[ShipNav]:
+        return self.lookup(ship, self.NAV)[1]
+
+    def cargo(self, ship: str) -> Optional[ShipCargo]:
+        return self.lookup(ship, self.CARGO)[1]
+
+    def fuel(self, ship: str) -> Optional[ShipFuel]:
+        return self.lookup(ship, self.FUEL)[1]
+
+    def cooldown(self, ship: str) -> Optional[Cooldown]:
+        return self.lookup(ship, self.COOLDOWN)[1]
@@ -0,0 +1,285 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union, Iterable, List, Dict, NamedTuple, Callable
+
+from astrotraders.api.schemas import Market, MarketTransaction, TradeSymbol
+
+SymbolLike = Union[TradeSymbol, str]
+
+
+class PricePoint(NamedTuple):
+    waypoint: str
+    symbol: str
+    purchase_price: int
+    sell_price: int
+    supply: Optional[str]
+    trade_volume: Optional[int]
+    # unix time of the observation
+    timestamp: float
+
+
+def _symbol(symbol: SymbolLike) -> str:
+    return symbol.value if isinstance(symbol, TradeSymbol) else symbol
+
+
+class MarketStore:
+    """
+    Append-only history of market prices and transactions, backed by SQLite.
+
+    Fed from ``WaypointsResource.market`` responses and from purchase and sell results
+    when passed to the client. The latest price of every good at every market is also kept
+    in memory, indexed by trade symbol and by waypoint, so queries like
+    :meth:`cheapest` never touch the database. A market snapshot only adds history rows
+    for goods whose price, supply or volume changed, unchanged goods just get fresher.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = ":memory:",
+        clock: Callable[[], float] = time.time,
+    ):
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS prices ("
+                "timestamp REAL, waypoint TEXT, symbol TEXT, purchase_price INTEGER, "
+                "sell_price INTEGER, supply TEXT, trade_volume INTEGER)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS transactions ("
+                "timestamp REAL, waypoint TEXT, ship TEXT, symbol TEXT, type TEXT, "
+                "units INTEGER, price_per_unit INTEGER, total_price INTEGER, "
+                "UNIQUE (timestamp, waypoint, ship, symbol, type, units, total_price))"
+            )
+            for table in ("prices", "transactions"):
+                for column in ("symbol", "waypoint"):
+                    self._connection.execute(
+                        f"CREATE INDEX IF NOT EXISTS {table}_{column} "
+                        f"ON {table} ({column}, timestamp)"
+                    )
+            rows = self._connection.execute(
+                "SELECT waypoint, symbol, purchase_price, sell_price, supply, "
+                "trade_volume, MAX(timestamp) FROM prices GROUP BY waypoint, symbol"
+            ).fetchall()
+        self._by_symbol: Dict[str, Dict[str, PricePoint]] = {}
+        self._by_waypoint: Dict[str, Dict[str, PricePoint]] = {}
+        for row in rows:
+            self._set_latest(PricePoint(*row))
+
+    def _set_latest(self, point: PricePoint) -> None:
+        self._by_symbol.setdefault(point.symbol, {})[point.waypoint] = point
+        self._by_waypoint.setdefault(point.waypoint, {})[point.symbol] = point
+
+    def record_market(self, market: Market, timestamp: Optional[float] = None) -> int:
+        """
+        Store trade goods and transactions of a market response.
+        Returns number of new price rows.
+        """
+        if market.transactions:
+            self.record_transactions(market.transactions)
+        if not market.trade_goods:
+            return 0
+        timestamp = self._clock() if timestamp is None else timestamp
+        changed = []
+        with self._lock:
+            latest = self._by_waypoint.get(market.symbol, {})
+            for good in market.trade_goods:
+                point = PricePoint(
+                    market.symbol,
+                    good.symbol,
+                    good.purchase_price,
+                    good.sell_price,
+                    good.supply.value,
+                    good.trade_volume,
+                    timestamp,
+                )
+                previous = latest.get(good.symbol)
+                if previous is not None and previous.timestamp > timestamp:
+                    continue
+                if previous is None or previous[2:6] != point[2:6]:
+                    changed.append(point)
+                self._set_latest(point)
+            with self._connection:
+                self._connection.executemany(
+                    "INSERT INTO prices (waypoint, symbol, purchase_price, sell_price, "
+                    "supply, trade_volume, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    changed,
+                )
+        return len(changed)
+
+    def record_transactions(self, transactions: Iterable[MarketTransaction]) -> int:
+        """
+        Store transactions, e.g. ``SellCargoResult.transaction``.
+        Each one also updates the latest purchase or sell price of its good.
+        Already stored transactions are skipped. Returns number of new transactions.
+        """
+        rows = [
+            (
+                item.timestamp.timestamp(),
+                item.waypoint_symbol,
+                item.ship_symbol,
+                item.trade_symbol,
+                item.type.value,
+                item.units,
+                item.price_per_unit,
+                item.total_price,
+            )
+            for item in transactions
+        ]
+        with self._lock, self._connection:
+            before = self._connection.total_changes
+            self._connection.executemany(
+                "INSERT OR IGNORE INTO transactions VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            added = self._connection.total_changes - before
+            for timestamp, waypoint, _, symbol, kind, _, price, _ in rows:
+                previous = self._by_symbol.get(symbol, {}).get(waypoint)
+                if previous is None or previous.timestamp > timestamp:
+                    continue
+                if kind == "PURCHASE":
+                    self._set_latest(
+                        previous._replace(purchase_price=price, timestamp=timestamp)
+                    )
+                else:
+                    self._set_latest(
+                        previous._replace(sell_price=price, timestamp=timestamp)
+                    )
+        return added
+
+    def latest(
+        self,
+        symbol: Optional[SymbolLike] = None,
+        waypoint: Optional[str] = None,
+        max_age: Optional[float] = None,
+    ) -> List[PricePoint]:
+        """
+        Latest known prices, filtered by good and/or market
+        and optionally limited to the ones observed in the last ``max_age`` seconds.
+        """
+        with self._lock:
+            if symbol is not None:
+                points = list(self._by_symbol.get(_symbol(symbol), {}).values())
+                if waypoint is not None:
+                    points = [point for point in points if point.waypoint == waypoint]
+            elif waypoint is not None:
+                points = list(self._by_waypoint.get(waypoint, {}).values())
+            else:
+                points = [
+                    point
+                    for points in self._by_symbol.values()
+                    for point in points.values()
+                ]
+        if max_age is None:
+            return points
+        oldest = self._clock() - max_age
+        return [point for point in points if point.timestamp >= oldest]
+
+    def cheapest(
+        self, symbol: SymbolLike, max_age: Optional[float] = None
+    ) -> Optional[PricePoint]:
+        """
+        Market where a good is purchased for the lowest price,
+        among prices observed in the last ``max_age`` seconds.
+        """
+        points = self.latest(symbol, max_age=max_age)
+        if not points:
+            return None
+        return min(points, key=lambda point: point.purchase_price)
+
+    def best_sell(
+        self, symbol: SymbolLike, max_age: Optional[float] = None
+    ) -> Optional[PricePoint]:
+        """
+        Market which pays the most for a good,
+        among prices observed in the last ``max_age`` seconds.
+        """
+        points = self.latest(symbol, max_age=max_age)
+        if not points:
+            return None
+        return max(points, key=lambda point: point.sell_price)
+
+    def symbols(self) -> List[str]:
+        with self._lock:
+            return sorted(self._by_symbol)
+
+    def waypoints(self) -> List[str]:
+        with self._lock:
+            return sorted(self._by_waypoint)
+
+    def history(
+        self,
+        symbol: SymbolLike,
+        waypoint: Optional[str] = None,
+        since: Optional[float] = None,
+    ) -> List[PricePoint]:
+        """
+        Price changes of a good, oldest first.
+        """
+        query = (
+            "SELECT waypoint, symbol, purchase_price, sell_price, supply, "
+            "trade_volume, timestamp FROM prices WHERE symbol = ?"
+        )
+        args: List[Union[str, float]] = [_symbol(symbol)]
+        if waypoint is not None:
+            query += " AND waypoint = ?"
+            args.append(waypoint)
+        if since is not None:
+            query += " AND timestamp >= ?"
+            args.append(since)
+        with self._lock:
+            rows = self._connection.execute(
+                query + " ORDER BY timestamp, rowid", args
+            ).fetchall()
+        return [PricePoint(*row) for row in rows]
+
+    def transactions(
+        self,
+        symbol: Optional[SymbolLike] = None,
+        waypoint: Optional[str] = None,
+        since: Optional[float] = None,
+    ) -> List[MarketTransaction]:
+        """
+        Stored transactions, oldest first.
+        """
+        conditions = []
+        args: List[Union[str, float]] = []
+        if symbol is not None:
+            conditions.append("symbol = ?")
+            args.append(_symbol(symbol))
+        if waypoint is not None:
+            conditions.append("waypoint = ?")
+            args.append(waypoint)
+        if since is not None:
+            conditions.append("timestamp >= ?")
+            args.append(since)
+        query = "SELECT * FROM transactions"
+        if conditions:
+            query += " WHERE " + " AND ".join(conditions)
+        with self._lock:
+            rows = self._connection.execute(
+                query + " ORDER BY timestamp, rowid", args
+            ).fetchall()
+        return [
+            MarketTransaction.parse_obj(
+                {
+                    "timestamp": timestamp,
+                    "waypointSymbol": waypoint,
+                    "shipSymbol": ship,
+                    "tradeSymbol": symbol,
+                    "type": kind,
+                    "units": units,
+                    "pricePerUnit": price,
+                    "totalPrice": total,
+                }
+            )
+            for timestamp, waypoint, ship, symbol, kind, units, price, total in rows
+        ]
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -0,0 +1,304 @@
+import re
+from datetime import datetime, timedelta, timezone
+from enum import Enum
+from functools import lru_cache
+from typing import (
+    Optional,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+from pydantic import BaseModel, ConstrainedInt, ConstrainedStr
+from pydantic.fields import ModelField, SHAPE_LIST, SHAPE_SINGLETON
+
+from astrotraders.api.schemas import (
+    Cooldown,
+    ShipCargo,
+    ShipFuel,
+    ShipNav,
+    ShipNavRoute,
+)
+
+M = TypeVar("M", bound=BaseModel)
+
+Parser = Callable[[Mapping[str, Any]], Any]
+
+# small schemas parsed on nearly every fleet action
+FAST_MODELS: Tuple[Type[BaseModel], ...] = (
+    ShipNav,
+    Cooldown,
+    ShipCargo,
+    ShipFuel,
+    ShipNavRoute,
+)
+
+_ISO_DATETIME = re.compile(
+    r"(\d{4})-(\d\d)-(\d\d)T(\d\d):(\d\d):(\d\d)(?:\.(\d{1,6}))?(Z|[+-]\d\d:\d\d)"
+)
+
+
+class _Slow(ValueError):
+    """
+    Raised by generated code on anything but the usual JSON form of a field,
+    which is then left to pydantic.
+    """
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(value: str) -> datetime:
+    """
+    Parse ``2023-05-01T12:00:00.000Z`` and the like, the only datetime format the API uses.
+    Results are cached, as arrivals and cooldown expirations are read again and again.
+    """
+    match = _ISO_DATETIME.fullmatch(value)
+    if match is None:
+        raise _Slow(value)
+    year, month, day, hour, minute, second, fraction, offset = match.groups()
+    if offset == "Z":
+        tzinfo = timezone.utc
+    else:
+        minutes = int(offset[1:3]) * 60 + int(offset[4:6])
+        tzinfo = timezone(timedelta(minutes=-minutes if offset[0] == "-" else minutes))
+    return datetime(
+        int(year),
+        int(month),
+        int(day),
+        int(hour),
+        int(minute),
+        int(second),
+        int(fraction.ljust(6, "0")) if fraction else 0,
+        tzinfo,
+    )
+
+
+class _Generator:
+    """
+    Writes the source of ``_parse_<Model>`` functions for a model and the models nested
+    in it. Names the code refers to are collected in ``namespace``.
+    """
+
+    def __init__(self) -> None:
+        self.namespace: Dict[str, Any] = {
+            "_Slow": _Slow,
+            "_datetime": parse_datetime,
+            "_setattr": object.__setattr__,
+        }
+        self.functions: Dict[Type[BaseModel], str] = {}
+        self.sources: List[str] = []
+
+    def name(self, value: Any, prefix: str) -> str:
+        name = f"_{prefix}{len(self.namespace)}"
+        self.namespace[name] = value
+        return name
+
+    def function(self, model: Type[BaseModel]) -> str:
+        name = self.functions.get(model)
+        if name is not None:
+            return name
+        name = self.functions[model] = f"_parse_{model.__name__}"
+        cls = self.name(model, "model")
+        # fields_set has required fields from the start, a missing one fails anyway
+        required = [field.name for field in model.__fields__.values() if field.required]
+        lines = [
+            f"def {name}(data):",
+            (
+                f"    fields_set = {{{', '.join(map(repr, required))}}}"
+                if required
+                else "    fields_set = set()"
+            ),
+        ]
+        for index, field in enumerate(model.__fields__.values()):
+            lines += self.field(model, field, f"v{index}")
+        values = ", ".join(
+            f"{field.name!r}: v{index}"
+            for index, field in enumerate(model.__fields__.values())
+        )
+        lines += [
+            f"    instance = {cls}.__new__({cls})",
+            f'    _setattr(instance, "__dict__", {{{values}}})',
+            '    _setattr(instance, "__fields_set__", fields_set)',
+        ]
+        if model.__private_attributes__:
+            lines.append("    instance._init_private_attributes()")
+        lines.append("    return instance")
+        self.sources.append("\n".join(lines))
+        return name
+
+    def field(self, model: Type[BaseModel], field: ModelField, var: str) -> List[str]:
+        # the alias is looked up once here instead of on every parse
+        key = field.alias
+        if field.required:
+            lines = [f"    {var} = data[{key!r}]"]
+        else:
+            default = self.name(field, "field")
+            lines = [
+                f"    if {key!r} in data:",
+                f"        {var} = data[{key!r}]",
+                f"        fields_set.add({field.name!r})",
+                "    else:",
+                f"        {var} = {default}.get_default()",
+            ]
+        checks = self.checks(model, field, var)
+        if field.allow_none:
+            if not checks:
+                return lines
+            return lines + [f"    if {var} is not None:"] + _indent(checks)
+        if not field.required:
+            # defaults aren't checked, like by pydantic
+            return lines[:3] + _indent(checks) + lines[3:]
+        return lines + checks
+
+    def checks(self, model: Type[BaseModel], field: ModelField, var: str) -> List[str]:
+        if field.shape == SHAPE_SINGLETON:
+            item = self.item(field.type_, var)
+            if item is not None:
+                return item
+        elif field.shape == SHAPE_LIST:
+            item = self.item(field.type_, "item")
+            if item is None:
+                return self.fallback(model, field, var)
+            lines = [f"    if type({var}) is not list:", "        raise _Slow"]
+            if item:
+                lines += [
+                    "    items = []",
+                    f"    for item in {var}:",
+                    *_indent(item),
+                    "        items.append(item)",
+                    f"    {var} = items",
+                ]
+            return lines
+        return self.fallback(model, field, var)
+
+    def item(self, type_: Any, var: str) -> Optional[List[str]]:
+        """
+        Lines checking and converting one value of a type, None for types left to pydantic.
+        """
+        if not isinstance(type_, type):
+            return None
+        if issubclass(type_, BaseModel) and not type_.__custom_root_type__:
+            return [
+                f"    if type({var}) is not dict:",
+                "        raise _Slow",
+                f"    {var} = {self.function(type_)}({var})",
+            ]
+        if issubclass(type_, Enum):
+            # straight from the value to the member, without Enum.__call__
+            members = self.name(type_._value2member_map_, "members")
+            return [
+                f"    {var} = {members}.get({var})",
+                f"    if {var} is None:",
+                "        raise _Slow",
+            ]
+        if issubclass(type_, datetime):
+            return [
+                f"    if type({var}) is not str:",
+                "        raise _Slow",
+                f"    {var} = _datetime({var})",
+            ]
+        if type_ is bool:
+            return [f"    if type({var}) is not bool:", "        raise _Slow"]
+        if type_ is float:
+            return [
+                f"    if type({var}) is int:",
+                f"        {var} = float({var})",
+                f"    elif type({var}) is not float:",
+                "        raise _Slow",
+            ]
+        if type_ is int or (
+            issubclass(type_, ConstrainedInt) and type_.multiple_of is None
+        ):
+            conditions = [f"type({var}) is not int"]
+            for name, operator in (
+                ("gt", "<="),
+                ("ge", "<"),
+                ("lt", ">="),
+                ("le", ">"),
+            ):
+                bound = getattr(type_, name, None)
+                if bound is not None:
+                    conditions.append(f"{var} {operator} {bound!r}")
+            return [f"    if {' or '.join(conditions)}:", "        raise _Slow"]
+        if type_ is str or (
+            issubclass(type_, ConstrainedStr)
+            and not type_.strip_whitespace
+            and not type_.to_upper
+            and not type_.to_lower
+            and type_.regex is None
+        ):
+            conditions = [f"type({var}) is not str"]
+            for name, operator in (("min_length", "<"), ("max_length", ">")):
+                bound = getattr(type_, name, None)
+                if bound is not None:
+                    conditions.append(f"len({var}) {operator} {bound!r}")
+            return [f"    if {' or '.join(conditions)}:", "        raise _Slow"]
+        return None
+
+    def fallback(
+        self, model: Type[BaseModel], field: ModelField, var: str
+    ) -> List[str]:
+        # anything else is validated by the field itself
+        name = self.name(field, "field")
+        cls = self.name(model, "model")
+        return [
+            f"    {var}, errors = {name}.validate({var}, {{}}, loc={field.alias!r}, cls={cls})",
+            "    if errors:",
+            "        raise _Slow",
+        ]
+
+
+def _indent(lines: List[str], times: int = 1) -> List[str]:
+    return ["    " * times + line for line in lines]
+
+
+def source(model: Type[BaseModel]) -> str:
+    """
+    Source of the generated functions parsing a model, nested models first.
+    """
+    generator = _Generator()
+    generator.function(model)
+    return "\n\n".join(generator.sources)
+
+
+def generate(model: Type[M]) -> Callable[[Mapping[str, Any]], M]:
+    """
+    Generate a parser making a model from decoded JSON like ``model(**data)`` does.
+
+    Fields are read by their aliases, checked and converted by code written for them:
+    exact JSON types, constraints, enum members looked up by value, datetimes parsed
+    by :func:`parse_datetime`. Data which needs more, like coercion of numbers in strings,
+    and invalid data go to pydantic, so results and errors are the same as before.
+    """
+    generator = _Generator()
+    fast = generator.function(model)
+    code = "\n\n".join(generator.sources)
+    exec(compile(code, f"<parser {model.__name__}>", "exec"), generator.namespace)
+    parse_fast = generator.namespace[fast]
+
+    def parse(data: Mapping[str, Any]) -> M:
+        try:
+            return parse_fast(data)
+        except (KeyError, TypeError, ValueError):
+            return model(**data)
+
+    parse.__name__ = parse.__qualname__ = f"parse_{model.__name__}"
+    return parse
+
+
+_parsers: Dict[type, Optional[Parser]] = {}
+
+
+def parser(model: Type[M]) -> Optional[Callable[[Mapping[str, Any]], M]]:
+    """
+    Generated parser of a model from :data:`FAST_MODELS`, made on first use, or None.
+    """
+    try:
+        return _parsers[model]
+    except KeyError:
+        parse = _parsers[model] = generate(model) if model in FAST_MODELS else None
+        return parse
@@ -0,0 +1,119 @@
+import asyncio
+import threading
+import time
+from typing import Callable
+
+
+class RateLimiter:
+    """
+    Client-side token bucket that mirrors the SpaceTraders request budget:
+    a steady pool refilled at ``rate`` requests per second
+    and a burst pool of ``burst`` requests refilled over ``burst_period`` seconds.
+
+    Requests take a token from the steady pool first and from the burst pool
+    when the steady one is empty. When both are empty, the request reserves
+    the next steady token and waits for it. While requests are waiting, burst tokens
+    are left alone and new requests queue behind them, so callers are served in order.
+    """
+
+    def __init__(
+        self,
+        rate: float = 2.0,
+        burst: int = 30,
+        burst_period: float = 60.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 0 or burst_period <= 0:
+            raise ValueError("burst must be non-negative and burst_period positive")
+        self.rate = rate
+        self.burst = burst
+        self.burst_period = burst_period
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._capacity = max(1.0, rate)
+        self._tokens = self._capacity
+        self._burst_tokens = float(burst)
+        self._updated = clock()
+        self._requests = 0
+        self._delayed = 0
+        self._waited = 0.0
+
+    @property
+    def requests(self) -> int:
+        """
+        Number of requests that passed through the limiter.
+        """
+        return self._requests
+
+    @property
+    def delayed(self) -> int:
+        """
+        Number of requests that had to wait for a token.
+        """
+        return self._delayed
+
+    @property
+    def waited(self) -> float:
+        """
+        Total time in seconds that requests spent waiting for a token.
+        """
+        return self._waited
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        self._updated = now
+        self._tokens = min(self._capacity, self._tokens + elapsed * self.rate)
+        self._burst_tokens = min(
+            float(self.burst),
+            self._burst_tokens + elapsed * self.burst / self.burst_period,
+        )
+
+    def reserve(self) -> float:
+        """
+        Take a token and return how many seconds the caller must wait before sending.
+        """
+        with self._lock:
+            self._refill(self._clock())
+            self._requests += 1
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return 0.0
+            # negative steady tokens are owed to requests already waiting
+            if self._tokens >= 0 and self._burst_tokens >= 1:
+                self._burst_tokens -= 1
+                return 0.0
+            self._tokens -= 1
+            delay = -self._tokens / self.rate
+            self._delayed += 1
+            self._waited += delay
+            return delay
+
+    def delay(self) -> float:
+        """
+        Seconds until a request could be sent without waiting. Doesn't take a token.
+        """
+        with self._lock:
+            self._refill(self._clock())
+            if self._tokens >= 1 or (self._tokens >= 0 and self._burst_tokens >= 1):
+                return 0.0
+            return (1 - self._tokens) / self.rate
+
+    def acquire(self) -> float:
+        """
+        Block until a request may be sent. Returns the time spent waiting.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self) -> float:
+        """
+        Asyncio version of :meth:`acquire`, which doesn't block the event loop.
+        """
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
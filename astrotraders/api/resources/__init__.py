@@ -1,6 +1,39 @@
-from .agents import AgentsResource
-from .systems import SystemsResource
-from .contracts import ContractsResource
-from .factions import FactionsResource
-from .fleet import FleetResource
-from .server import ServerResource
+import importlib
+from typing import Any, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .agents import AgentsResource, AsyncAgentsResource
+    from .systems import SystemsResource, AsyncSystemsResource
+    from .contracts import ContractsResource, AsyncContractsResource
+    from .factions import FactionsResource, AsyncFactionsResource
+    from .fleet import FleetResource, AsyncFleetResource
+    from .server import ServerResource, AsyncServerResource
+
+# resources are imported on first access, see PEP 562
+_MODULES = {
+    "AgentsResource": "agents",
+    "AsyncAgentsResource": "agents",
+    "SystemsResource": "systems",
+    "AsyncSystemsResource": "systems",
+    "ContractsResource": "contracts",
+    "AsyncContractsResource": "contracts",
+    "FactionsResource": "factions",
+    "AsyncFactionsResource": "factions",
+    "FleetResource": "fleet",
+    "AsyncFleetResource": "fleet",
+    "ServerResource": "server",
+    "AsyncServerResource": "server",
+}
+
+__all__ = list(_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module = _MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(f".{module}", __name__), name)
+
+
+def __dir__() -> List[str]:
+    return sorted([*globals(), *__all__])
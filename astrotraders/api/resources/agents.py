@@ -1,10 +1,24 @@
-from astrotraders.api.resources.base import BaseResource
+from typing import Optional
+
+from astrotraders.api.resources.base import BaseResource, AsyncBaseResource
 from astrotraders.api.schemas import AgentSchema
 
 
 class AgentsResource(BaseResource):
-    def info(self) -> AgentSchema:
+    def info(self, validate: Optional[bool] = None) -> AgentSchema:
+        """
+        Fetch your agent's details.
+        """
+        return self._client.request_to_model(
+            "GET", "/my/agent", AgentSchema, validate=validate
+        )
+
+
+class AsyncAgentsResource(AsyncBaseResource):
+    async def info(self, validate: Optional[bool] = None) -> AgentSchema:
         """
         Fetch your agent's details.
         """
-        return self._client.request_to_model("GET", "/my/agent", AgentSchema)
+        return await self._client.request_to_model(
+            "GET", "/my/agent", AgentSchema, validate=validate
+        )
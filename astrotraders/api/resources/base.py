@@ -1,6 +1,11 @@
-from astrotraders.api.wrapper import HttpxClientWrapper
+from astrotraders.api.wrapper import HttpxClientWrapper, AsyncHttpxClientWrapper
 
 
 class BaseResource:
     def __init__(self, client: HttpxClientWrapper):
         self._client = client
+
+
+class AsyncBaseResource:
+    def __init__(self, client: AsyncHttpxClientWrapper):
+        self._client = client
@@ -1,4 +1,6 @@
-from astrotraders.api.resources.base import BaseResource
+from typing import Iterator, AsyncIterator, List, Optional
+
+from astrotraders.api.resources.base import BaseResource, AsyncBaseResource
 from astrotraders.api.schemas import (
     PaginatedObject,
     ContractSchema,
@@ -9,7 +11,9 @@ from astrotraders.api.schemas import (
 
 
 class ContractsResource(BaseResource):
-    def list(self, limit: int = 20, page: int = 1) -> PaginatedObject[ContractSchema]:
+    def list(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> PaginatedObject[ContractSchema]:
         """
         List all of your contracts.
         """
@@ -17,15 +21,36 @@ class ContractsResource(BaseResource):
             "GET",
             "/my/contracts",
             ContractSchema,
+            validate=validate,
             params={"limit": limit, "page": page},
         )
 
-    def get(self, contract_id: str) -> ContractSchema:
+    def iter_contracts(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> Iterator[ContractSchema]:
+        """
+        Iterate over all of your contracts, requesting pages lazily.
+        """
+        return self._client.iter_paginated(
+            "/my/contracts", ContractSchema, limit, page, validate=validate
+        )
+
+    def all_contracts(
+        self, limit: int = 20, concurrency: int = 4, validate: Optional[bool] = None
+    ) -> List[ContractSchema]:
+        """
+        Fetch all of your contracts, requesting up to ``concurrency`` pages at once.
+        """
+        return self._client.all_paginated(
+            "/my/contracts", ContractSchema, limit, concurrency, validate=validate
+        )
+
+    def get(self, contract_id: str, validate: Optional[bool] = None) -> ContractSchema:
         """
         Get the details of a contract by ID.
         """
         return self._client.request_to_model(
-            "GET", f"/my/contracts/{contract_id}", ContractSchema
+            "GET", f"/my/contracts/{contract_id}", ContractSchema, validate=validate
         )
 
     def accept(self, contract_id: str) -> AcceptContractResult:
@@ -42,12 +67,15 @@ class ContractsResource(BaseResource):
         """
         Deliver cargo on a given contract.
         """
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
             "POST",
             f"/my/contracts/{contract_id}/deliver",
             DeliverContractResult,
             json={"shipSymbol": ship, "tradeSymbol": trade, "units": units},
         )
+        if self._client.fleet_state is not None:
+            self._client.fleet_state.update(ship, result)
+        return result
 
     def fulfill(self, contract_id: str) -> FullfillContractResult:
         """
@@ -56,3 +84,81 @@ class ContractsResource(BaseResource):
         return self._client.request_to_model(
             "POST", f"/my/contracts/{contract_id}/fulfill", FullfillContractResult
         )
+
+
+class AsyncContractsResource(AsyncBaseResource):
+    async def list(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> PaginatedObject[ContractSchema]:
+        """
+        List all of your contracts.
+        """
+        return await self._client.request_to_paginated(
+            "GET",
+            "/my/contracts",
+            ContractSchema,
+            validate=validate,
+            params={"limit": limit, "page": page},
+        )
+
+    def iter_contracts(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> AsyncIterator[ContractSchema]:
+        """
+        Iterate over all of your contracts, requesting pages lazily.
+        """
+        return self._client.iter_paginated(
+            "/my/contracts", ContractSchema, limit, page, validate=validate
+        )
+
+    async def all_contracts(
+        self, limit: int = 20, concurrency: int = 4, validate: Optional[bool] = None
+    ) -> List[ContractSchema]:
+        """
+        Fetch all of your contracts, requesting up to ``concurrency`` pages at once.
+        """
+        return await self._client.all_paginated(
+            "/my/contracts", ContractSchema, limit, concurrency, validate=validate
+        )
+
+    async def get(
+        self, contract_id: str, validate: Optional[bool] = None
+    ) -> ContractSchema:
+        """
+        Get the details of a contract by ID.
+        """
+        return await self._client.request_to_model(
+            "GET", f"/my/contracts/{contract_id}", ContractSchema, validate=validate
+        )
+
+    async def accept(self, contract_id: str) -> AcceptContractResult:
+        """
+        Accept a contract.
+        """
+        return await self._client.request_to_model(
+            "POST", f"/my/contracts/{contract_id}/accept", AcceptContractResult
+        )
+
+    async def deliver(
+        self, contract_id: str, ship: str, trade: str, units: int
+    ) -> DeliverContractResult:
+        """
+        Deliver cargo on a given contract.
+        """
+        result = await self._client.request_to_model(
+            "POST",
+            f"/my/contracts/{contract_id}/deliver",
+            DeliverContractResult,
+            json={"shipSymbol": ship, "tradeSymbol": trade, "units": units},
+        )
+        if self._client.fleet_state is not None:
+            self._client.fleet_state.update(ship, result)
+        return result
+
+    async def fulfill(self, contract_id: str) -> FullfillContractResult:
+        """
+        Fulfill a contract.
+        """
+        return await self._client.request_to_model(
+            "POST", f"/my/contracts/{contract_id}/fulfill", FullfillContractResult
+        )
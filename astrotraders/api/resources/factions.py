@@ -1,9 +1,14 @@
-from astrotraders.api.resources.base import BaseResource
+from typing import Iterator, AsyncIterator, List, Optional
+
+from astrotraders.api.resources.base import BaseResource, AsyncBaseResource
 from astrotraders.api.schemas import PaginatedObject, Faction
+from astrotraders.api.universe import UniverseCache
 
 
 class FactionsResource(BaseResource):
-    def list(self, limit: int = 20, page: int = 1) -> PaginatedObject[Faction]:
+    def list(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> PaginatedObject[Faction]:
         """
         List all discovered factions in the game.
         """
@@ -11,11 +16,78 @@ class FactionsResource(BaseResource):
             "GET",
             "/factions",
             Faction,
+            validate=validate,
             params={"limit": limit, "page": page},
         )
 
-    def get(self, faction: str) -> Faction:
+    def iter_factions(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> Iterator[Faction]:
+        """
+        Iterate over all discovered factions, requesting pages lazily.
+        """
+        return self._client.iter_paginated(
+            "/factions", Faction, limit, page, validate=validate
+        )
+
+    def all_factions(
+        self, limit: int = 20, concurrency: int = 4, validate: Optional[bool] = None
+    ) -> List[Faction]:
+        """
+        Fetch all discovered factions, requesting up to ``concurrency`` pages at once.
+        """
+        return self._client.all_paginated(
+            "/factions", Faction, limit, concurrency, validate=validate
+        )
+
+    def get(self, faction: str, validate: Optional[bool] = None) -> Faction:
         """
         View the details of a faction.
         """
-        return self._client.request_to_model("GET", f"/factions/{faction}", Faction)
+        return self._client.request_cached(
+            UniverseCache.FACTIONS, faction, f"/factions/{faction}", Faction, validate
+        )
+
+
+class AsyncFactionsResource(AsyncBaseResource):
+    async def list(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> PaginatedObject[Faction]:
+        """
+        List all discovered factions in the game.
+        """
+        return await self._client.request_to_paginated(
+            "GET",
+            "/factions",
+            Faction,
+            validate=validate,
+            params={"limit": limit, "page": page},
+        )
+
+    def iter_factions(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> AsyncIterator[Faction]:
+        """
+        Iterate over all discovered factions, requesting pages lazily.
+        """
+        return self._client.iter_paginated(
+            "/factions", Faction, limit, page, validate=validate
+        )
+
+    async def all_factions(
+        self, limit: int = 20, concurrency: int = 4, validate: Optional[bool] = None
+    ) -> List[Faction]:
+        """
+        Fetch all discovered factions, requesting up to ``concurrency`` pages at once.
+        """
+        return await self._client.all_paginated(
+            "/factions", Faction, limit, concurrency, validate=validate
+        )
+
+    async def get(self, faction: str, validate: Optional[bool] = None) -> Faction:
+        """
+        View the details of a faction.
+        """
+        return await self._client.request_cached(
+            UniverseCache.FACTIONS, faction, f"/factions/{faction}", Faction, validate
+        )
@@ -1,6 +1,7 @@
-from typing import Optional, cast, Any
+from typing import Optional, cast, Any, Iterator, AsyncIterator, List, Tuple, TypeVar
 
-from astrotraders.api.resources.base import BaseResource
+from astrotraders.api.fleet_state import FleetState
+from astrotraders.api.resources.base import BaseResource, AsyncBaseResource
 from astrotraders.api.schemas import (
     PaginatedObject,
     ShipSchema,
@@ -18,6 +19,7 @@ from astrotraders.api.schemas import (
     ShipJumpResult,
     ShipNavigateResult,
     ShipNavFlightMode,
+    ShipNavStatus,
     SellCargoResult,
     ScanSystemsResult,
     ScanWaypointsResult,
@@ -26,19 +28,67 @@ from astrotraders.api.schemas import (
     PurchaseCargoResult,
     TradeSymbol,
 )
-from astrotraders.api.wrapper import HttpxClientWrapper
+from astrotraders.api.wrapper import (
+    BaseHttpxClientWrapper,
+    HttpxClientWrapper,
+    AsyncHttpxClientWrapper,
+)
+
+V = TypeVar("V")
+
+
+def _remember(client: BaseHttpxClientWrapper, ship: str, value: V) -> V:
+    """
+    Update the fleet state, if enabled, with ship state carried by a response.
+    """
+    if client.fleet_state is not None:
+        client.fleet_state.update(ship, value)
+    return value
+
+
+def _known(
+    client: BaseHttpxClientWrapper, ship: str, part: str, refresh: bool
+) -> Tuple[bool, Any]:
+    """
+    Ship state part from the fleet state, unless it is disabled or a refresh is asked.
+    """
+    if client.fleet_state is None or refresh:
+        return False, None
+    return client.fleet_state.lookup(ship, part)
+
+
+def _unchanged(
+    client: BaseHttpxClientWrapper,
+    ship: str,
+    action: str,
+    status: Optional[ShipNavStatus] = None,
+    mode: Optional[ShipNavFlightMode] = None,
+) -> Optional[ShipNav]:
+    """
+    Known nav if the fleet state skips redundant actions and this one would change nothing.
+    """
+    if client.fleet_state is None:
+        return None
+    return client.fleet_state.unchanged(ship, action, status, mode)
 
 
 class CargoResource(BaseResource):
-    def get(self, ship: str) -> ShipCargo:
+    def get(
+        self, ship: str, refresh: bool = False, validate: Optional[bool] = None
+    ) -> ShipCargo:
         """
         Retrieve the cargo of your ship.
         """
-        return self._client.request_to_model(
+        known, cargo = _known(self._client, ship, FleetState.CARGO, refresh)
+        if known:
+            return cargo
+        cargo = self._client.request_to_model(
             "GET",
             f"/my/ships/{ship}/cargo",
             ShipCargo,
+            validate=validate,
         )
+        return _remember(self._client, ship, cargo)
 
     def jettison(self, ship: str, cargo: str, units: int) -> ShipCargo:
         """
@@ -52,29 +102,37 @@ class CargoResource(BaseResource):
                 json={"symbol": cargo, "units": units},
             ),
         )
-        return ShipCargo(**result["data"]["cargo"])
+        return _remember(
+            self._client, ship, self._client.build(ShipCargo, result["data"]["cargo"])
+        )
 
     def sell(self, ship: str, cargo: str, units: int) -> SellCargoResult:
         """
         Sell cargo.
         """
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
             "POST",
             f"/my/ships/{ship}/sell",
             SellCargoResult,
             json={"symbol": cargo, "units": units},
         )
+        if self._client.market_store is not None:
+            self._client.market_store.record_transactions([result.transaction])
+        return _remember(self._client, ship, result)
 
     def purchase(self, ship: str, cargo: str, units: int) -> PurchaseCargoResult:
         """
         Purchase cargo.
         """
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
             "POST",
             f"/my/ships/{ship}/purchase",
             PurchaseCargoResult,
             json={"symbol": cargo, "units": units},
         )
+        if self._client.market_store is not None:
+            self._client.market_store.record_transactions([result.transaction])
+        return _remember(self._client, ship, result)
 
     def transfer(
         self, from_ship: str, to_ship: str, cargo: TradeSymbol, units: int
@@ -90,7 +148,14 @@ class CargoResource(BaseResource):
                 json={"tradeSymbol": cargo, "units": units, "shipSymbol": to_ship},
             ),
         )
-        return ShipCargo(**result["data"]["cargo"])
+        if self._client.fleet_state is not None:
+            # cargo of the receiving ship isn't in the response
+            self._client.fleet_state.forget(to_ship, FleetState.CARGO)
+        return _remember(
+            self._client,
+            from_ship,
+            self._client.build(ShipCargo, result["data"]["cargo"]),
+        )
 
 
 class ScanResource(BaseResource):
@@ -98,31 +163,34 @@ class ScanResource(BaseResource):
         """
         Activate your ship's sensor arrays to scan for system information.
         """
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
             "POST",
             f"/my/ships/{ship}/scan/systems",
             ScanSystemsResult,
         )
+        return _remember(self._client, ship, result)
 
     def waypoints(self, ship: str) -> ScanWaypointsResult:
         """
         Activate your ship's sensor arrays to scan for waypoint information.
         """
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
             "POST",
             f"/my/ships/{ship}/scan/waypoints",
             ScanWaypointsResult,
         )
+        return _remember(self._client, ship, result)
 
     def ships(self, ship: str) -> ScanShipsResult:
         """
         Activate your ship's sensor arrays to scan for ship information.
         """
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
             "POST",
             f"/my/ships/{ship}/scan/ships",
             ScanShipsResult,
         )
+        return _remember(self._client, ship, result)
 
 
 class FleetResource(BaseResource):
@@ -131,33 +199,74 @@ class FleetResource(BaseResource):
         self.scan = ScanResource(client)
         self.cargo = CargoResource(client)
 
-    def list(self, limit: int = 20, page: int = 1) -> PaginatedObject[ShipSchema]:
+    def list(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> PaginatedObject[ShipSchema]:
         """
         Retrieve all of your ships.
         """
-        return self._client.request_to_paginated(
+        result = self._client.request_to_paginated(
             "GET",
             "/my/ships",
             ShipSchema,
+            validate=validate,
             params={"limit": limit, "page": page},
         )
+        for ship in result.objects:
+            _remember(self._client, ship.symbol, ship)
+        return result
 
-    def get(self, name: str) -> ShipSchema:
+    def iter_ships(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> Iterator[ShipSchema]:
         """
-        Retrieve the details of your ship.
+        Iterate over all of your ships, requesting pages lazily.
         """
-        return self._client.request_to_model("GET", f"/my/ships/{name}", ShipSchema)
+        ships = self._client.iter_paginated(
+            "/my/ships", ShipSchema, limit, page, validate=validate
+        )
+        for ship in ships:
+            yield _remember(self._client, ship.symbol, ship)
+
+    def all_ships(
+        self, limit: int = 20, concurrency: int = 4, validate: Optional[bool] = None
+    ) -> List[ShipSchema]:
+        """
+        Fetch all of your ships, requesting up to ``concurrency`` pages at once.
+        """
+        ships = self._client.all_paginated(
+            "/my/ships", ShipSchema, limit, concurrency, validate=validate
+        )
+        return [_remember(self._client, ship.symbol, ship) for ship in ships]
+
+    def get(
+        self, name: str, refresh: bool = False, validate: Optional[bool] = None
+    ) -> ShipSchema:
+        """
+        Retrieve the details of your ship.
+        With the fleet state enabled, a known ship is returned without a request
+        unless ``refresh`` is set.
+        """
+        known, ship = _known(self._client, name, FleetState.SHIP, refresh)
+        if known:
+            return ship
+        ship = self._client.request_to_model(
+            "GET", f"/my/ships/{name}", ShipSchema, validate=validate
+        )
+        return _remember(self._client, name, ship)
 
     def purchase(self, ship_type: ShipType, waypoint: str) -> PurchaseShipResult:
         """
         Purchase a ship
         """
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
             "POST",
             f"/my/ships",
             PurchaseShipResult,
             json={"shipType": ship_type, "waypointSymbol": waypoint},
         )
+        _remember(self._client, result.ship.symbol, result.ship)
+        return result
 
     def orbit(self, ship: str) -> ShipNav:
         """
@@ -165,15 +274,22 @@ class FleetResource(BaseResource):
 
         The request will only succeed if your ship is capable of moving into orbit at the time of the request.
         The endpoint is idempotent - successive calls will succeed even if the ship is already in orbit.
+        A fleet state with ``skip_redundant`` answers such calls without a request.
         """
+        nav = _unchanged(self._client, ship, "orbit", ShipNavStatus.in_orbit)
+        if nav is not None:
+            return nav
         result = cast(
             dict[str, Any],
             self._client.raw_request(
                 "POST",
                 f"/my/ships/{ship}/orbit",
+                idempotent=True,
             ),
         )
-        return ShipNav(**result["data"]["nav"])
+        return _remember(
+            self._client, ship, self._client.build(ShipNav, result["data"]["nav"])
+        )
 
     def refine(self, ship: str, produce: Produce) -> ShipRefineResult:
         """
@@ -181,12 +297,13 @@ class FleetResource(BaseResource):
 
         The request will only succeed if your ship is capable of refining at the time of the request.
         """
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
             "POST",
             f"/my/ships/{ship}/refine",
             ShipRefineResult,
             json={"produce": produce},
         )
+        return _remember(self._client, ship, result)
 
     def chart(self, ship: str) -> ChartShipResult:
         """
@@ -202,7 +319,7 @@ class FleetResource(BaseResource):
             ChartShipResult,
         )
 
-    def cooldown(self, ship: str) -> Optional[Cooldown]:
+    def cooldown(self, ship: str, refresh: bool = False) -> Optional[Cooldown]:
         """
         Retrieve the details of your ship's reactor cooldown.
         Some actions such as activating your jump drive, scanning,
@@ -213,11 +330,17 @@ class FleetResource(BaseResource):
         of the related modules or mounts for the action taken.
         None returns when the ship has no cooldown.
         """
-        return self._client.request_to_model_optioned(
+        known, cooldown = _known(self._client, ship, FleetState.COOLDOWN, refresh)
+        if known:
+            return cooldown
+        cooldown = self._client.request_to_model_optioned(
             "GET",
             f"/my/ships/{ship}/cooldown",
             Cooldown,
         )
+        if self._client.fleet_state is not None:
+            self._client.fleet_state.set(ship, FleetState.COOLDOWN, cooldown)
+        return cooldown
 
     def dock(self, ship: str) -> ShipNav:
         """
@@ -226,15 +349,22 @@ class FleetResource(BaseResource):
         Docking will only succeed if the waypoint is a dockable location,
         and your ship is capable of docking at the time of the request.
         The endpoint is idempotent - successive calls will succeed even if the ship is already docked.
+        A fleet state with ``skip_redundant`` answers such calls without a request.
         """
+        nav = _unchanged(self._client, ship, "dock", ShipNavStatus.docked)
+        if nav is not None:
+            return nav
         result = cast(
             dict[str, Any],
             self._client.raw_request(
                 "POST",
                 f"/my/ships/{ship}/dock",
+                idempotent=True,
             ),
         )
-        return ShipNav(**result["data"]["nav"])
+        return _remember(
+            self._client, ship, self._client.build(ShipNav, result["data"]["nav"])
+        )
 
     def survey(self, ship: str) -> CreateSurveyResult:
         """
@@ -248,11 +378,12 @@ class FleetResource(BaseResource):
         Surveys will eventually expire after a period of time.
         Multiple ships can use the same survey for extraction.
         """
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
             "POST",
             f"/my/ships/{ship}/survey",
             CreateSurveyResult,
         )
+        return _remember(self._client, ship, result)
 
     def extract(
         self, ship: str, survey: Optional[Survey] = None
@@ -261,24 +392,26 @@ class FleetResource(BaseResource):
         Extract resources from the waypoint into your ship.
         Send an optional survey as the payload to target specific yields.
         """
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
             "POST",
             f"/my/ships/{ship}/extract",
             ExtractResourcesResult,
             json={"survey": survey.dict()} if survey else {},
         )
+        return _remember(self._client, ship, result)
 
     def jump(self, ship: str, system: str) -> ShipJumpResult:
         """
         Jump your ship instantly to a target system.
         Unlike other forms of navigation, jumping requires a unit of antimatter.
         """
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
             "POST",
             f"/my/ships/{ship}/jump",
             ShipJumpResult,
             json={"systemSymbol": system},
         )
+        return _remember(self._client, ship, result)
 
     def navigate(self, ship: str, waypoint: str) -> ShipNavigateResult:
         """
@@ -292,30 +425,43 @@ class FleetResource(BaseResource):
         To travel between systems, see the ship's warp or jump actions.
         """
 
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
             "POST",
             f"/my/ships/{ship}/navigate",
             ShipNavigateResult,
             json={"waypointSymbol": waypoint},
         )
+        return _remember(self._client, ship, result)
 
     def flight_mode(self, ship: str, mode: ShipNavFlightMode) -> ShipNav:
         """
         Update the nav data of a ship, such as the flight mode.
         """
-        return self._client.request_to_model(
-            "PATCH", f"/my/ships/{ship}/nav", ShipNav, json={"flightMode": mode}
+        known = _unchanged(self._client, ship, "flight_mode", mode=mode)
+        if known is not None:
+            return known
+        nav = self._client.request_to_model(
+            "PATCH",
+            f"/my/ships/{ship}/nav",
+            ShipNav,
+            idempotent=True,
+            json={"flightMode": mode},
         )
+        return _remember(self._client, ship, nav)
 
-    def nav(self, ship: str) -> ShipNav:
+    def nav(self, ship: str, refresh: bool = False) -> ShipNav:
         """
         Get the current nav status of a ship.
         """
-        return self._client.request_to_model(
+        known, nav = _known(self._client, ship, FleetState.NAV, refresh)
+        if known:
+            return nav
+        nav = self._client.request_to_model(
             "GET",
             f"/my/ships/{ship}/nav",
             ShipNav,
         )
+        return _remember(self._client, ship, nav)
 
     def warp(self, ship: str, waypoint: str) -> ShipNavigateResult:
         """
@@ -326,19 +472,441 @@ class FleetResource(BaseResource):
         The returned response will detail the route information including the expected time of arrival.
         Most ship actions are unavailable until the ship has arrived at it's destination.
         """
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
             "POST",
             f"/my/ships/{ship}/warp",
             ShipNavigateResult,
             json={"waypointSymbol": waypoint},
         )
+        return _remember(self._client, ship, result)
 
     def refuel(self, ship: str) -> RefuelShipResult:
         """
         Refuel your ship from the local market.
         """
-        return self._client.request_to_model(
+        result = self._client.request_to_model(
+            "POST",
+            f"/my/ships/{ship}/refuel",
+            RefuelShipResult,
+        )
+        return _remember(self._client, ship, result)
+
+
+class AsyncCargoResource(AsyncBaseResource):
+    async def get(
+        self, ship: str, refresh: bool = False, validate: Optional[bool] = None
+    ) -> ShipCargo:
+        """
+        Retrieve the cargo of your ship.
+        """
+        known, cargo = _known(self._client, ship, FleetState.CARGO, refresh)
+        if known:
+            return cargo
+        cargo = await self._client.request_to_model(
+            "GET",
+            f"/my/ships/{ship}/cargo",
+            ShipCargo,
+            validate=validate,
+        )
+        return _remember(self._client, ship, cargo)
+
+    async def jettison(self, ship: str, cargo: str, units: int) -> ShipCargo:
+        """
+        Jettison cargo from your ship's cargo hold.
+        """
+        result = cast(
+            dict[str, Any],
+            await self._client.raw_request(
+                "POST",
+                f"/my/ships/{ship}/jettison",
+                json={"symbol": cargo, "units": units},
+            ),
+        )
+        return _remember(
+            self._client, ship, self._client.build(ShipCargo, result["data"]["cargo"])
+        )
+
+    async def sell(self, ship: str, cargo: str, units: int) -> SellCargoResult:
+        """
+        Sell cargo.
+        """
+        result = await self._client.request_to_model(
+            "POST",
+            f"/my/ships/{ship}/sell",
+            SellCargoResult,
+            json={"symbol": cargo, "units": units},
+        )
+        if self._client.market_store is not None:
+            self._client.market_store.record_transactions([result.transaction])
+        return _remember(self._client, ship, result)
+
+    async def purchase(self, ship: str, cargo: str, units: int) -> PurchaseCargoResult:
+        """
+        Purchase cargo.
+        """
+        result = await self._client.request_to_model(
+            "POST",
+            f"/my/ships/{ship}/purchase",
+            PurchaseCargoResult,
+            json={"symbol": cargo, "units": units},
+        )
+        if self._client.market_store is not None:
+            self._client.market_store.record_transactions([result.transaction])
+        return _remember(self._client, ship, result)
+
+    async def transfer(
+        self, from_ship: str, to_ship: str, cargo: TradeSymbol, units: int
+    ) -> ShipCargo:
+        """
+        Transfer cargo between ships.
+        """
+        result = cast(
+            dict[str, Any],
+            await self._client.raw_request(
+                "POST",
+                f"/my/ships/{from_ship}/transfer",
+                json={"tradeSymbol": cargo, "units": units, "shipSymbol": to_ship},
+            ),
+        )
+        if self._client.fleet_state is not None:
+            # cargo of the receiving ship isn't in the response
+            self._client.fleet_state.forget(to_ship, FleetState.CARGO)
+        return _remember(
+            self._client,
+            from_ship,
+            self._client.build(ShipCargo, result["data"]["cargo"]),
+        )
+
+
+class AsyncScanResource(AsyncBaseResource):
+    async def systems(self, ship: str) -> ScanSystemsResult:
+        """
+        Activate your ship's sensor arrays to scan for system information.
+        """
+        result = await self._client.request_to_model(
+            "POST",
+            f"/my/ships/{ship}/scan/systems",
+            ScanSystemsResult,
+        )
+        return _remember(self._client, ship, result)
+
+    async def waypoints(self, ship: str) -> ScanWaypointsResult:
+        """
+        Activate your ship's sensor arrays to scan for waypoint information.
+        """
+        result = await self._client.request_to_model(
+            "POST",
+            f"/my/ships/{ship}/scan/waypoints",
+            ScanWaypointsResult,
+        )
+        return _remember(self._client, ship, result)
+
+    async def ships(self, ship: str) -> ScanShipsResult:
+        """
+        Activate your ship's sensor arrays to scan for ship information.
+        """
+        result = await self._client.request_to_model(
+            "POST",
+            f"/my/ships/{ship}/scan/ships",
+            ScanShipsResult,
+        )
+        return _remember(self._client, ship, result)
+
+
+class AsyncFleetResource(AsyncBaseResource):
+    def __init__(self, client: AsyncHttpxClientWrapper):
+        super().__init__(client)
+        self.scan = AsyncScanResource(client)
+        self.cargo = AsyncCargoResource(client)
+
+    async def list(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> PaginatedObject[ShipSchema]:
+        """
+        Retrieve all of your ships.
+        """
+        result = await self._client.request_to_paginated(
+            "GET",
+            "/my/ships",
+            ShipSchema,
+            validate=validate,
+            params={"limit": limit, "page": page},
+        )
+        for ship in result.objects:
+            _remember(self._client, ship.symbol, ship)
+        return result
+
+    async def iter_ships(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> AsyncIterator[ShipSchema]:
+        """
+        Iterate over all of your ships, requesting pages lazily.
+        """
+        ships = self._client.iter_paginated(
+            "/my/ships", ShipSchema, limit, page, validate=validate
+        )
+        async for ship in ships:
+            yield _remember(self._client, ship.symbol, ship)
+
+    async def all_ships(
+        self, limit: int = 20, concurrency: int = 4, validate: Optional[bool] = None
+    ) -> List[ShipSchema]:
+        """
+        Fetch all of your ships, requesting up to ``concurrency`` pages at once.
+        """
+        ships = await self._client.all_paginated(
+            "/my/ships", ShipSchema, limit, concurrency, validate=validate
+        )
+        return [_remember(self._client, ship.symbol, ship) for ship in ships]
+
+    async def get(
+        self, name: str, refresh: bool = False, validate: Optional[bool] = None
+    ) -> ShipSchema:
+        """
+        Retrieve the details of your ship.
+        With the fleet state enabled, a known ship is returned without a request
+        unless ``refresh`` is set.
+        """
+        known, ship = _known(self._client, name, FleetState.SHIP, refresh)
+        if known:
+            return ship
+        ship = await self._client.request_to_model(
+            "GET", f"/my/ships/{name}", ShipSchema, validate=validate
+        )
+        return _remember(self._client, name, ship)
+
+    async def purchase(self, ship_type: ShipType, waypoint: str) -> PurchaseShipResult:
+        """
+        Purchase a ship
+        """
+        result = await self._client.request_to_model(
+            "POST",
+            f"/my/ships",
+            PurchaseShipResult,
+            json={"shipType": ship_type, "waypointSymbol": waypoint},
+        )
+        _remember(self._client, result.ship.symbol, result.ship)
+        return result
+
+    async def orbit(self, ship: str) -> ShipNav:
+        """
+        Attempt to move your ship into orbit at it's current location.
+
+        The request will only succeed if your ship is capable of moving into orbit at the time of the request.
+        The endpoint is idempotent - successive calls will succeed even if the ship is already in orbit.
+        A fleet state with ``skip_redundant`` answers such calls without a request.
+        """
+        nav = _unchanged(self._client, ship, "orbit", ShipNavStatus.in_orbit)
+        if nav is not None:
+            return nav
+        result = cast(
+            dict[str, Any],
+            await self._client.raw_request(
+                "POST",
+                f"/my/ships/{ship}/orbit",
+                idempotent=True,
+            ),
+        )
+        return _remember(
+            self._client, ship, self._client.build(ShipNav, result["data"]["nav"])
+        )
+
+    async def refine(self, ship: str, produce: Produce) -> ShipRefineResult:
+        """
+        Attempt to refine the raw materials on your ship.
+
+        The request will only succeed if your ship is capable of refining at the time of the request.
+        """
+        result = await self._client.request_to_model(
+            "POST",
+            f"/my/ships/{ship}/refine",
+            ShipRefineResult,
+            json={"produce": produce},
+        )
+        return _remember(self._client, ship, result)
+
+    async def chart(self, ship: str) -> ChartShipResult:
+        """
+        Command a ship to chart the current waypoint.
+
+        Waypoints in the universe are uncharted by default.
+        These locations will not show up in the API until they have been charted by a ship.
+        Charting a location will record your agent as the one who created the chart.
+        """
+        return await self._client.request_to_model(
+            "POST",
+            f"/my/ships/{ship}/chart",
+            ChartShipResult,
+        )
+
+    async def cooldown(self, ship: str, refresh: bool = False) -> Optional[Cooldown]:
+        """
+        Retrieve the details of your ship's reactor cooldown.
+        Some actions such as activating your jump drive, scanning,
+        or extracting resources taxes your reactor and results in a cooldown.
+
+        Your ship cannot perform additional actions until your cooldown has expired.
+        The duration of your cooldown is relative to the power consumption
+        of the related modules or mounts for the action taken.
+        None returns when the ship has no cooldown.
+        """
+        known, cooldown = _known(self._client, ship, FleetState.COOLDOWN, refresh)
+        if known:
+            return cooldown
+        cooldown = await self._client.request_to_model_optioned(
+            "GET",
+            f"/my/ships/{ship}/cooldown",
+            Cooldown,
+        )
+        if self._client.fleet_state is not None:
+            self._client.fleet_state.set(ship, FleetState.COOLDOWN, cooldown)
+        return cooldown
+
+    async def dock(self, ship: str) -> ShipNav:
+        """
+        Attempt to dock your ship at it's current location.
+
+        Docking will only succeed if the waypoint is a dockable location,
+        and your ship is capable of docking at the time of the request.
+        The endpoint is idempotent - successive calls will succeed even if the ship is already docked.
+        A fleet state with ``skip_redundant`` answers such calls without a request.
+        """
+        nav = _unchanged(self._client, ship, "dock", ShipNavStatus.docked)
+        if nav is not None:
+            return nav
+        result = cast(
+            dict[str, Any],
+            await self._client.raw_request(
+                "POST",
+                f"/my/ships/{ship}/dock",
+                idempotent=True,
+            ),
+        )
+        return _remember(
+            self._client, ship, self._client.build(ShipNav, result["data"]["nav"])
+        )
+
+    async def survey(self, ship: str) -> CreateSurveyResult:
+        """
+        If you want to target specific yields for an extraction,
+        you can survey a waypoint, such as an asteroid field,
+        and send the survey in the body of the extract request.
+        Each survey may have multiple deposits, and if a symbol
+        shows up more than once, that indicates a higher chance of extracting that resource.
+
+        Your ship will enter a cooldown between consecutive survey requests.
+        Surveys will eventually expire after a period of time.
+        Multiple ships can use the same survey for extraction.
+        """
+        result = await self._client.request_to_model(
+            "POST",
+            f"/my/ships/{ship}/survey",
+            CreateSurveyResult,
+        )
+        return _remember(self._client, ship, result)
+
+    async def extract(
+        self, ship: str, survey: Optional[Survey] = None
+    ) -> ExtractResourcesResult:
+        """
+        Extract resources from the waypoint into your ship.
+        Send an optional survey as the payload to target specific yields.
+        """
+        result = await self._client.request_to_model(
+            "POST",
+            f"/my/ships/{ship}/extract",
+            ExtractResourcesResult,
+            json={"survey": survey.dict()} if survey else {},
+        )
+        return _remember(self._client, ship, result)
+
+    async def jump(self, ship: str, system: str) -> ShipJumpResult:
+        """
+        Jump your ship instantly to a target system.
+        Unlike other forms of navigation, jumping requires a unit of antimatter.
+        """
+        result = await self._client.request_to_model(
+            "POST",
+            f"/my/ships/{ship}/jump",
+            ShipJumpResult,
+            json={"systemSymbol": system},
+        )
+        return _remember(self._client, ship, result)
+
+    async def navigate(self, ship: str, waypoint: str) -> ShipNavigateResult:
+        """
+        Navigate to a target destination.
+
+        The destination must be located within the same system as the ship.
+        Navigating will consume the necessary fuel and supplies from the ship's manifest,
+        and will pay out crew wages from the agent's account.
+        The returned response will detail the route information including the expected time of arrival.
+        Most ship actions are unavailable until the ship has arrived at it's destination.
+        To travel between systems, see the ship's warp or jump actions.
+        """
+
+        result = await self._client.request_to_model(
+            "POST",
+            f"/my/ships/{ship}/navigate",
+            ShipNavigateResult,
+            json={"waypointSymbol": waypoint},
+        )
+        return _remember(self._client, ship, result)
+
+    async def flight_mode(self, ship: str, mode: ShipNavFlightMode) -> ShipNav:
+        """
+        Update the nav data of a ship, such as the flight mode.
+        """
+        known = _unchanged(self._client, ship, "flight_mode", mode=mode)
+        if known is not None:
+            return known
+        nav = await self._client.request_to_model(
+            "PATCH",
+            f"/my/ships/{ship}/nav",
+            ShipNav,
+            idempotent=True,
+            json={"flightMode": mode},
+        )
+        return _remember(self._client, ship, nav)
+
+    async def nav(self, ship: str, refresh: bool = False) -> ShipNav:
+        """
+        Get the current nav status of a ship.
+        """
+        known, nav = _known(self._client, ship, FleetState.NAV, refresh)
+        if known:
+            return nav
+        nav = await self._client.request_to_model(
+            "GET",
+            f"/my/ships/{ship}/nav",
+            ShipNav,
+        )
+        return _remember(self._client, ship, nav)
+
+    async def warp(self, ship: str, waypoint: str) -> ShipNavigateResult:
+        """
+        Warp your ship to a target destination in another system.
+        Warping will consume the necessary fuel and supplies
+        from the ship's manifest, and will pay out crew wages from the agent's account.
+
+        The returned response will detail the route information including the expected time of arrival.
+        Most ship actions are unavailable until the ship has arrived at it's destination.
+        """
+        result = await self._client.request_to_model(
+            "POST",
+            f"/my/ships/{ship}/warp",
+            ShipNavigateResult,
+            json={"waypointSymbol": waypoint},
+        )
+        return _remember(self._client, ship, result)
+
+    async def refuel(self, ship: str) -> RefuelShipResult:
+        """
+        Refuel your ship from the local market.
+        """
+        result = await self._client.request_to_model(
             "POST",
             f"/my/ships/{ship}/refuel",
             RefuelShipResult,
         )
+        return _remember(self._client, ship, result)
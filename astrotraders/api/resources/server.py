@@ -1,13 +1,22 @@
-from typing import cast, Any
+from typing import cast, Any, Optional
 
-from astrotraders.api.resources.base import BaseResource
+from astrotraders.api.resources.base import BaseResource, AsyncBaseResource
 from astrotraders.api.schemas import ServerStatsResponse
 
 
 class ServerResource(BaseResource):
-    def stats(self) -> ServerStatsResponse:
+    def stats(self, validate: Optional[bool] = None) -> ServerStatsResponse:
         """
         Return server API stats and leaderboards
         """
         response = cast(dict[str, Any], self._client.raw_request("GET", "/"))
-        return ServerStatsResponse(**response)
+        return self._client.build(ServerStatsResponse, response, validate)
+
+
+class AsyncServerResource(AsyncBaseResource):
+    async def stats(self, validate: Optional[bool] = None) -> ServerStatsResponse:
+        """
+        Return server API stats and leaderboards
+        """
+        response = cast(dict[str, Any], await self._client.raw_request("GET", "/"))
+        return self._client.build(ServerStatsResponse, response, validate)
@@ -1,6 +1,6 @@
-from typing import List, cast
+from typing import List, Optional, cast, Iterator, AsyncIterator
 
-from astrotraders.api.resources.base import BaseResource
+from astrotraders.api.resources.base import BaseResource, AsyncBaseResource
 from astrotraders.api.schemas import (
     PaginatedObject,
     System,
@@ -9,7 +9,20 @@ from astrotraders.api.schemas import (
     Shipyard,
     JumpGate,
 )
-from astrotraders.api.wrapper import HttpxClientWrapper
+from astrotraders.api.universe import UniverseCache
+from astrotraders.api.wrapper import HttpxClientWrapper, AsyncHttpxClientWrapper
+
+_STORE_BATCH_SIZE = 1000
+
+
+def _store_systems(
+    cache: UniverseCache, systems: List[dict], complete: bool = True
+) -> None:
+    cache.put_many(
+        UniverseCache.SYSTEMS, ((system["symbol"], system) for system in systems)
+    )
+    if complete:
+        cache.mark_complete(UniverseCache.SYSTEMS)
 
 
 class SystemsResource(BaseResource):
@@ -17,7 +30,9 @@ class SystemsResource(BaseResource):
         super().__init__(client)
         self.waypoints = WaypointsResource(client)
 
-    def list(self, limit: int = 20, page: int = 1) -> PaginatedObject[System]:
+    def list(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> PaginatedObject[System]:
         """
         Return a list of all systems.
         """
@@ -25,26 +40,85 @@ class SystemsResource(BaseResource):
             "GET",
             "/systems",
             System,
+            validate=validate,
             params={"limit": limit, "page": page},
         )
 
-    def get(self, name: str) -> System:
+    def iter_systems(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> Iterator[System]:
+        """
+        Iterate over all systems, requesting pages lazily.
+        """
+        return self._client.iter_paginated(
+            "/systems", System, limit, page, validate=validate
+        )
+
+    def all_systems(
+        self, limit: int = 20, concurrency: int = 4, validate: Optional[bool] = None
+    ) -> List[System]:
+        """
+        Fetch all systems, requesting up to ``concurrency`` pages at once.
+        """
+        return self._client.all_paginated(
+            "/systems", System, limit, concurrency, validate=validate
+        )
+
+    def get(self, name: str, validate: Optional[bool] = None) -> System:
         """
         Get the details of a system.
         """
-        return self._client.request_to_model("GET", f"/systems/{name}", System)
+        return self._client.request_cached(
+            UniverseCache.SYSTEMS, name, f"/systems/{name}", System, validate
+        )
 
-    def all(self) -> List[System]:
+    def all(self, validate: Optional[bool] = None) -> List[System]:
         """
         Get all systems with waypoints from undocumented endpoint
         """
+        validate = self._client.validating(validate)
+        cache = self._client.universe_cache
+        if cache is not None and cache.is_complete(UniverseCache.SYSTEMS):
+            return [
+                self._client.build(System, system, validate)
+                for _, system in cache.items(UniverseCache.SYSTEMS)
+            ]
         systems = cast(list[dict], self._client.raw_request("GET", "/systems.json"))
-        return [System(**system) for system in systems]
+        if cache is not None:
+            _store_systems(cache, systems)
+        return [self._client.build(System, system, validate) for system in systems]
+
+    def stream_all(self, validate: Optional[bool] = None) -> Iterator[System]:
+        """
+        Get all systems with waypoints from undocumented endpoint,
+        yielding each system as soon as it is downloaded and parsed.
+        Unlike :meth:`all`, memory usage doesn't grow with the size of the universe.
+        """
+        validate = self._client.validating(validate)
+        cache = self._client.universe_cache
+        if cache is not None and cache.is_complete(UniverseCache.SYSTEMS):
+            for _, system in cache.items(UniverseCache.SYSTEMS):
+                yield self._client.build(System, system, validate)
+            return
+        batch = []
+        for system in self._client.stream_array("GET", "/systems.json"):
+            if cache is not None:
+                batch.append(system)
+                if len(batch) >= _STORE_BATCH_SIZE:
+                    _store_systems(cache, batch, complete=False)
+                    batch = []
+            yield self._client.build(System, system, validate)
+        if cache is not None:
+            _store_systems(cache, batch)
 
 
 class WaypointsResource(BaseResource):
     def list(
-        self, system: str, limit: int = 20, page: int = 1
+        self,
+        system: str,
+        limit: int = 20,
+        page: int = 1,
+        validate: Optional[bool] = None,
     ) -> PaginatedObject[Waypoint]:
         """
         Fetch all waypoints for a given system.
@@ -54,35 +128,86 @@ class WaypointsResource(BaseResource):
             "GET",
             f"/systems/{system}/waypoints",
             Waypoint,
+            validate=validate,
             params={"limit": limit, "page": page, "systemSymbol": system},
         )
 
-    def get(self, system: str, waypoint: str) -> Waypoint:
+    def iter_waypoints(
+        self,
+        system: str,
+        limit: int = 20,
+        page: int = 1,
+        validate: Optional[bool] = None,
+    ) -> Iterator[Waypoint]:
+        """
+        Iterate over all waypoints of a given system, requesting pages lazily.
+        """
+        return self._client.iter_paginated(
+            f"/systems/{system}/waypoints",
+            Waypoint,
+            limit,
+            page,
+            params={"systemSymbol": system},
+            validate=validate,
+        )
+
+    def all_waypoints(
+        self,
+        system: str,
+        limit: int = 20,
+        concurrency: int = 4,
+        validate: Optional[bool] = None,
+    ) -> List[Waypoint]:
+        """
+        Fetch all waypoints of a given system, requesting up to ``concurrency`` pages at once.
+        """
+        return self._client.all_paginated(
+            f"/systems/{system}/waypoints",
+            Waypoint,
+            limit,
+            concurrency,
+            params={"systemSymbol": system},
+            validate=validate,
+        )
+
+    def get(
+        self, system: str, waypoint: str, validate: Optional[bool] = None
+    ) -> Waypoint:
         """
         View the details of a waypoint.
         """
-        return self._client.request_to_model(
-            "GET",
+        return self._client.request_cached(
+            UniverseCache.WAYPOINTS,
+            waypoint,
             f"/systems/{system}/waypoints/{waypoint}",
             Waypoint,
+            validate=validate,
             params={"waypointSymbol": waypoint, "systemSymbol": system},
         )
 
-    def market(self, system: str, waypoint: str) -> Market:
+    def market(
+        self, system: str, waypoint: str, validate: Optional[bool] = None
+    ) -> Market:
         """
         Retrieve imports, exports and exchange data from a marketplace.
         Imports can be sold, exports can be purchased,
         and exchange goods can be purchased or sold.
         Send a ship to the waypoint to access trade good prices and recent transactions.
         """
+        # markets served from the response cache were already recorded when fetched
+        store = self._client.market_store
         return self._client.request_to_model(
             "GET",
             f"/systems/{system}/waypoints/{waypoint}/market",
             Market,
+            validate=validate,
             params={"waypointSymbol": waypoint, "systemSymbol": system},
+            on_fetch=store.record_market if store is not None else None,
         )
 
-    def shipyard(self, system: str, waypoint: str) -> Shipyard:
+    def shipyard(
+        self, system: str, waypoint: str, validate: Optional[bool] = None
+    ) -> Shipyard:
         """
         Get the shipyard for a waypoint.
         Send a ship to the waypoint to access ships that are currently available for purchase and recent transactions.
@@ -91,16 +216,236 @@ class WaypointsResource(BaseResource):
             "GET",
             f"/systems/{system}/waypoints/{waypoint}/shipyard",
             Shipyard,
+            validate=validate,
             params={"waypointSymbol": waypoint, "systemSymbol": system},
         )
 
-    def jump_gate(self, system: str, waypoint: str) -> JumpGate:
+    def jump_gate(
+        self, system: str, waypoint: str, validate: Optional[bool] = None
+    ) -> JumpGate:
         """
         Get jump gate details for a waypoint.
         """
-        return self._client.request_to_model(
+        return self._client.request_cached(
+            UniverseCache.JUMP_GATES,
+            waypoint,
+            f"/systems/{system}/waypoints/{waypoint}/jump-gate",
+            JumpGate,
+            validate=validate,
+            params={"waypointSymbol": waypoint, "systemSymbol": system},
+        )
+
+
+class AsyncSystemsResource(AsyncBaseResource):
+    def __init__(self, client: AsyncHttpxClientWrapper):
+        super().__init__(client)
+        self.waypoints = AsyncWaypointsResource(client)
+
+    async def list(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> PaginatedObject[System]:
+        """
+        Return a list of all systems.
+        """
+        return await self._client.request_to_paginated(
             "GET",
+            "/systems",
+            System,
+            validate=validate,
+            params={"limit": limit, "page": page},
+        )
+
+    def iter_systems(
+        self, limit: int = 20, page: int = 1, validate: Optional[bool] = None
+    ) -> AsyncIterator[System]:
+        """
+        Iterate over all systems, requesting pages lazily.
+        """
+        return self._client.iter_paginated(
+            "/systems", System, limit, page, validate=validate
+        )
+
+    async def all_systems(
+        self, limit: int = 20, concurrency: int = 4, validate: Optional[bool] = None
+    ) -> List[System]:
+        """
+        Fetch all systems, requesting up to ``concurrency`` pages at once.
+        """
+        return await self._client.all_paginated(
+            "/systems", System, limit, concurrency, validate=validate
+        )
+
+    async def get(self, name: str, validate: Optional[bool] = None) -> System:
+        """
+        Get the details of a system.
+        """
+        return await self._client.request_cached(
+            UniverseCache.SYSTEMS, name, f"/systems/{name}", System, validate
+        )
+
+    async def all(self, validate: Optional[bool] = None) -> List[System]:
+        """
+        Get all systems with waypoints from undocumented endpoint
+        """
+        validate = self._client.validating(validate)
+        cache = self._client.universe_cache
+        if cache is not None and cache.is_complete(UniverseCache.SYSTEMS):
+            return [
+                self._client.build(System, system, validate)
+                for _, system in cache.items(UniverseCache.SYSTEMS)
+            ]
+        systems = cast(
+            list[dict], await self._client.raw_request("GET", "/systems.json")
+        )
+        if cache is not None:
+            _store_systems(cache, systems)
+        return [self._client.build(System, system, validate) for system in systems]
+
+    async def stream_all(
+        self, validate: Optional[bool] = None
+    ) -> AsyncIterator[System]:
+        """
+        Get all systems with waypoints from undocumented endpoint,
+        yielding each system as soon as it is downloaded and parsed.
+        Unlike :meth:`all`, memory usage doesn't grow with the size of the universe.
+        """
+        validate = self._client.validating(validate)
+        cache = self._client.universe_cache
+        if cache is not None and cache.is_complete(UniverseCache.SYSTEMS):
+            for _, system in cache.items(UniverseCache.SYSTEMS):
+                yield self._client.build(System, system, validate)
+            return
+        batch = []
+        async for system in self._client.stream_array("GET", "/systems.json"):
+            if cache is not None:
+                batch.append(system)
+                if len(batch) >= _STORE_BATCH_SIZE:
+                    _store_systems(cache, batch, complete=False)
+                    batch = []
+            yield self._client.build(System, system, validate)
+        if cache is not None:
+            _store_systems(cache, batch)
+
+
+class AsyncWaypointsResource(AsyncBaseResource):
+    async def list(
+        self,
+        system: str,
+        limit: int = 20,
+        page: int = 1,
+        validate: Optional[bool] = None,
+    ) -> PaginatedObject[Waypoint]:
+        """
+        Fetch all waypoints for a given system.
+        System must be charted or a ship must be present to return waypoint details.
+        """
+        return await self._client.request_to_paginated(
+            "GET",
+            f"/systems/{system}/waypoints",
+            Waypoint,
+            validate=validate,
+            params={"limit": limit, "page": page, "systemSymbol": system},
+        )
+
+    def iter_waypoints(
+        self,
+        system: str,
+        limit: int = 20,
+        page: int = 1,
+        validate: Optional[bool] = None,
+    ) -> AsyncIterator[Waypoint]:
+        """
+        Iterate over all waypoints of a given system, requesting pages lazily.
+        """
+        return self._client.iter_paginated(
+            f"/systems/{system}/waypoints",
+            Waypoint,
+            limit,
+            page,
+            params={"systemSymbol": system},
+            validate=validate,
+        )
+
+    async def all_waypoints(
+        self,
+        system: str,
+        limit: int = 20,
+        concurrency: int = 4,
+        validate: Optional[bool] = None,
+    ) -> List[Waypoint]:
+        """
+        Fetch all waypoints of a given system, requesting up to ``concurrency`` pages at once.
+        """
+        return await self._client.all_paginated(
+            f"/systems/{system}/waypoints",
+            Waypoint,
+            limit,
+            concurrency,
+            params={"systemSymbol": system},
+            validate=validate,
+        )
+
+    async def get(
+        self, system: str, waypoint: str, validate: Optional[bool] = None
+    ) -> Waypoint:
+        """
+        View the details of a waypoint.
+        """
+        return await self._client.request_cached(
+            UniverseCache.WAYPOINTS,
+            waypoint,
+            f"/systems/{system}/waypoints/{waypoint}",
+            Waypoint,
+            validate=validate,
+            params={"waypointSymbol": waypoint, "systemSymbol": system},
+        )
+
+    async def market(
+        self, system: str, waypoint: str, validate: Optional[bool] = None
+    ) -> Market:
+        """
+        Retrieve imports, exports and exchange data from a marketplace.
+        Imports can be sold, exports can be purchased,
+        and exchange goods can be purchased or sold.
+        Send a ship to the waypoint to access trade good prices and recent transactions.
+        """
+        # markets served from the response cache were already recorded when fetched
+        store = self._client.market_store
+        return await self._client.request_to_model(
+            "GET",
+            f"/systems/{system}/waypoints/{waypoint}/market",
+            Market,
+            validate=validate,
+            params={"waypointSymbol": waypoint, "systemSymbol": system},
+            on_fetch=store.record_market if store is not None else None,
+        )
+
+    async def shipyard(
+        self, system: str, waypoint: str, validate: Optional[bool] = None
+    ) -> Shipyard:
+        """
+        Get the shipyard for a waypoint.
+        Send a ship to the waypoint to access ships that are currently available for purchase and recent transactions.
+        """
+        return await self._client.request_to_model(
+            "GET",
+            f"/systems/{system}/waypoints/{waypoint}/shipyard",
+            Shipyard,
+            validate=validate,
+            params={"waypointSymbol": waypoint, "systemSymbol": system},
+        )
+
+    async def jump_gate(
+        self, system: str, waypoint: str, validate: Optional[bool] = None
+    ) -> JumpGate:
+        """
+        Get jump gate details for a waypoint.
+        """
+        return await self._client.request_cached(
+            UniverseCache.JUMP_GATES,
+            waypoint,
             f"/systems/{system}/waypoints/{waypoint}/jump-gate",
             JumpGate,
+            validate=validate,
             params={"waypointSymbol": waypoint, "systemSymbol": system},
         )
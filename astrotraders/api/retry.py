@@ -0,0 +1,86 @@
+import random
+from datetime import datetime, timezone
+from typing import Optional, Any, Callable, Collection
+
+import orjson
+from httpx import Response
+
+# methods which can be repeated without additional side effects
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+
+class RetryPolicy:
+    """
+    Decides whether a failed request should be sent again and how long to wait before it.
+
+    429 responses are always retried, because the server rejects them before doing anything,
+    and the wait honours the retry-after information from headers or the error body.
+    ``retry_statuses`` (502, 503 and 504 by default) are retried with jittered
+    exponential backoff, but only for idempotent requests: the server may have already
+    applied a POST before failing, so repeating it could duplicate the action.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 3,
+        backoff: float = 0.5,
+        max_backoff: float = 30.0,
+        retry_statuses: Collection[int] = (502, 503, 504),
+        random_func: Callable[[], float] = random.random,
+    ):
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.retry_statuses = frozenset(retry_statuses)
+        self._random = random_func
+
+    def delay(
+        self, response: Response, attempt: int, idempotent: bool = False
+    ) -> Optional[float]:
+        """
+        Return seconds to wait before the next attempt, or None if the response should be kept.
+        ``attempt`` is the number of retries already made for this request.
+        """
+        if attempt >= self.max_retries:
+            return None
+        if response.status_code == 429:
+            retry_after = self.retry_after(response)
+            if retry_after is not None:
+                return retry_after + self._random() * self.backoff
+            return self.backoff_delay(attempt)
+        if response.status_code in self.retry_statuses and (
+            idempotent or response.request.method in IDEMPOTENT_METHODS
+        ):
+            return self.backoff_delay(attempt)
+        return None
+
+    def backoff_delay(self, attempt: int) -> float:
+        """
+        Exponential backoff with full jitter.
+        """
+        return self._random() * min(self.max_backoff, self.backoff * 2**attempt)
+
+    @staticmethod
+    def retry_after(response: Response) -> Optional[float]:
+        """
+        Seconds until the rate limit resets, taken from the ``Retry-After`` header,
+        the ``retryAfter`` field of the error body or the ``x-ratelimit-reset`` header.
+        """
+        if header := response.headers.get("retry-after"):
+            try:
+                return max(0.0, float(header))
+            except ValueError:
+                pass
+        try:
+            body: Any = orjson.loads(response.content)
+            retry_after = body["error"]["data"]["retryAfter"]
+            return max(0.0, float(retry_after))
+        except (orjson.JSONDecodeError, LookupError, TypeError, ValueError):
+            pass
+        if reset := response.headers.get("x-ratelimit-reset"):
+            try:
+                reset_at = datetime.fromisoformat(reset.replace("Z", "+00:00"))
+            except ValueError:
+                return None
+            return max(0.0, (reset_at - datetime.now(timezone.utc)).total_seconds())
+        return None
@@ -0,0 +1,182 @@
+from typing import (
+    Optional,
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Mapping,
+    Tuple,
+    Type,
+)
+
+from pydantic import BaseModel, ConstrainedFloat, ConstrainedInt, ConstrainedStr
+from pydantic.fields import ModelField, SHAPE_LIST, SHAPE_SINGLETON
+from typing_extensions import Annotated
+
+from astrotraders.api.schemas import (
+    Cooldown,
+    Market,
+    PaginatedObject,
+    ShipNav,
+    ShipSchema,
+    System,
+    Waypoint,
+)
+
+try:
+    import msgspec
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "struct backend requires msgspec, install it with `pip install astrotraders[fast]`"
+    ) from e
+
+# schemas which are decoded the most: ships, their nav and cooldowns, markets and the universe
+HOT_MODELS: Tuple[Type[BaseModel], ...] = (
+    ShipSchema,
+    ShipNav,
+    Cooldown,
+    Market,
+    System,
+    Waypoint,
+)
+
+Decode = Callable[[bytes], msgspec.Struct]
+
+_structs: Dict[Type[BaseModel], Type[msgspec.Struct]] = {}
+_envelopes: Dict[Type[BaseModel], Type[msgspec.Struct]] = {}
+
+
+def struct_type(model: Type[BaseModel]) -> Type[msgspec.Struct]:
+    """
+    msgspec struct class mirroring a model: same field names, JSON keys and types,
+    with nested models turned into structs as well and constraints kept as ``Meta``.
+    Custom root models, like ``ShipCondition``, become their root type.
+
+    Structs are not models: ``isinstance(struct, ShipSchema)`` is false and pydantic
+    doesn't accept them as fields of other models. The model a struct class mirrors
+    is kept in its ``__model__`` attribute, see :func:`astrotraders.api.utils.model_type`.
+    """
+    cls = _structs.get(model)
+    if cls is None:
+        fields: List[Tuple[str, Any, Any]] = []
+        rename: Dict[str, str] = {}
+        for name, field in model.__fields__.items():
+            if field.required:
+                default: Any = msgspec.NODEFAULT
+            elif field.default is None:
+                default = None
+            else:
+                default = msgspec.field(default_factory=field.get_default)
+            fields.append((name, _annotation(field), default))
+            if field.alias != name:
+                rename[name] = field.alias
+        cls = msgspec.defstruct(
+            model.__name__,
+            fields,
+            kw_only=True,
+            rename=rename,
+            module=__name__,
+            namespace={"__model__": model},
+        )
+        _structs[model] = cls
+    return cls
+
+
+def _annotation(field: ModelField) -> Any:
+    annotation = _type(field.type_)
+    if field.shape == SHAPE_LIST:
+        annotation = List[annotation]  # type: ignore[valid-type]
+    elif field.shape != SHAPE_SINGLETON:
+        raise TypeError(f"field {field.name!r} has a shape structs don't support")
+    if field.allow_none:
+        annotation = Optional[annotation]
+    return annotation
+
+
+def _type(type_: Any) -> Any:
+    if not isinstance(type_, type):
+        return type_
+    if issubclass(type_, BaseModel):
+        if type_.__custom_root_type__:
+            return _annotation(type_.__fields__["__root__"])
+        return struct_type(type_)
+    for constrained, base, names in (
+        (ConstrainedInt, int, ("gt", "ge", "lt", "le")),
+        (ConstrainedFloat, float, ("gt", "ge", "lt", "le")),
+        (ConstrainedStr, str, ("min_length", "max_length")),
+    ):
+        if issubclass(type_, constrained):
+            constraints = {
+                name: getattr(type_, name)
+                for name in names
+                if getattr(type_, name) is not None
+            }
+            if not constraints:
+                return base
+            return Annotated[base, msgspec.Meta(**constraints)]
+    # enums, datetimes and plain types are understood by msgspec as they are
+    return type_
+
+
+def _envelope(model: Type[BaseModel]) -> Type[msgspec.Struct]:
+    cls = _envelopes.get(model)
+    if cls is None:
+        cls = _envelopes[model] = msgspec.defstruct(
+            f"{model.__name__}Response", [("data", struct_type(model))], module=__name__
+        )
+    return cls
+
+
+class StructBackend:
+    """
+    Decodes responses of the hot schemas into msgspec structs instead of pydantic models,
+    straight from the response body, which is several times faster than decoding JSON
+    and validating it by pydantic.
+
+    Resource methods return structs in place of these models. Structs have the same
+    attributes, nested structs, enums and datetimes, so reading them is the same,
+    but they are not instances of the models and have none of the model methods:
+    use ``msgspec.structs.asdict`` or ``msgspec.to_builtins`` instead of ``dict()``.
+    Types and constraints are always checked, ``validate`` and ``lazy`` client settings
+    only apply to the other schemas.
+    """
+
+    def __init__(self, models: Iterable[Type[BaseModel]] = HOT_MODELS):
+        self.models: FrozenSet[Type[BaseModel]] = frozenset(models)
+        self._supported: Dict[type, bool] = {}
+        self._decoders: Dict[Tuple[type, bool], Decode] = {}
+
+    def supports(self, to_type: type) -> bool:
+        """
+        Whether a model, or a page of models, is decoded into structs.
+        """
+        supported = self._supported.get(to_type)
+        if supported is None:
+            supported = to_type in self.models
+            if not supported and issubclass(to_type, PaginatedObject):
+                supported = to_type.__fields__["objects"].type_ in self.models
+            self._supported[to_type] = supported
+        return supported
+
+    def convert(
+        self, to_type: Type[BaseModel], data: Mapping[str, Any]
+    ) -> msgspec.Struct:
+        """
+        Make a struct from already decoded data.
+        """
+        return msgspec.convert(data, struct_type(to_type))
+
+    def decoder(self, to_type: Type[BaseModel], envelope: bool = True) -> Decode:
+        """
+        Function decoding a response body into a struct, wrapped in ``{"data": ...}``
+        unless ``envelope`` is false, as pages are. Decoders are made once per type.
+        """
+        decode = self._decoders.get((to_type, envelope))
+        if decode is None:
+            type_ = _envelope(to_type) if envelope else struct_type(to_type)
+            decode = self._decoders[to_type, envelope] = msgspec.json.Decoder(
+                type_
+            ).decode
+        return decode
@@ -0,0 +1,152 @@
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Union, Iterable, Iterator, Tuple, Any
+
+import orjson
+
+
+class UniverseCache:
+    """
+    Persistent SQLite cache for universe data which rarely changes:
+    systems, waypoints, jump gates and factions.
+
+    Entries are raw API objects keyed by kind and symbol. The cache is read-through:
+    resources look here first and store whatever they had to fetch.
+    Call :meth:`set_version` with something that changes on universe reset
+    (for example server reset date) to drop stale data automatically.
+    """
+
+    SYSTEMS = "systems"
+    WAYPOINTS = "waypoints"
+    JUMP_GATES = "jump_gates"
+    FACTIONS = "factions"
+
+    # bump when the stored layout changes, so old files are rebuilt
+    SCHEMA_VERSION = "1"
+
+    def __init__(self, path: Union[str, Path] = ":memory:"):
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False)
+        with self._lock, self._connection:
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT)"
+            )
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "kind TEXT, symbol TEXT, data BLOB, updated REAL, "
+                "PRIMARY KEY (kind, symbol))"
+            )
+        if self._get_meta("schema") != self.SCHEMA_VERSION:
+            self.reset()
+            self._set_meta("schema", self.SCHEMA_VERSION)
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: Optional[str]) -> None:
+        with self._lock, self._connection:
+            if value is None:
+                self._connection.execute("DELETE FROM meta WHERE key = ?", (key,))
+            else:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)",
+                    (key, value),
+                )
+
+    @property
+    def version(self) -> Optional[str]:
+        return self._get_meta("version")
+
+    def set_version(self, version: str) -> bool:
+        """
+        Remember universe version. If it differs from the stored one, the cache is reset.
+        Returns True when the cache was reset.
+        """
+        stored = self.version
+        if stored == version:
+            return False
+        if stored is not None:
+            self.reset()
+        self._set_meta("version", version)
+        return stored is not None
+
+    def get(self, kind: str, symbol: str) -> Optional[Any]:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT data FROM entries WHERE kind = ? AND symbol = ?",
+                (kind, symbol),
+            ).fetchone()
+        return orjson.loads(row[0]) if row else None
+
+    def put(self, kind: str, symbol: str, data: Any) -> None:
+        self.put_many(kind, [(symbol, data)])
+
+    def put_many(self, kind: str, items: Iterable[Tuple[str, Any]]) -> None:
+        now = time.time()
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO entries (kind, symbol, data, updated) "
+                "VALUES (?, ?, ?, ?)",
+                ((kind, symbol, orjson.dumps(data), now) for symbol, data in items),
+            )
+
+    def items(self, kind: str) -> Iterator[Tuple[str, Any]]:
+        """
+        All cached entries of a kind in symbol order.
+        """
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT symbol, data FROM entries WHERE kind = ? ORDER BY symbol",
+                (kind,),
+            ).fetchall()
+        for symbol, data in rows:
+            yield symbol, orjson.loads(data)
+
+    def count(self, kind: str) -> int:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT COUNT(*) FROM entries WHERE kind = ?", (kind,)
+            ).fetchone()
+        return int(row[0])
+
+    def is_complete(self, kind: str) -> bool:
+        """
+        Whether the cache holds every entry of a kind, e.g. after full universe download.
+        """
+        return self._get_meta(f"complete:{kind}") is not None
+
+    def mark_complete(self, kind: str, complete: bool = True) -> None:
+        self._set_meta(f"complete:{kind}", "1" if complete else None)
+
+    def invalidate(self, kind: str, symbol: Optional[str] = None) -> None:
+        """
+        Drop one entry or every entry of a kind.
+        """
+        with self._lock, self._connection:
+            if symbol is None:
+                self._connection.execute("DELETE FROM entries WHERE kind = ?", (kind,))
+            else:
+                self._connection.execute(
+                    "DELETE FROM entries WHERE kind = ? AND symbol = ?", (kind, symbol)
+                )
+            self._connection.execute(
+                "DELETE FROM meta WHERE key = ?", (f"complete:{kind}",)
+            )
+
+    def reset(self) -> None:
+        """
+        Drop all cached entries, e.g. after universe reset.
+        """
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries")
+            self._connection.execute("DELETE FROM meta WHERE key LIKE 'complete:%'")
+
+    def close(self) -> None:
+        with self._lock:
+            self._connection.close()
@@ -1,19 +1,129 @@
+from __future__ import annotations
+
+import re
+import sys
 from json import JSONDecoder
-from typing import TypeVar, Any, Type, Union, Callable, Optional
+from typing import TypeVar, Any, Type, Union, Callable, Optional, List, TYPE_CHECKING
 
 import orjson
 
-from astrotraders.api.schemas import PaginatedObject
+if TYPE_CHECKING:
+    from astrotraders.api.schemas import PaginatedObject
 
 T = TypeVar("T")
 
 
 def to_schema(obj: dict, schema: Type[T]) -> Union[T, PaginatedObject[T]]:
+    from astrotraders.api.schemas import PaginatedObject
+
     if issubclass(schema, PaginatedObject):
         return schema(**obj)
     return schema(**obj["data"])
 
 
+def is_struct(value: Any) -> bool:
+    """
+    Whether a value is a msgspec struct, like the ones made by the struct backend.
+    """
+    # msgspec is optional, and there are no structs until it is imported
+    msgspec = sys.modules.get("msgspec")
+    return msgspec is not None and isinstance(value, msgspec.Struct)
+
+
+def model_type(value: Any) -> type:
+    """
+    Class of a model, or the model mirrored by a struct from the struct backend.
+    """
+    cls = type(value)
+    if is_struct(value):
+        return getattr(cls, "__model__", cls)
+    return cls
+
+
 class ORJSONDecoder(JSONDecoder):
     def decode(self, s: str, _w: Optional[Callable[..., Any]] = None) -> Any:
         return orjson.loads(s)
+
+
+class JSONArrayParser:
+    """
+    Incremental parser for a top-level JSON array.
+
+    Feed it raw chunks of the body as they arrive and get back elements
+    whose text is complete, so only one element is held in memory at a time.
+    """
+
+    # everything up to the next structural character, skipping complete strings
+    _SKIP = re.compile(rb'(?:[^"\[\]{},]+|"[^"\\]*(?:\\.[^"\\]*)*")*', re.DOTALL)
+
+    def __init__(self) -> None:
+        self._buffer = bytearray()
+        self._pos = 0
+        self._depth = 0
+        self._item_start: Optional[int] = None
+        self._finished = False
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        if self._finished:
+            if chunk.strip():
+                raise ValueError("data after the end of JSON array")
+            return []
+        self._buffer += chunk
+        items: List[Any] = []
+        buffer = self._buffer
+        size = len(buffer)
+        pos = self._pos
+        skip = self._SKIP.match
+        while True:
+            index = skip(buffer, pos).end()  # type: ignore[union-attr]
+            # wait for the rest of the chunk or of an unterminated string
+            if index == size or buffer[index] == ord('"'):
+                pos = index
+                break
+            char = buffer[index]
+            pos = index + 1
+            if self._depth == 0:
+                if char != ord("[") or buffer[:index].strip():
+                    raise ValueError("JSON array expected")
+                self._depth = 1
+                self._item_start = pos
+            elif char == ord("{") or char == ord("["):
+                self._depth += 1
+            elif char == ord("}") or char == ord("]"):
+                self._depth -= 1
+                if self._depth == 1:
+                    self._emit(items, pos)
+                elif self._depth == 0:
+                    if buffer[pos:].strip():
+                        raise ValueError("data after the end of JSON array")
+                    self._emit(items, index)
+                    self._finished = True
+                    pos = size
+                    break
+            elif self._depth == 1:
+                # comma between elements
+                self._emit(items, index)
+                self._item_start = pos
+        self._compact(pos)
+        return items
+
+    def close(self) -> None:
+        if not self._finished:
+            raise ValueError("JSON array is not complete")
+
+    def _emit(self, items: List[Any], end: int) -> None:
+        # strings, numbers, booleans and nulls at the top level end at the separator
+        if self._item_start is not None:
+            value = bytes(self._buffer[self._item_start : end]).strip()
+            if value:
+                items.append(orjson.loads(value))
+        self._item_start = None
+
+    def _compact(self, pos: int) -> None:
+        start = pos if self._item_start is None else min(pos, self._item_start)
+        if self._depth == 0 and not self._finished:
+            start = 0
+        del self._buffer[:start]
+        self._pos = pos - start
+        if self._item_start is not None:
+            self._item_start -= start
@@ -1,16 +1,51 @@
-from typing import TypeVar, Optional, Union, TYPE_CHECKING, Type, Any, Mapping, cast
+from __future__ import annotations
 
+import asyncio
+import math
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import (
+    TypeVar,
+    Optional,
+    Union,
+    TYPE_CHECKING,
+    Type,
+    Any,
+    Mapping,
+    Hashable,
+    Tuple,
+    Iterator,
+    AsyncIterator,
+    List,
+    Callable,
+    cast,
+)
+
+from httpx import Response, QueryParams
 from pydantic import BaseModel
 from typing_extensions import Unpack
 
 import orjson
 
-from astrotraders.api.schemas import PaginatedObject
-from astrotraders.api.utils import ORJSONDecoder
+from astrotraders.api.construct import construct, lazy as lazy_model
+from astrotraders.api.singleflight import SingleFlight, AsyncSingleFlight
+from astrotraders.api.utils import JSONArrayParser
+from astrotraders.api.exceptions import APIException
 
+# schemas and everything built on them are imported with the first model,
+# so creating a client doesn't pay for hundreds of pydantic classes
 if TYPE_CHECKING:
     from typing import TypedDict
-    from httpx import Client
+    from astrotraders.api.cache import ResponseCache
+    from astrotraders.api.fleet_state import FleetState
+    from astrotraders.api.markets import MarketStore
+    from astrotraders.api.ratelimit import RateLimiter
+    from astrotraders.api.retry import RetryPolicy
+    from astrotraders.api.schemas import PaginatedObject
+    from astrotraders.api.universe import UniverseCache
+    from astrotraders.api.structs import Decode, StructBackend
+    from httpx import Client, AsyncClient
     from httpx._client import UseClientDefault
     from httpx._types import (
         RequestContent,
@@ -41,54 +76,694 @@ if TYPE_CHECKING:
 T = TypeVar("T", bound=BaseModel)
 
 
-class HttpxClientWrapper:
-    def __init__(self, client: "Client"):
-        self._client = client
+def _page_type(to_type: Type[T]) -> Type[PaginatedObject[T]]:
+    from astrotraders.api.schemas import PaginatedObject
 
-    def raw_request(
-        self, method: str, uri: str, **params: Unpack["HttpxRequestParams"]
-    ) -> Optional[Union[dict[Any, Any], list[dict]]]:
+    return PaginatedObject[to_type]  # type: ignore[valid-type]
+
+
+class BaseHttpxClientWrapper:
+    """
+    Request preparation and response handling shared by sync and async wrappers.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        universe_cache: Optional[UniverseCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        market_store: Optional[MarketStore] = None,
+        fleet_state: Optional[FleetState] = None,
+        validate: Union[bool, float] = True,
+        lazy: bool = False,
+        backend: Optional["StructBackend"] = None,
+    ):
+        self.rate_limiter = rate_limiter
+        self.retry_policy = retry_policy
+        self.universe_cache = universe_cache
+        self.response_cache = response_cache
+        self.market_store = market_store
+        self.fleet_state = fleet_state
+        # True, False or share of responses to validate
+        self.validate = validate
+        self.lazy = lazy
+        self.backend = backend
+
+    @staticmethod
+    def _prepare_params(
+        params: "HttpxRequestParams",
+    ) -> "HttpxRequestParams":
         # because httpx doesn't have default way to change json encoder
         if json_obj := params.get("json"):
             # it works as well with bytes
             params["data"] = orjson.dumps(json_obj)  # type: ignore[typeddict-item]
             params["headers"] = {"Content-Type": "application/json"}
             del params["json"]
-        result = self._client.request(method, uri, **params)
+        return params
+
+    def _cache_lookup(
+        self, method: str, uri: str, params: "HttpxRequestParams"
+    ) -> Tuple[Optional[Tuple[Hashable, float]], Optional[Any]]:
+        """
+        Return response cache key with TTL (None if the request is not cacheable) and cached data.
+        """
+        if self.response_cache is None or method != "GET":
+            return None, None
+        ttl = self.response_cache.ttl(uri)
+        if ttl is None:
+            return None, None
+        key = self._request_key(uri, params)
+        return (key, ttl), self.response_cache.get(key)
+
+    @staticmethod
+    def _request_key(uri: str, params: "HttpxRequestParams") -> Hashable:
+        return uri, str(QueryParams(params.get("params")))
+
+    @classmethod
+    def _flight_key(
+        cls, uri: str, params: "HttpxRequestParams", decode: Optional["Decode"]
+    ) -> Hashable:
+        # callers decoding into structs don't share plain JSON and the other way around
+        key = cls._request_key(uri, params)
+        return key if decode is None else (key, decode)
+
+    def _cache_store(
+        self, cache_key: Optional[Tuple[Hashable, float]], uri: str, data: Any
+    ) -> None:
+        if self.response_cache is not None and cache_key and data is not None:
+            self.response_cache.set(cache_key[0], uri, data, cache_key[1])
+
+    def _retry_delay(
+        self, result: Response, attempt: int, idempotent: bool
+    ) -> Optional[float]:
+        if self.retry_policy is None:
+            return None
+        return self.retry_policy.delay(result, attempt, idempotent)
+
+    @staticmethod
+    def _parse_response(result: Response, decode: Optional["Decode"] = None) -> Any:
+        # body is decoded once, straight from bytes,
+        # and the same object is used for error checking and model construction
         # in a few requests we get 204, so we should handle this
-        if result.status_code == 204:
+        if result.status_code == 204 or not result.content:
+            result.raise_for_status()
             return None
-        return result.json(cls=ORJSONDecoder)
+        if decode is not None and result.is_success:
+            try:
+                return decode(result.content)
+            except ValueError:
+                # bodies which don't match the schema are decoded as usual below,
+                # so API errors are raised and schema errors come from the conversion
+                pass
+        try:
+            data = orjson.loads(result.content)
+        except orjson.JSONDecodeError:
+            result.raise_for_status()
+            raise
+        if isinstance(data, dict) and data.get("error"):
+            raise APIException(data["error"])
+        return data
+
+    @staticmethod
+    def _has_next_page(page: PaginatedObject[T], limit: int) -> bool:
+        if not page.objects:
+            return False
+        return page.meta.page * (page.meta.limit or limit) < page.meta.total
+
+    @staticmethod
+    def _remaining_pages(page: PaginatedObject[T], limit: int) -> range:
+        limit = page.meta.limit or limit
+        return range(page.meta.page + 1, math.ceil(page.meta.total / limit) + 1)
+
+    def validating(self, validate: Optional[bool] = None) -> bool:
+        """
+        Whether to validate a response. Unless ``validate`` is given for this call,
+        the client setting decides: validate always, never, or a random share of the time.
+        """
+        if validate is not None:
+            return validate
+        if isinstance(self.validate, bool):
+            return self.validate
+        return random.random() < self.validate
+
+    def build(
+        self, to_type: Type[T], data: Mapping[str, Any], validate: Optional[bool] = None
+    ) -> T:
+        """
+        Make a model from decoded data, see :meth:`validating`.
+        Without validation, models are built by :func:`construct`, which is much faster
+        but trusts the data to match the schema. In lazy mode fields are built
+        when they are read, see :func:`lazy`. Schemas handled by the struct backend
+        are made into its structs. Small fleet schemas are validated by generated parsers,
+        see :func:`astrotraders.api.parsers.generate`.
+        """
+        if self.backend is not None and self.backend.supports(to_type):
+            # structs stand in for the models they mirror, they are not instances of them
+            return cast(T, self.backend.convert(to_type, data))
+        validate = self.validating(validate)
+        if self.lazy:
+            return lazy_model(to_type, data, validate)
+        if validate:
+            from astrotraders.api.parsers import parser
+
+            parse = parser(to_type)
+            return to_type(**data) if parse is None else parse(data)
+        return construct(to_type, data)
+
+    def _decoder(self, to_type: type, envelope: bool = True) -> Optional["Decode"]:
+        if self.backend is None or not self.backend.supports(to_type):
+            return None
+        return self.backend.decoder(to_type, envelope)
+
+    def _to_model(
+        self,
+        data: Any,
+        to_type: Type[T],
+        validate: Optional[bool] = None,
+    ) -> T:
+        if not isinstance(data, Mapping):
+            # decoded by the struct backend straight from the body
+            return data.data
+        return self.build(to_type, cast(Mapping[str, Any], data)["data"], validate)
+
+    def _to_model_optioned(
+        self,
+        data: Any,
+        to_type: Type[T],
+        validate: Optional[bool] = None,
+    ) -> Optional[T]:
+        if data:
+            return self._to_model(data, to_type, validate)
+        return None
+
+    def _to_paginated(
+        self,
+        data: Any,
+        to_type: Type[T],
+        validate: Optional[bool] = None,
+    ) -> PaginatedObject[T]:
+        if not isinstance(data, Mapping):
+            return data
+        return self.build(_page_type(to_type), cast(Mapping[str, Any], data), validate)
+
+
+class HttpxClientWrapper(BaseHttpxClientWrapper):
+    def __init__(
+        self,
+        client: "Client",
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        universe_cache: Optional[UniverseCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        market_store: Optional[MarketStore] = None,
+        fleet_state: Optional[FleetState] = None,
+        validate: Union[bool, float] = True,
+        lazy: bool = False,
+        backend: Optional["StructBackend"] = None,
+        coalesce: bool = True,
+    ):
+        super().__init__(
+            rate_limiter,
+            retry_policy,
+            universe_cache,
+            response_cache,
+            market_store,
+            fleet_state,
+            validate,
+            lazy,
+            backend,
+        )
+        self._client = client
+        # identical GET requests in flight at the same time share one HTTP call
+        self.single_flight = SingleFlight() if coalesce else None
+
+    def raw_request(
+        self,
+        method: str,
+        uri: str,
+        idempotent: bool = False,
+        **params: Unpack["HttpxRequestParams"],
+    ) -> Optional[Union[dict[Any, Any], list[dict]]]:
+        return self._request(method, uri, idempotent, None, params)[0]
+
+    def _request(
+        self,
+        method: str,
+        uri: str,
+        idempotent: bool,
+        decode: Optional["Decode"],
+        params: "HttpxRequestParams",
+    ) -> Tuple[Any, bool]:
+        """
+        Return decoded response data and whether it was received from the API
+        rather than taken from the response cache.
+        """
+        params = self._prepare_params(params)
+        cache_key, cached = self._cache_lookup(method, uri, params)
+        if cached is not None:
+            return cached, False
+        if cache_key is not None:
+            # the response cache keeps decoded JSON
+            decode = None
+        if self.single_flight is not None and method == "GET":
+            data = self.single_flight.do(
+                self._flight_key(uri, params, decode),
+                lambda: self._send(method, uri, idempotent, params, decode),
+            )
+        else:
+            data = self._send(method, uri, idempotent, params, decode)
+        self._cache_store(cache_key, uri, data)
+        return data, True
+
+    def _send(
+        self,
+        method: str,
+        uri: str,
+        idempotent: bool,
+        params: "HttpxRequestParams",
+        decode: Optional["Decode"] = None,
+    ) -> Any:
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            result = self._client.request(method, uri, **params)
+            delay = self._retry_delay(result, attempt, idempotent)
+            if delay is None:
+                return self._parse_response(result, decode)
+            attempt += 1
+            time.sleep(delay)
+
+    def stream_array(
+        self,
+        method: str,
+        uri: str,
+        idempotent: bool = False,
+        **params: Unpack["HttpxRequestParams"],
+    ) -> Iterator[Any]:
+        """
+        Request an endpoint which returns JSON array and yield its elements
+        while the body is still being downloaded, without holding the whole array in memory.
+        """
+        params = self._prepare_params(params)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            with self._client.stream(method, uri, **params) as result:
+                if not result.is_error:
+                    parser = JSONArrayParser()
+                    for chunk in result.iter_bytes():
+                        yield from parser.feed(chunk)
+                    parser.close()
+                    return
+                result.read()
+                delay = self._retry_delay(result, attempt, idempotent)
+                if delay is None:
+                    self._parse_response(result)
+                    result.raise_for_status()
+                    return
+            attempt += 1
+            time.sleep(delay)
 
     def request_to_model(
         self,
         method: str,
         uri: str,
         to_type: Type[T],
+        idempotent: bool = False,
+        validate: Optional[bool] = None,
+        on_fetch: Optional[Callable[[T], Any]] = None,
         **params: Unpack["HttpxRequestParams"],
     ) -> T:
-        data = cast(Mapping[str, Any], self.raw_request(method, uri, **params))
-        return to_type(**data["data"])
+        """
+        Request a model. ``on_fetch`` is called with it only if the response
+        came from the API, not from the response cache.
+        """
+        data, fetched = self._request(
+            method, uri, idempotent, self._decoder(to_type), params
+        )
+        model = self._to_model(data, to_type, validate)
+        if on_fetch is not None and fetched:
+            on_fetch(model)
+        return model
 
     def request_to_model_optioned(
         self,
         method: str,
         uri: str,
         to_type: Type[T],
+        idempotent: bool = False,
+        validate: Optional[bool] = None,
         **params: Unpack["HttpxRequestParams"],
     ) -> Optional[T]:
-        data = cast(Mapping[str, Any], self.raw_request(method, uri, **params))
-        if data:
-            return to_type(**data["data"])
-        return None
+        data, _ = self._request(method, uri, idempotent, self._decoder(to_type), params)
+        return self._to_model_optioned(data, to_type, validate)
 
     def request_to_paginated(
         self,
         method: str,
         uri: str,
         to_type: Type[T],
+        idempotent: bool = False,
+        validate: Optional[bool] = None,
+        **params: Unpack["HttpxRequestParams"],
+    ) -> PaginatedObject[T]:
+        page_type = _page_type(to_type)
+        data, _ = self._request(
+            method, uri, idempotent, self._decoder(page_type, envelope=False), params
+        )
+        return self._to_paginated(data, to_type, validate)
+
+    def request_cached(
+        self,
+        kind: str,
+        symbol: str,
+        uri: str,
+        to_type: Type[T],
+        validate: Optional[bool] = None,
+        **params: Unpack["HttpxRequestParams"],
+    ) -> T:
+        """
+        GET a model through the universe cache, if the client has one.
+        """
+        cache = self.universe_cache
+        if cache is not None and (data := cache.get(kind, symbol)) is not None:
+            return self.build(to_type, data, validate)
+        data = cast(Mapping[str, Any], self.raw_request("GET", uri, **params))["data"]
+        if cache is not None:
+            cache.put(kind, symbol, data)
+        return self.build(to_type, data, validate)
+
+    def iter_paginated(
+        self,
+        uri: str,
+        to_type: Type[T],
+        limit: int = 20,
+        page: int = 1,
+        params: Optional[dict[str, Any]] = None,
+        validate: Optional[bool] = None,
+    ) -> Iterator[T]:
+        """
+        Lazily walk a paginated listing from ``page`` until ``Meta.total`` is reached,
+        yielding objects one by one. Next page is requested only when the previous one is consumed.
+        """
+        while True:
+            result = self.request_to_paginated(
+                "GET",
+                uri,
+                to_type,
+                validate=validate,
+                params={**(params or {}), "limit": limit, "page": page},
+            )
+            yield from result.objects
+            if not self._has_next_page(result, limit):
+                return
+            page += 1
+
+    def all_paginated(
+        self,
+        uri: str,
+        to_type: Type[T],
+        limit: int = 20,
+        concurrency: int = 4,
+        params: Optional[dict[str, Any]] = None,
+        validate: Optional[bool] = None,
+    ) -> List[T]:
+        """
+        Fetch a whole paginated listing. After the first page tells ``Meta.total``,
+        remaining pages are requested by ``concurrency`` threads (still bounded by the rate limiter)
+        and objects are returned in listing order.
+        """
+
+        def fetch(page: int) -> PaginatedObject[T]:
+            return self.request_to_paginated(
+                "GET",
+                uri,
+                to_type,
+                validate=validate,
+                params={**(params or {}), "limit": limit, "page": page},
+            )
+
+        first = fetch(1)
+        objects = list(first.objects)
+        pages = self._remaining_pages(first, limit)
+        if not pages:
+            return objects
+        with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+            for result in executor.map(fetch, pages):
+                objects.extend(result.objects)
+        return objects
+
+
+class AsyncHttpxClientWrapper(BaseHttpxClientWrapper):
+    def __init__(
+        self,
+        client: "AsyncClient",
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        universe_cache: Optional[UniverseCache] = None,
+        response_cache: Optional[ResponseCache] = None,
+        market_store: Optional[MarketStore] = None,
+        fleet_state: Optional[FleetState] = None,
+        validate: Union[bool, float] = True,
+        lazy: bool = False,
+        backend: Optional["StructBackend"] = None,
+        coalesce: bool = True,
+    ):
+        super().__init__(
+            rate_limiter,
+            retry_policy,
+            universe_cache,
+            response_cache,
+            market_store,
+            fleet_state,
+            validate,
+            lazy,
+            backend,
+        )
+        self._client = client
+        # identical GET requests in flight at the same time share one HTTP call
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+
+    async def raw_request(
+        self,
+        method: str,
+        uri: str,
+        idempotent: bool = False,
+        **params: Unpack["HttpxRequestParams"],
+    ) -> Optional[Union[dict[Any, Any], list[dict]]]:
+        return (await self._request(method, uri, idempotent, None, params))[0]
+
+    async def _request(
+        self,
+        method: str,
+        uri: str,
+        idempotent: bool,
+        decode: Optional["Decode"],
+        params: "HttpxRequestParams",
+    ) -> Tuple[Any, bool]:
+        """
+        Return decoded response data and whether it was received from the API
+        rather than taken from the response cache.
+        """
+        params = self._prepare_params(params)
+        cache_key, cached = self._cache_lookup(method, uri, params)
+        if cached is not None:
+            return cached, False
+        if cache_key is not None:
+            # the response cache keeps decoded JSON
+            decode = None
+        if self.single_flight is not None and method == "GET":
+            data = await self.single_flight.do(
+                self._flight_key(uri, params, decode),
+                lambda: self._send(method, uri, idempotent, params, decode),
+            )
+        else:
+            data = await self._send(method, uri, idempotent, params, decode)
+        self._cache_store(cache_key, uri, data)
+        return data, True
+
+    async def _send(
+        self,
+        method: str,
+        uri: str,
+        idempotent: bool,
+        params: "HttpxRequestParams",
+        decode: Optional["Decode"] = None,
+    ) -> Any:
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            result = await self._client.request(method, uri, **params)
+            delay = self._retry_delay(result, attempt, idempotent)
+            if delay is None:
+                return self._parse_response(result, decode)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def stream_array(
+        self,
+        method: str,
+        uri: str,
+        idempotent: bool = False,
+        **params: Unpack["HttpxRequestParams"],
+    ) -> AsyncIterator[Any]:
+        """
+        Request an endpoint which returns JSON array and yield its elements
+        while the body is still being downloaded, without holding the whole array in memory.
+        """
+        params = self._prepare_params(params)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            async with self._client.stream(
+                method, uri, **params  # type: ignore[arg-type]
+            ) as result:
+                if not result.is_error:
+                    parser = JSONArrayParser()
+                    async for chunk in result.aiter_bytes():
+                        for item in parser.feed(chunk):
+                            yield item
+                    parser.close()
+                    return
+                await result.aread()
+                delay = self._retry_delay(result, attempt, idempotent)
+                if delay is None:
+                    self._parse_response(result)
+                    result.raise_for_status()
+                    return
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    async def request_to_model(
+        self,
+        method: str,
+        uri: str,
+        to_type: Type[T],
+        idempotent: bool = False,
+        validate: Optional[bool] = None,
+        on_fetch: Optional[Callable[[T], Any]] = None,
+        **params: Unpack["HttpxRequestParams"],
+    ) -> T:
+        data, fetched = await self._request(
+            method, uri, idempotent, self._decoder(to_type), params
+        )
+        model = self._to_model(data, to_type, validate)
+        if on_fetch is not None and fetched:
+            on_fetch(model)
+        return model
+
+    async def request_to_model_optioned(
+        self,
+        method: str,
+        uri: str,
+        to_type: Type[T],
+        idempotent: bool = False,
+        validate: Optional[bool] = None,
+        **params: Unpack["HttpxRequestParams"],
+    ) -> Optional[T]:
+        data, _ = await self._request(
+            method, uri, idempotent, self._decoder(to_type), params
+        )
+        return self._to_model_optioned(data, to_type, validate)
+
+    async def request_to_paginated(
+        self,
+        method: str,
+        uri: str,
+        to_type: Type[T],
+        idempotent: bool = False,
+        validate: Optional[bool] = None,
         **params: Unpack["HttpxRequestParams"],
     ) -> PaginatedObject[T]:
-        data = cast(Mapping[str, Any], self.raw_request(method, uri, **params))
-        # TODO: fix mypy error
-        return PaginatedObject[to_type](**data)  # type: ignore[valid-type]
+        page_type = _page_type(to_type)
+        data, _ = await self._request(
+            method, uri, idempotent, self._decoder(page_type, envelope=False), params
+        )
+        return self._to_paginated(data, to_type, validate)
+
+    async def request_cached(
+        self,
+        kind: str,
+        symbol: str,
+        uri: str,
+        to_type: Type[T],
+        validate: Optional[bool] = None,
+        **params: Unpack["HttpxRequestParams"],
+    ) -> T:
+        """
+        GET a model through the universe cache, if the client has one.
+        """
+        cache = self.universe_cache
+        if cache is not None and (data := cache.get(kind, symbol)) is not None:
+            return self.build(to_type, data, validate)
+        response = await self.raw_request("GET", uri, **params)
+        data = cast(Mapping[str, Any], response)["data"]
+        if cache is not None:
+            cache.put(kind, symbol, data)
+        return self.build(to_type, data, validate)
+
+    async def iter_paginated(
+        self,
+        uri: str,
+        to_type: Type[T],
+        limit: int = 20,
+        page: int = 1,
+        params: Optional[dict[str, Any]] = None,
+        validate: Optional[bool] = None,
+    ) -> AsyncIterator[T]:
+        """
+        Lazily walk a paginated listing from ``page`` until ``Meta.total`` is reached,
+        yielding objects one by one. Next page is requested only when the previous one is consumed.
+        """
+        while True:
+            result = await self.request_to_paginated(
+                "GET",
+                uri,
+                to_type,
+                validate=validate,
+                params={**(params or {}), "limit": limit, "page": page},
+            )
+            for obj in result.objects:
+                yield obj
+            if not self._has_next_page(result, limit):
+                return
+            page += 1
+
+    async def all_paginated(
+        self,
+        uri: str,
+        to_type: Type[T],
+        limit: int = 20,
+        concurrency: int = 4,
+        params: Optional[dict[str, Any]] = None,
+        validate: Optional[bool] = None,
+    ) -> List[T]:
+        """
+        Fetch a whole paginated listing. After the first page tells ``Meta.total``,
+        up to ``concurrency`` remaining pages are requested at once (still bounded by the rate limiter)
+        and objects are returned in listing order.
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def fetch(page: int) -> PaginatedObject[T]:
+            async with semaphore:
+                return await self.request_to_paginated(
+                    "GET",
+                    uri,
+                    to_type,
+                    validate=validate,
+                    params={**(params or {}), "limit": limit, "page": page},
+                )
+
+        first = await fetch(1)
+        objects = list(first.objects)
+        for result in await asyncio.gather(
+            *(fetch(page) for page in self._remaining_pages(first, limit))
+        ):
+            objects.extend(result.objects)
+        return objects
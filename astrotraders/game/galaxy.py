@@ -0,0 +1,285 @@
+import math
+import sys
+from typing import Iterable, Optional, Sequence, Any, Mapping, List, Tuple, Union
+
+from astrotraders.api.schemas import System, SystemType, WaypointType
+from astrotraders.api.universe import UniverseCache
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "galaxy store requires numpy, install it with `pip install astrotraders[galaxy]`"
+    ) from e
+
+SYSTEM_TYPES: List[str] = [item.value for item in SystemType]
+WAYPOINT_TYPES: List[str] = [item.value for item in WaypointType]
+_SYSTEM_TYPE_CODES = {value: code for code, value in enumerate(SYSTEM_TYPES)}
+_WAYPOINT_TYPE_CODES = {value: code for code, value in enumerate(WAYPOINT_TYPES)}
+
+
+class GridIndex:
+    """
+    Uniform grid over 2D points for nearest neighbour and radius queries.
+
+    Points are sorted by cell, so every cell is a contiguous slice of ``order``.
+    """
+
+    def __init__(self, xy: "np.ndarray", cell_size: Optional[float] = None):
+        self.xy = np.asarray(xy, dtype=np.float64).reshape(-1, 2)
+        count = len(self.xy)
+        if count:
+            self.origin = self.xy.min(axis=0)
+            extent = self.xy.max(axis=0) - self.origin
+        else:
+            self.origin = np.zeros(2)
+            extent = np.zeros(2)
+        if cell_size is None:
+            # about two points per cell on average
+            area = max(float(extent[0]) * float(extent[1]), 1.0)
+            cell_size = max(math.sqrt(2 * area / max(count, 1)), 1.0)
+        self.cell_size = float(cell_size)
+        self.shape = (extent // self.cell_size).astype(np.int64) + 1
+        cells = self._cells(self.xy)
+        cell_ids = cells[:, 0] * self.shape[1] + cells[:, 1]
+        self.order = np.argsort(cell_ids, kind="stable")
+        self._starts = np.searchsorted(
+            cell_ids[self.order], np.arange(self.shape[0] * self.shape[1] + 1)
+        )
+
+    def __len__(self) -> int:
+        return len(self.xy)
+
+    def _cells(self, xy: "np.ndarray") -> "np.ndarray":
+        return ((xy - self.origin) // self.cell_size).astype(np.int64)
+
+    def _block(self, x0: int, x1: int, y0: int, y1: int) -> "np.ndarray":
+        """
+        Indices of points in cells [x0, x1] x [y0, y1], clipped to the grid.
+        """
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, int(self.shape[0]) - 1), min(y1, int(self.shape[1]) - 1)
+        if x0 > x1 or y0 > y1:
+            return np.empty(0, dtype=np.int64)
+        rows = np.arange(x0, x1 + 1) * self.shape[1]
+        starts = self._starts[rows + y0]
+        ends = self._starts[rows + y1 + 1]
+        return np.concatenate(
+            [self.order[start:end] for start, end in zip(starts, ends)]
+        )
+
+    def within(self, x: float, y: float, radius: float) -> "np.ndarray":
+        """
+        Indices of points within ``radius`` of (x, y), sorted by distance.
+        """
+        low = self._cells(np.array([x - radius, y - radius]))
+        high = self._cells(np.array([x + radius, y + radius]))
+        candidates = self._block(low[0], high[0], low[1], high[1])
+        distances = np.hypot(*(self.xy[candidates] - (x, y)).T)
+        inside = distances <= radius
+        candidates, distances = candidates[inside], distances[inside]
+        return candidates[np.argsort(distances, kind="stable")]
+
+    def nearest(
+        self, x: float, y: float, k: int = 1, mask: Optional["np.ndarray"] = None
+    ) -> "np.ndarray":
+        """
+        Indices of ``k`` nearest points to (x, y), closest first.
+        ``mask`` is a boolean array which limits the search to selected points.
+        """
+        total = len(self) if mask is None else int(np.count_nonzero(mask))
+        k = min(k, total)
+        if k <= 0:
+            return np.empty(0, dtype=np.int64)
+        # grid is built with about two points per cell, so start with a square of k / 2 cells
+        radius = self.cell_size * max(1.0, math.sqrt(k / 2))
+        while True:
+            low = self._cells(np.array([x - radius, y - radius]))
+            high = self._cells(np.array([x + radius, y + radius]))
+            candidates = self._block(low[0], high[0], low[1], high[1])
+            if mask is not None:
+                candidates = candidates[mask[candidates]]
+            distances = np.hypot(*(self.xy[candidates] - (x, y)).T)
+            # every point within radius is inside the square, so those are the closest ones
+            covers_grid = (low <= 0).all() and (high >= self.shape - 1).all()
+            if covers_grid or np.count_nonzero(distances <= radius) >= k:
+                if len(distances) > k:
+                    best = np.argpartition(distances, k - 1)[:k]
+                    candidates, distances = candidates[best], distances[best]
+                return candidates[np.argsort(distances, kind="stable")]
+            radius *= 2
+
+
+class GalaxyStore:
+    """
+    Compact NumPy representation of the universe.
+
+    Symbols are interned and kept in lists, coordinates and types live in contiguous arrays
+    indexed by position, so whole-galaxy computations are vectorised.
+    Waypoints are grouped by system: waypoints of system ``i`` are
+    ``waypoint_offsets[i]:waypoint_offsets[i + 1]``, with system-local coordinates.
+    """
+
+    def __init__(
+        self,
+        systems: Sequence[Tuple[str, str, int, int]],
+        waypoints: Sequence[Sequence[Tuple[str, str, int, int]]],
+    ):
+        self.system_symbols: List[str] = [sys.intern(item[0]) for item in systems]
+        self.system_index = {
+            symbol: index for index, symbol in enumerate(self.system_symbols)
+        }
+        self.system_types = np.fromiter(
+            (_SYSTEM_TYPE_CODES[item[1]] for item in systems),
+            dtype=np.int8,
+            count=len(systems),
+        )
+        self.system_xy = np.array(
+            [(item[2], item[3]) for item in systems], dtype=np.int64
+        ).reshape(-1, 2)
+        self.waypoint_offsets = np.zeros(len(systems) + 1, dtype=np.int64)
+        np.cumsum([len(items) for items in waypoints], out=self.waypoint_offsets[1:])
+        flat = [item for items in waypoints for item in items]
+        self.waypoint_symbols: List[str] = [sys.intern(item[0]) for item in flat]
+        self.waypoint_index = {
+            symbol: index for index, symbol in enumerate(self.waypoint_symbols)
+        }
+        self.waypoint_types = np.fromiter(
+            (_WAYPOINT_TYPE_CODES[item[1]] for item in flat),
+            dtype=np.int8,
+            count=len(flat),
+        )
+        self.waypoint_xy = np.array(
+            [(item[2], item[3]) for item in flat], dtype=np.int64
+        ).reshape(-1, 2)
+        self.waypoint_system = np.repeat(
+            np.arange(len(systems)), np.diff(self.waypoint_offsets)
+        )
+        self.index = GridIndex(self.system_xy)
+
+    @classmethod
+    def from_raw(cls, systems: Iterable[Mapping[str, Any]]) -> "GalaxyStore":
+        """
+        Build from raw systems, as returned by ``/systems.json`` or stored in the universe cache.
+        Skips pydantic completely, which is the fastest way to load the universe.
+        """
+        system_rows = []
+        waypoint_rows = []
+        for system in systems:
+            system_rows.append(
+                (system["symbol"], system["type"], system["x"], system["y"])
+            )
+            waypoint_rows.append(
+                [
+                    (item["symbol"], item["type"], item["x"], item["y"])
+                    for item in system["waypoints"]
+                ]
+            )
+        return cls(system_rows, waypoint_rows)
+
+    @classmethod
+    def from_systems(cls, systems: Iterable[System]) -> "GalaxyStore":
+        """
+        Build from systems, e.g. ``SystemsResource.all()`` or ``SystemsResource.stream_all()``.
+        """
+        system_rows = []
+        waypoint_rows = []
+        for system in systems:
+            system_rows.append((system.symbol, system.type.value, system.x, system.y))
+            waypoint_rows.append(
+                [
+                    (item.symbol, item.type.value, item.x, item.y)
+                    for item in system.waypoints
+                ]
+            )
+        return cls(system_rows, waypoint_rows)
+
+    @classmethod
+    def from_cache(cls, cache: UniverseCache) -> "GalaxyStore":
+        return cls.from_raw(system for _, system in cache.items(UniverseCache.SYSTEMS))
+
+    def __len__(self) -> int:
+        return len(self.system_symbols)
+
+    def _to_index(self, system: Union[str, int]) -> int:
+        return self.system_index[system] if isinstance(system, str) else system
+
+    def coordinates(self, system: Union[str, int]) -> Tuple[int, int]:
+        x, y = self.system_xy[self._to_index(system)]
+        return int(x), int(y)
+
+    def systems_of_type(self, system_type: Union[SystemType, str]) -> "np.ndarray":
+        """
+        Boolean mask of systems of a type, usable as ``mask`` in queries.
+        """
+        return self.system_types == _SYSTEM_TYPE_CODES[SystemType(system_type).value]
+
+    def systems_with_waypoint(
+        self, waypoint_type: Union[WaypointType, str]
+    ) -> "np.ndarray":
+        """
+        Boolean mask of systems which have at least one waypoint of a type.
+        """
+        code = _WAYPOINT_TYPE_CODES[WaypointType(waypoint_type).value]
+        mask = np.zeros(len(self), dtype=bool)
+        mask[self.waypoint_system[self.waypoint_types == code]] = True
+        return mask
+
+    def mask(self, symbols: Iterable[str]) -> "np.ndarray":
+        """
+        Boolean mask of listed systems, e.g. systems known to have a shipyard.
+        """
+        mask = np.zeros(len(self), dtype=bool)
+        mask[[self.system_index[symbol] for symbol in symbols]] = True
+        return mask
+
+    def distances(self, system: Union[str, int]) -> "np.ndarray":
+        """
+        Euclidean distances from a system to every system.
+        """
+        delta = self.system_xy - self.system_xy[self._to_index(system)]
+        return np.hypot(delta[:, 0], delta[:, 1])
+
+    def nearest(
+        self,
+        system: Union[str, int, Tuple[float, float]],
+        k: int = 1,
+        mask: Optional["np.ndarray"] = None,
+        include_self: bool = False,
+    ) -> List[str]:
+        """
+        Symbols of ``k`` systems closest to a system or to (x, y), closest first.
+        """
+        exclude = None
+        if isinstance(system, tuple):
+            x, y = system
+        else:
+            index = self._to_index(system)
+            x, y = self.system_xy[index]
+            if not include_self:
+                exclude = index
+        found = self.index.nearest(float(x), float(y), k + (exclude is not None), mask)
+        return [self.system_symbols[index] for index in found if index != exclude][:k]
+
+    def within(
+        self,
+        system: Union[str, int, Tuple[float, float]],
+        radius: float,
+        mask: Optional["np.ndarray"] = None,
+    ) -> List[str]:
+        """
+        Symbols of systems within ``radius`` of a system or of (x, y), closest first.
+        """
+        if isinstance(system, tuple):
+            x, y = system
+        else:
+            x, y = self.system_xy[self._to_index(system)]
+        found = self.index.within(float(x), float(y), radius)
+        if mask is not None:
+            found = found[mask[found]]
+        return [self.system_symbols[index] for index in found]
+
+    def waypoints(self, system: Union[str, int]) -> List[str]:
+        index = self._to_index(system)
+        start, end = self.waypoint_offsets[index], self.waypoint_offsets[index + 1]
+        return self.waypoint_symbols[start:end]
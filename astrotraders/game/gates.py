@@ -0,0 +1,278 @@
+import heapq
+import math
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Iterable,
+    Mapping,
+    Any,
+    NamedTuple,
+    Set,
+    Tuple,
+    Union,
+)
+
+from astrotraders.api.schemas import JumpGate, ConnectedSystem
+from astrotraders.api.universe import UniverseCache
+
+
+class GateRoute(NamedTuple):
+    systems: List[str]
+    distance: int
+
+    @property
+    def hops(self) -> int:
+        return len(self.systems) - 1
+
+
+class GateGraph:
+    """
+    Jump gate network between systems, built incrementally from jump gate responses.
+
+    Gates are treated as two-way, so adding one gate also tells which systems can jump back.
+    Shortest routes are found with A* over landmark (ALT) lower bounds: distances
+    from a few far apart landmark systems are computed lazily after the graph changes
+    and let the search skip most of the galaxy.
+    """
+
+    def __init__(self, landmarks: int = 8):
+        self.landmark_count = landmarks
+        self._index: Dict[str, int] = {}
+        self._symbols: List[str] = []
+        self._edges: List[Dict[int, int]] = []
+        self._explored: Set[int] = set()
+        self._landmarks: List[List[float]] = []
+        self._components: List[int] = []
+        self._dirty = False
+
+    @classmethod
+    def from_cache(cls, cache: UniverseCache, landmarks: int = 8) -> "GateGraph":
+        graph = cls(landmarks)
+        graph.load_cache(cache)
+        return graph
+
+    def __len__(self) -> int:
+        return len(self._symbols)
+
+    def __contains__(self, system: object) -> bool:
+        return system in self._index
+
+    @property
+    def systems(self) -> List[str]:
+        return list(self._symbols)
+
+    def _node(self, system: str) -> int:
+        node = self._index.get(system)
+        if node is None:
+            node = self._index[system] = len(self._symbols)
+            self._symbols.append(system)
+            self._edges.append({})
+            self._dirty = True
+        return node
+
+    def add_edge(self, first: str, second: str, distance: int) -> None:
+        a, b = self._node(first), self._node(second)
+        if a == b or self._edges[a].get(b) == distance:
+            return
+        self._edges[a][b] = self._edges[b][a] = distance
+        self._dirty = True
+
+    def add_connections(
+        self,
+        system: str,
+        connected: Iterable[Union[ConnectedSystem, Mapping[str, Any]]],
+    ) -> None:
+        """
+        Add gate connections of a system, as models or raw API objects.
+        """
+        self._explored.add(self._node(system))
+        for item in connected:
+            if isinstance(item, ConnectedSystem):
+                self.add_edge(system, item.symbol, item.distance)
+            else:
+                self.add_edge(system, item["symbol"], item["distance"])
+
+    def add_gate(self, system: str, gate: Union[JumpGate, Mapping[str, Any]]) -> None:
+        """
+        Add a result of ``WaypointsResource.jump_gate`` for a gate in ``system``.
+        """
+        if isinstance(gate, JumpGate):
+            self.add_connections(system, gate.connected_systems)
+        else:
+            self.add_connections(system, gate["connectedSystems"])
+
+    def load_cache(self, cache: UniverseCache) -> int:
+        """
+        Add every jump gate stored in the universe cache. Returns number of gates.
+        """
+        count = 0
+        for waypoint, gate in cache.items(UniverseCache.JUMP_GATES):
+            self.add_gate(waypoint.rsplit("-", 1)[0], gate)
+            count += 1
+        return count
+
+    def neighbours(self, system: str) -> Dict[str, int]:
+        """
+        Systems reachable with one jump from a system, with jump distances.
+        """
+        node = self._index.get(system)
+        if node is None:
+            return {}
+        return {self._symbols[other]: dist for other, dist in self._edges[node].items()}
+
+    def is_explored(self, system: str) -> bool:
+        """
+        Whether the gate of a system was added, not only seen as a connection.
+        """
+        return self._index.get(system) in self._explored
+
+    def frontier(self) -> List[str]:
+        """
+        Systems known from connections whose own gate wasn't fetched yet.
+        """
+        return [
+            symbol
+            for node, symbol in enumerate(self._symbols)
+            if node not in self._explored
+        ]
+
+    def _dijkstra(self, source: int) -> List[float]:
+        distances = [math.inf] * len(self._symbols)
+        distances[source] = 0
+        queue = [(0, source)]
+        edges = self._edges
+        while queue:
+            distance, node = heapq.heappop(queue)
+            if distance > distances[node]:
+                continue
+            for other, weight in edges[node].items():
+                candidate = distance + weight
+                if candidate < distances[other]:
+                    distances[other] = candidate
+                    heapq.heappush(queue, (candidate, other))
+        return distances
+
+    def _prepare(self) -> None:
+        if not self._dirty:
+            return
+        count = len(self._symbols)
+        self._components = [-1] * count
+        members: List[List[int]] = []
+        for node in range(count):
+            if self._components[node] != -1:
+                continue
+            self._components[node] = len(members)
+            component = [node]
+            for current in component:
+                for other in self._edges[current]:
+                    if self._components[other] == -1:
+                        self._components[other] = len(members)
+                        component.append(other)
+            members.append(component)
+        # landmarks are shared between big components by size,
+        # small ones are cheap to search without them
+        self._landmarks = []
+        for component in sorted(members, key=len, reverse=True):
+            share = min(
+                round(self.landmark_count * len(component) / count),
+                self.landmark_count - len(self._landmarks),
+            )
+            if share <= 0:
+                break
+            # farthest point selection, every landmark is far from the previous ones
+            closest = self._dijkstra(component[0])
+            for _ in range(share):
+                landmark = max(component, key=closest.__getitem__)
+                table = self._dijkstra(landmark)
+                self._landmarks.append(table)
+                closest = [min(a, b) for a, b in zip(closest, table)]
+        self._dirty = False
+
+    def _route(self, nodes: List[int], distance: float) -> GateRoute:
+        return GateRoute([self._symbols[node] for node in nodes], int(distance))
+
+    def shortest_path(self, start: str, goal: str) -> Optional[GateRoute]:
+        """
+        Route with the smallest total jump distance, or None if goal is unreachable.
+        """
+        source, target = self._index.get(start), self._index.get(goal)
+        if source is None or target is None:
+            return None
+        if source == target:
+            return GateRoute([start], 0)
+        self._prepare()
+        if self._components[source] != self._components[target]:
+            return None
+        landmarks = [
+            (table, table[target])
+            for table in self._landmarks
+            if table[target] != math.inf
+        ]
+
+        def bound(node: int) -> float:
+            # |d(L, goal) - d(L, node)| never exceeds d(node, goal) by triangle inequality
+            best = 0.0
+            for table, to_target in landmarks:
+                difference = abs(to_target - table[node])
+                if difference > best:
+                    best = difference
+            return best
+
+        distances: Dict[int, float] = {source: 0}
+        parents: Dict[int, int] = {}
+        closed: Set[int] = set()
+        queue: List[Tuple[float, float, int]] = [(bound(source), 0, source)]
+        edges = self._edges
+        while queue:
+            _, distance, node = heapq.heappop(queue)
+            if node == target:
+                path = [node]
+                while node != source:
+                    node = parents[node]
+                    path.append(node)
+                return self._route(path[::-1], distance)
+            if node in closed:
+                continue
+            closed.add(node)
+            for other, weight in edges[node].items():
+                candidate = distance + weight
+                if other in closed or candidate >= distances.get(other, math.inf):
+                    continue
+                distances[other] = candidate
+                parents[other] = node
+                heapq.heappush(queue, (candidate + bound(other), candidate, other))
+        return None
+
+    def fewest_hops(self, start: str, goal: str) -> Optional[GateRoute]:
+        """
+        Route with the fewest jumps, the shortest one among equals,
+        or None if goal is unreachable.
+        """
+        source, target = self._index.get(start), self._index.get(goal)
+        if source is None or target is None:
+            return None
+        self._prepare()
+        if self._components[source] != self._components[target]:
+            return None
+        best: Dict[int, Tuple[int, float]] = {source: (0, 0)}
+        parents: Dict[int, int] = {}
+        queue: List[Tuple[int, float, int]] = [(0, 0, source)]
+        edges = self._edges
+        while queue:
+            hops, distance, node = heapq.heappop(queue)
+            if node == target:
+                path = [node]
+                while node != source:
+                    node = parents[node]
+                    path.append(node)
+                return self._route(path[::-1], distance)
+            if (hops, distance) > best[node]:
+                continue
+            for other, weight in edges[node].items():
+                candidate = (hops + 1, distance + weight)
+                if candidate < best.get(other, (math.inf, math.inf)):
+                    best[other] = candidate
+                    parents[other] = node
+                    heapq.heappush(queue, (*candidate, other))
+        return None
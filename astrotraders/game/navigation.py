@@ -0,0 +1,366 @@
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Iterable,
+    Mapping,
+    Any,
+    NamedTuple,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
+
+from astrotraders.api.schemas import (
+    ShipNavFlightMode,
+    ShipSchema,
+    Waypoint,
+    WaypointTraitEnum,
+)
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "navigation planner requires numpy, install it with `pip install astrotraders[galaxy]`"
+    ) from e
+
+# seconds per distance unit for engine speed 1
+SPEED_MULTIPLIERS: Dict[ShipNavFlightMode, float] = {
+    ShipNavFlightMode.cruise: 25.0,
+    ShipNavFlightMode.drift: 250.0,
+    ShipNavFlightMode.burn: 12.5,
+    ShipNavFlightMode.stealth: 30.0,
+}
+DEFAULT_MODES: Tuple[ShipNavFlightMode, ...] = (
+    ShipNavFlightMode.burn,
+    ShipNavFlightMode.cruise,
+    ShipNavFlightMode.drift,
+)
+
+ArrayLike = Union[float, "np.ndarray"]
+
+
+def _round(value: ArrayLike) -> "np.ndarray":
+    # the game rounds halves up, numpy rounds them to even
+    return np.floor(np.asarray(value, dtype=np.float64) + 0.5)
+
+
+def travel_time(
+    distance: ArrayLike, speed: ArrayLike, mode: ShipNavFlightMode
+) -> "np.ndarray":
+    """
+    Seconds of flight over ``distance`` with engine ``speed``, element-wise for arrays.
+    """
+    distance = _round(np.maximum(distance, 1))
+    return _round(distance * (SPEED_MULTIPLIERS[mode] / np.asarray(speed)) + 15)
+
+
+def fuel_cost(distance: ArrayLike, mode: ShipNavFlightMode) -> "np.ndarray":
+    """
+    Fuel consumed by a flight over ``distance``, element-wise for arrays.
+    """
+    distance = _round(distance)
+    if mode == ShipNavFlightMode.drift:
+        return np.ones_like(distance)
+    if mode == ShipNavFlightMode.burn:
+        return np.maximum(2 * distance, 2)
+    return np.maximum(distance, 1)
+
+
+class NavLeg(NamedTuple):
+    origin: str
+    destination: str
+    mode: ShipNavFlightMode
+    distance: float
+    fuel: int
+    time: int
+    # refuel at origin before departure
+    refuel: bool
+
+
+class NavPlan(NamedTuple):
+    legs: List[NavLeg]
+
+    @property
+    def time(self) -> int:
+        return sum(leg.time for leg in self.legs)
+
+    @property
+    def fuel(self) -> int:
+        return sum(leg.fuel for leg in self.legs)
+
+    @property
+    def refuels(self) -> List[str]:
+        """
+        Waypoints where the ship has to refuel, in order.
+        """
+        return [leg.origin for leg in self.legs if leg.refuel]
+
+
+class NavigationPlanner:
+    """
+    Plans in-system flights with refuel stops.
+
+    Distances between all waypoints of a system are computed once. Each leg uses the fastest
+    of allowed flight modes the ship has fuel for; when the tank is too small, the route goes
+    through MARKETPLACE waypoints and the ship refuels to full at each of them.
+    Every leg maps to ``fleet.flight_mode``, ``fleet.refuel`` (after docking) and
+    ``fleet.navigate`` calls.
+    """
+
+    def __init__(
+        self,
+        waypoints: Iterable[Union[Waypoint, Mapping[str, Any]]],
+        markets: Optional[Iterable[str]] = None,
+    ):
+        symbols: List[str] = []
+        xy: List[Tuple[int, int]] = []
+        marketplaces: Set[str] = set()
+        for waypoint in waypoints:
+            # waypoint models and structs of the struct backend have the same attributes
+            if isinstance(waypoint, Mapping):
+                symbol, x, y = waypoint["symbol"], waypoint["x"], waypoint["y"]
+                traits = [trait["symbol"] for trait in waypoint.get("traits", ())]
+            else:
+                symbol, x, y = waypoint.symbol, waypoint.x, waypoint.y
+                traits = [trait.symbol.value for trait in waypoint.traits]
+            symbols.append(symbol)
+            xy.append((x, y))
+            if WaypointTraitEnum.marketplace.value in traits:
+                marketplaces.add(symbol)
+        if markets is not None:
+            marketplaces = set(markets)
+        self.symbols = symbols
+        self.index = {symbol: index for index, symbol in enumerate(symbols)}
+        self.xy = np.array(xy, dtype=np.float64).reshape(-1, 2)
+        delta = self.xy[:, None, :] - self.xy[None, :, :]
+        self.distances = np.hypot(delta[..., 0], delta[..., 1])
+        self.markets = np.array(
+            sorted(self.index[symbol] for symbol in marketplaces), dtype=np.int64
+        )
+
+    def _to_index(self, waypoint: str) -> int:
+        try:
+            return self.index[waypoint]
+        except KeyError:
+            raise ValueError(f"{waypoint} is not a planned waypoint") from None
+
+    def estimate(
+        self, origin: str, destination: str, speed: float, mode: ShipNavFlightMode
+    ) -> Tuple[int, int]:
+        """
+        Travel time in seconds and fuel of a direct flight.
+        """
+        distance = self.distances[self._to_index(origin), self._to_index(destination)]
+        return int(travel_time(distance, speed, mode)), int(fuel_cost(distance, mode))
+
+    def _legs(
+        self,
+        distances: "np.ndarray",
+        speeds: ArrayLike,
+        budgets: ArrayLike,
+        modes: Sequence[ShipNavFlightMode],
+    ) -> Tuple["np.ndarray", "np.ndarray"]:
+        """
+        Fastest feasible flight time and mode index for every distance,
+        ``speeds`` and ``budgets`` (available fuel) broadcast against ``distances``.
+        """
+        times = np.stack(
+            [
+                np.where(
+                    fuel_cost(distances, mode) <= budgets,
+                    travel_time(distances, speeds, mode),
+                    np.inf,
+                )
+                for mode in modes
+            ]
+        )
+        best = times.argmin(axis=0)
+        return np.take_along_axis(times, best[None], axis=0)[0], best
+
+    def plan(
+        self,
+        origin: str,
+        destination: str,
+        speed: float,
+        fuel: int,
+        capacity: int,
+        modes: Sequence[ShipNavFlightMode] = DEFAULT_MODES,
+    ) -> Optional[NavPlan]:
+        """
+        Fastest route for one ship, or None if it can't get there.
+        """
+        return self.plan_many(
+            [origin], [destination], [speed], [fuel], [capacity], modes
+        )[0]
+
+    def plan_fleet(
+        self,
+        ships: Iterable[ShipSchema],
+        destinations: Mapping[str, str],
+        modes: Sequence[ShipNavFlightMode] = DEFAULT_MODES,
+    ) -> Dict[str, Optional[NavPlan]]:
+        """
+        Fastest routes for ships by symbol, to destinations given by ship symbol.
+        """
+        selected = [ship for ship in ships if ship.symbol in destinations]
+        plans = self.plan_many(
+            [ship.nav.waypoint_symbol for ship in selected],
+            [destinations[ship.symbol] for ship in selected],
+            [ship.engine.speed for ship in selected],
+            [ship.fuel.current for ship in selected],
+            [ship.fuel.capacity for ship in selected],
+            modes,
+        )
+        return {ship.symbol: plan for ship, plan in zip(selected, plans)}
+
+    def plan_many(
+        self,
+        origins: Sequence[str],
+        destinations: Sequence[str],
+        speeds: Sequence[float],
+        fuels: Sequence[int],
+        capacities: Sequence[int],
+        modes: Sequence[ShipNavFlightMode] = DEFAULT_MODES,
+    ) -> List[Optional[NavPlan]]:
+        """
+        Fastest routes for many ships at once.
+
+        Ships are grouped by engine speed and fuel capacity; for each group, routes
+        between markets are solved once and then combined with every ship's
+        first and last legs in a single array operation.
+        """
+        start = np.array([self._to_index(symbol) for symbol in origins], np.int64)
+        end = np.array([self._to_index(symbol) for symbol in destinations], np.int64)
+        speed = np.asarray(speeds, dtype=np.float64)
+        fuel = np.asarray(fuels, dtype=np.float64)
+        capacity = np.asarray(capacities, dtype=np.float64)
+        plans: List[Optional[NavPlan]] = [None] * len(start)
+        if not len(start):
+            return plans
+        groups: Dict[Tuple[float, float], List[int]] = {}
+        for ship, key in enumerate(zip(speed.tolist(), capacity.tolist())):
+            groups.setdefault(key, []).append(ship)
+        for (group_speed, group_capacity), members in groups.items():
+            ships = np.array(members, dtype=np.int64)
+            for ship, plan in zip(
+                members,
+                self._plan_group(
+                    start[ships],
+                    end[ships],
+                    group_speed,
+                    fuel[ships],
+                    group_capacity,
+                    modes,
+                ),
+            ):
+                plans[ship] = plan
+        return plans
+
+    def _plan_group(
+        self,
+        start: "np.ndarray",
+        end: "np.ndarray",
+        speed: float,
+        fuel: "np.ndarray",
+        capacity: float,
+        modes: Sequence[ShipNavFlightMode],
+    ) -> List[Optional[NavPlan]]:
+        # ships without fuel tanks, like probes, fly for free
+        tankless = capacity == 0
+        if tankless:
+            fuel = np.full_like(fuel, np.inf)
+            capacity = np.inf
+        markets = self.markets
+        count, market_count = len(start), len(markets)
+        # first leg with fuel in tank, to every waypoint: (ships, waypoints)
+        first, first_mode = self._legs(
+            self.distances[start], speed, fuel[:, None], modes
+        )
+        direct = first[np.arange(count), end]
+        best = np.zeros(count, dtype=np.int64)
+        best_via = np.full(count, np.inf)
+        if market_count:
+            # legs after refueling at a market: (markets, waypoints)
+            full, full_mode = self._legs(
+                self.distances[markets], speed, capacity, modes
+            )
+            between, following = _all_pairs(full[:, markets])
+            # ships standing at a market can refuel before the first leg
+            to_market = first[:, markets]
+            to_market[start[:, None] == markets[None, :]] = 0
+            # (ships, first market, last market)
+            via = (
+                to_market[:, :, None] + between[None, :, :] + full[:, end].T[:, None, :]
+            ).reshape(count, -1)
+            best = via.argmin(axis=1)
+            best_via = via[np.arange(count), best]
+
+        plans: List[Optional[NavPlan]] = []
+        for ship in range(count):
+            origin, target = int(start[ship]), int(end[ship])
+            legs: List[NavLeg] = []
+            if origin == target:
+                pass
+            elif direct[ship] <= best_via[ship]:
+                if direct[ship] == np.inf:
+                    plans.append(None)
+                    continue
+                mode = modes[first_mode[ship, target]]
+                legs.append(self._leg(origin, target, speed, mode))
+            else:
+                first_market, last_market = divmod(int(best[ship]), market_count)
+                stops = [first_market]
+                while stops[-1] != last_market:
+                    stops.append(int(following[stops[-1], last_market]))
+                waypoints = [int(markets[stop]) for stop in stops]
+                if waypoints[0] != origin:
+                    mode = modes[first_mode[ship, waypoints[0]]]
+                    legs.append(self._leg(origin, waypoints[0], speed, mode))
+                for stop, departure, arrival in zip(
+                    stops, waypoints, waypoints[1:] + [target]
+                ):
+                    mode = modes[full_mode[stop, arrival]]
+                    legs.append(self._leg(departure, arrival, speed, mode, True))
+            if tankless:
+                legs = [leg._replace(fuel=0) for leg in legs]
+            plans.append(NavPlan(legs))
+        return plans
+
+    def _leg(
+        self,
+        origin: int,
+        destination: int,
+        speed: float,
+        mode: ShipNavFlightMode,
+        refuel: bool = False,
+    ) -> NavLeg:
+        distance = float(self.distances[origin, destination])
+        return NavLeg(
+            self.symbols[origin],
+            self.symbols[destination],
+            mode,
+            distance,
+            int(fuel_cost(distance, mode)),
+            int(travel_time(distance, speed, mode)),
+            refuel,
+        )
+
+
+def _all_pairs(times: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Floyd-Warshall over a dense matrix of leg times. Returns fastest times between
+    every pair and the next stop on each fastest route.
+    """
+    count = len(times)
+    times = times.copy()
+    np.fill_diagonal(times, 0)
+    following = np.tile(np.arange(count), (count, 1))
+    for middle in range(count):
+        through = times[:, middle, None] + times[None, middle, :]
+        better = through < times
+        times = np.where(better, through, times)
+        following = np.where(better, following[:, middle, None], following)
+    return times, following
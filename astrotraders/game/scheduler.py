@@ -0,0 +1,294 @@
+import asyncio
+import heapq
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from astrotraders.api.ratelimit import RateLimiter
+from astrotraders.api.schemas import Cooldown, ShipNav, ShipNavStatus
+from astrotraders.api.utils import model_type
+
+# absolute time, delay in seconds, or a model which tells when the ship is free again
+ReadyAt = Union[datetime, float, Cooldown, ShipNav, Any]
+Handler = Callable[[str], ReadyAt]
+AsyncHandler = Callable[[str], Awaitable[ReadyAt]]
+
+
+def ready_at(value: ReadyAt, now: float) -> Optional[float]:
+    """
+    Unix time when a ship can act again, from a handler result:
+
+    * ``None`` - the ship is done and leaves the scheduler;
+    * a number - delay in seconds, ``0`` runs the ship again as soon as possible;
+    * a ``datetime``, a :class:`Cooldown` or a :class:`ShipNav` of a ship in transit,
+      models or structs of the struct backend;
+    * an action result with ``cooldown`` and/or ``nav`` fields, like ``ShipJumpResult``,
+      in which case the later of the two wins.
+    """
+    if value is None:
+        return None
+    if isinstance(value, (int, float)):
+        return now + value
+    if isinstance(value, datetime):
+        return value.timestamp()
+    # a model, or a struct of the struct backend with the same attributes
+    item: Any = value
+    kind = model_type(item)
+    if issubclass(kind, Cooldown):
+        return item.expiration.timestamp()
+    if issubclass(kind, ShipNav):
+        if item.status == ShipNavStatus.in_transit:
+            return item.route.arrival.timestamp()
+        return now
+    times = [
+        ready_at(part, now)
+        for part in (getattr(value, "cooldown", None), getattr(value, "nav", None))
+        if part is not None
+    ]
+    if not times:
+        raise TypeError(f"can't tell when the ship is ready from {value!r}")
+    return max(moment for moment in times if moment is not None)
+
+
+class BaseShipScheduler:
+    """
+    Priority queue of ships keyed by the time they are ready to act again.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        workers: int = 4,
+        on_error: Optional[Callable[[str, Exception], ReadyAt]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        self.rate_limiter = rate_limiter
+        self.workers = workers
+        self.on_error = on_error
+        self._clock = clock
+        self._queue: List[Tuple[float, int, str]] = []
+        self._handlers: Dict[str, Tuple[int, Any]] = {}
+        self._sequence = 0
+        self._running = 0
+        self._stopped = False
+        self.errors: Dict[str, Exception] = {}
+        self.dispatched = 0
+
+    def __len__(self) -> int:
+        return len(self._handlers)
+
+    def __contains__(self, ship: object) -> bool:
+        return ship in self._handlers
+
+    def _push(self, ship: str, handler: Any, at: Optional[float]) -> None:
+        self._sequence += 1
+        self._handlers[ship] = (self._sequence, handler)
+        when = self._clock() if at is None else at
+        heapq.heappush(self._queue, (when, self._sequence, ship))
+
+    def _pop_ready(self) -> Tuple[Optional[Tuple[str, Any]], Optional[float]]:
+        """
+        Take the first ready ship, or return how long to wait for one.
+        Entries of removed or rescheduled ships are dropped on the way.
+        """
+        while self._queue:
+            when, sequence, ship = self._queue[0]
+            entry = self._handlers.get(ship)
+            if entry is None or entry[0] != sequence:
+                heapq.heappop(self._queue)
+                continue
+            delay = when - self._clock()
+            if delay > 0:
+                return None, delay
+            heapq.heappop(self._queue)
+            # stays registered with a sequence no queue entry has while running
+            self._handlers[ship] = (-1, entry[1])
+            return (ship, entry[1]), None
+        return None, None
+
+    def _finish(
+        self, ship: str, handler: Any, result: ReadyAt, error: Optional[Exception]
+    ) -> None:
+        self._running -= 1
+        if self._handlers.get(ship, (None,))[0] != -1:
+            # removed or rescheduled while running
+            return
+        try:
+            if error is not None:
+                if self.on_error is None:
+                    raise error
+                result = self.on_error(ship, error)
+            at = ready_at(result, self._clock())
+        except Exception as e:
+            # failed ships leave the scheduler, the rest keep going
+            self.errors[ship] = e
+            at = None
+        if at is None:
+            del self._handlers[ship]
+        else:
+            self._push(ship, handler, at)
+
+    def _idle(self) -> bool:
+        return self._stopped or (not self._handlers and not self._running)
+
+
+class ShipScheduler(BaseShipScheduler):
+    """
+    Runs ship handlers on a thread pool, each one exactly when its ship is ready.
+
+    A handler gets the ship symbol, performs actions through the client and returns
+    when the ship is ready again (see :func:`ready_at`). Ready ships are dispatched
+    in ready time order, only when a worker is free and the rate limiter has budget,
+    so thousands of ships can share one process without polling.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        workers: int = 4,
+        on_error: Optional[Callable[[str, Exception], ReadyAt]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(rate_limiter, workers, on_error, clock)
+        self._condition = threading.Condition()
+
+    def add(self, ship: str, handler: Handler, at: ReadyAt = 0) -> None:
+        """
+        Schedule a ship, replacing its previous handler.
+        """
+        with self._condition:
+            self._push(ship, handler, ready_at(at, self._clock()))
+            self._condition.notify()
+
+    def remove(self, ship: str) -> None:
+        with self._condition:
+            self._handlers.pop(ship, None)
+            self._condition.notify()
+
+    def stop(self) -> None:
+        with self._condition:
+            self._stopped = True
+            self._condition.notify()
+
+    def _run_one(self, ship: str, handler: Handler) -> None:
+        result: ReadyAt = None
+        error = None
+        try:
+            result = handler(ship)
+        except Exception as e:
+            error = e
+        with self._condition:
+            self._finish(ship, handler, result, error)
+            self._condition.notify()
+
+    def run(self) -> None:
+        """
+        Dispatch ships until none is left or :meth:`stop` is called.
+        """
+        self._stopped = False
+        with ThreadPoolExecutor(self.workers) as executor:
+            while True:
+                with self._condition:
+                    while True:
+                        if self._idle():
+                            return
+                        ready, delay = None, None
+                        if self._running < self.workers:
+                            ready, delay = self._pop_ready()
+                        if ready is not None:
+                            break
+                        self._condition.wait(delay)
+                    self._running += 1
+                    self.dispatched += 1
+                if self.rate_limiter is not None:
+                    # the ship is out of the queue, so nobody else takes its turn
+                    time.sleep(self.rate_limiter.delay())
+                executor.submit(self._run_one, *ready)
+
+
+class AsyncShipScheduler(BaseShipScheduler):
+    """
+    Asyncio counterpart of :class:`ShipScheduler`, where handlers are coroutines
+    and ``workers`` limits how many of them run at once.
+    """
+
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        workers: int = 16,
+        on_error: Optional[Callable[[str, Exception], ReadyAt]] = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        super().__init__(rate_limiter, workers, on_error, clock)
+        self._wakeup: Optional[asyncio.Event] = None
+        self._tasks: set["asyncio.Task[None]"] = set()
+
+    def _notify(self) -> None:
+        if self._wakeup is not None:
+            self._wakeup.set()
+
+    def add(self, ship: str, handler: AsyncHandler, at: ReadyAt = 0) -> None:
+        """
+        Schedule a ship, replacing its previous handler.
+        """
+        self._push(ship, handler, ready_at(at, self._clock()))
+        self._notify()
+
+    def remove(self, ship: str) -> None:
+        self._handlers.pop(ship, None)
+        self._notify()
+
+    def stop(self) -> None:
+        self._stopped = True
+        self._notify()
+
+    async def _run_one(self, ship: str, handler: AsyncHandler) -> None:
+        result: ReadyAt = None
+        error = None
+        try:
+            result = await handler(ship)
+        except Exception as e:
+            error = e
+        self._finish(ship, handler, result, error)
+        self._notify()
+
+    async def run(self) -> None:
+        """
+        Dispatch ships until none is left or :meth:`stop` is called.
+        """
+        self._stopped = False
+        self._wakeup = asyncio.Event()
+        try:
+            while not self._idle():
+                ready, delay = None, None
+                if self._running < self.workers:
+                    ready, delay = self._pop_ready()
+                if ready is None:
+                    self._wakeup.clear()
+                    try:
+                        await asyncio.wait_for(self._wakeup.wait(), delay)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                self._running += 1
+                self.dispatched += 1
+                if self.rate_limiter is not None:
+                    await asyncio.sleep(self.rate_limiter.delay())
+                task = asyncio.ensure_future(self._run_one(*ready))
+                self._tasks.add(task)
+                task.add_done_callback(self._tasks.discard)
+            if self._tasks:
+                await asyncio.gather(*self._tasks)
+        finally:
+            self._wakeup = None
@@ -0,0 +1,202 @@
+from typing import (
+    Dict,
+    List,
+    Optional,
+    Iterable,
+    Mapping,
+    Any,
+    NamedTuple,
+    Tuple,
+    Union,
+)
+
+from astrotraders.api.markets import MarketStore, PricePoint
+from astrotraders.api.schemas import (
+    Market,
+    ShipNavFlightMode,
+    TradeSymbol,
+    Waypoint,
+)
+from astrotraders.game.navigation import fuel_cost, travel_time
+
+try:
+    import numpy as np
+except ImportError as e:  # pragma: no cover
+    raise ImportError(
+        "trade route engine requires numpy, install it with `pip install astrotraders[galaxy]`"
+    ) from e
+
+
+class TradeRoute(NamedTuple):
+    symbol: str
+    buy_waypoint: str
+    sell_waypoint: str
+    buy_price: int
+    sell_price: int
+    units: int
+    # credits earned after fuel
+    profit: float
+    # seconds of flight, including the way to the first market
+    time: float
+
+    @property
+    def profit_per_second(self) -> float:
+        return self.profit / self.time
+
+
+class TradeRouteEngine:
+    """
+    Ranks trade routes by profit per unit of time.
+
+    Latest prices are laid out as ``buy`` and ``sell`` matrices of shape
+    (goods, markets) with NaN where a market doesn't trade a good, and market distances
+    as a (markets, markets) matrix. Ranking works on whole arrays per good, so only markets
+    which actually trade the good take part and no Python loop runs over market pairs.
+    """
+
+    def __init__(
+        self,
+        prices: Iterable[PricePoint],
+        waypoints: Iterable[Union[Waypoint, Mapping[str, Any]]],
+    ):
+        self.coordinates: Dict[str, Tuple[int, int]] = {}
+        for waypoint in waypoints:
+            # waypoint models and structs of the struct backend have the same attributes
+            if isinstance(waypoint, Mapping):
+                self.coordinates[waypoint["symbol"]] = (waypoint["x"], waypoint["y"])
+            else:
+                self.coordinates[waypoint.symbol] = (waypoint.x, waypoint.y)
+        points = [point for point in prices if point.waypoint in self.coordinates]
+        self.symbols = sorted({point.symbol for point in points})
+        self.markets = sorted({point.waypoint for point in points})
+        self.symbol_index = {symbol: index for index, symbol in enumerate(self.symbols)}
+        self.market_index = {symbol: index for index, symbol in enumerate(self.markets)}
+        shape = (len(self.symbols), len(self.markets))
+        self.buy = np.full(shape, np.nan)
+        self.sell = np.full(shape, np.nan)
+        if points:
+            rows = [self.symbol_index[point.symbol] for point in points]
+            columns = [self.market_index[point.waypoint] for point in points]
+            self.buy[rows, columns] = [point.purchase_price for point in points]
+            self.sell[rows, columns] = [point.sell_price for point in points]
+        self.xy = np.array(
+            [self.coordinates[symbol] for symbol in self.markets], dtype=np.float64
+        ).reshape(-1, 2)
+        delta = self.xy[:, None, :] - self.xy[None, :, :]
+        self.distances = np.hypot(delta[..., 0], delta[..., 1])
+
+    @classmethod
+    def from_store(
+        cls,
+        store: MarketStore,
+        waypoints: Iterable[Union[Waypoint, Mapping[str, Any]]],
+        max_age: Optional[float] = None,
+    ) -> "TradeRouteEngine":
+        """
+        Build from latest prices in a market store, optionally only fresh ones.
+        """
+        return cls(store.latest(max_age=max_age), waypoints)
+
+    @classmethod
+    def from_markets(
+        cls,
+        markets: Iterable[Market],
+        waypoints: Iterable[Union[Waypoint, Mapping[str, Any]]],
+    ) -> "TradeRouteEngine":
+        """
+        Build from market responses fetched with a ship present.
+        """
+        return cls(
+            (
+                PricePoint(
+                    market.symbol,
+                    good.symbol,
+                    good.purchase_price,
+                    good.sell_price,
+                    good.supply.value,
+                    good.trade_volume,
+                    0.0,
+                )
+                for market in markets
+                for good in market.trade_goods or ()
+            ),
+            waypoints,
+        )
+
+    def rank(
+        self,
+        capacity: int,
+        speed: float,
+        mode: ShipNavFlightMode = ShipNavFlightMode.cruise,
+        origin: Optional[str] = None,
+        limit: int = 10,
+        fuel_price: float = 0.0,
+        symbols: Optional[Iterable[Union[TradeSymbol, str]]] = None,
+    ) -> List[TradeRoute]:
+        """
+        Most profitable routes per second for a ship carrying ``capacity`` units,
+        best first. With ``origin``, the flight from it to the buying market
+        is counted too. ``fuel_price`` is credits per unit of fuel burned.
+        """
+        origin_time: np.ndarray
+        origin_fuel: np.ndarray
+        if origin is not None:
+            start = np.array(self.coordinates[origin], dtype=np.float64)
+            from_origin = np.hypot(*(self.xy - start).T)
+            origin_time = travel_time(from_origin, speed, mode)
+            if origin in self.market_index:
+                origin_time[self.market_index[origin]] = 0
+            origin_fuel = fuel_cost(from_origin, mode) * (origin_time > 0)
+        else:
+            origin_time = origin_fuel = np.zeros(len(self.markets))
+        if symbols is None:
+            goods: Iterable[int] = range(len(self.symbols))
+        else:
+            names = (getattr(symbol, "value", symbol) for symbol in symbols)
+            goods = [
+                self.symbol_index[name] for name in names if name in self.symbol_index
+            ]
+
+        candidates: List[Tuple[float, int, int, int]] = []
+        for good in goods:
+            (buyers,) = np.nonzero(~np.isnan(self.buy[good]))
+            (sellers,) = np.nonzero(~np.isnan(self.sell[good]))
+            if not len(buyers) or not len(sellers):
+                continue
+            distances = self.distances[np.ix_(buyers, sellers)]
+            time = travel_time(distances, speed, mode) + origin_time[buyers, None]
+            fuel = fuel_cost(distances, mode) + origin_fuel[buyers, None]
+            margin = self.sell[good, sellers][None, :] - self.buy[good, buyers][:, None]
+            profit = capacity * margin - fuel_price * fuel
+            rate = profit / time
+            rate[(profit <= 0) | (buyers[:, None] == sellers[None, :])] = -np.inf
+            flat = rate.ravel()
+            count = min(limit, len(flat))
+            top = np.argpartition(flat, len(flat) - count)[len(flat) - count :]
+            for position in top[np.isfinite(flat[top])]:
+                row, column = divmod(int(position), len(sellers))
+                candidates.append(
+                    (float(flat[position]), good, buyers[row], sellers[column])
+                )
+
+        candidates.sort(key=lambda item: -item[0])
+        routes = []
+        for _, good, buyer, seller in candidates[:limit]:
+            distance = self.distances[buyer, seller]
+            time = float(travel_time(distance, speed, mode) + origin_time[buyer])
+            fuel = float(fuel_cost(distance, mode) + origin_fuel[buyer])
+            buy_price = int(self.buy[good, buyer])
+            sell_price = int(self.sell[good, seller])
+            routes.append(
+                TradeRoute(
+                    self.symbols[good],
+                    self.markets[buyer],
+                    self.markets[seller],
+                    buy_price,
+                    sell_price,
+                    capacity,
+                    capacity * (sell_price - buy_price) - fuel_price * fuel,
+                    time,
+                )
+            )
+        return routes
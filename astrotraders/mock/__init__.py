@@ -0,0 +1,11 @@
+"""
+Local stand-in for the SpaceTraders API, for offline integration and load tests.
+
+    server = MockServer(MockGame(speed=100), rate=None)
+    client = AstroTradersClient.set_up("token", "http://mock/v2", transport=server.transport())
+"""
+
+from astrotraders.mock.game import GameError, MockGame
+from astrotraders.mock.server import MockServer
+
+__all__ = ["GameError", "MockGame", "MockServer"]
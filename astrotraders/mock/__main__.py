@@ -0,0 +1,40 @@
+"""
+Run the mock SpaceTraders API on a socket.
+
+    python -m astrotraders.mock [--port 8000] [--systems 20] [--ships 2] [--speed 1]
+        [--rate 2] [--burst 30]
+
+Any ASGI server can run it too, e.g. ``uvicorn --factory astrotraders.mock:MockServer``.
+"""
+
+import argparse
+
+from astrotraders.mock import MockGame, MockServer
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--systems", type=int, default=20)
+    parser.add_argument("--ships", type=int, default=2)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--speed", type=float, default=1.0, help="game time speedup")
+    parser.add_argument("--rate", type=float, default=2.0, help="0 disables the limit")
+    parser.add_argument("--burst", type=int, default=30)
+    args = parser.parse_args()
+
+    game = MockGame(args.systems, args.ships, args.seed, speed=args.speed)
+    server = MockServer(game, args.rate or None, args.burst)
+    http_server = server.http_server(args.host, args.port)
+    print(f"serving the mock API on http://{args.host}:{args.port}/v2")
+    try:
+        http_server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        http_server.server_close()
+
+
+if __name__ == "__main__":
+    main()
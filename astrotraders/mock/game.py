@@ -0,0 +1,1232 @@
+import math
+import random
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
+
+# seconds per distance unit for engine speed 1, as in astrotraders.game.navigation
+SPEED_MULTIPLIERS = {"CRUISE": 25.0, "DRIFT": 250.0, "BURN": 12.5, "STEALTH": 30.0}
+# seconds of reactor cooldown after an action
+COOLDOWNS = {"extract": 70, "survey": 70, "refine": 60, "scan": 60, "jump": 60}
+# units of the ore consumed and of the good produced by one refine
+REFINE_INPUT = 30
+REFINE_OUTPUT = 10
+SURVEY_LIFETIME = 900
+JUMP_RANGE = 2000
+SCAN_RANGE = 3000
+
+ORES = [
+    "IRON_ORE",
+    "COPPER_ORE",
+    "ALUMINUM_ORE",
+    "SILVER_ORE",
+    "GOLD_ORE",
+    "PLATINUM_ORE",
+    "QUARTZ_SAND",
+    "SILICON_CRYSTALS",
+    "ICE_WATER",
+    "AMMONIA_ICE",
+]
+GOODS = [
+    "FOOD",
+    "FABRICS",
+    "CLOTHING",
+    "MACHINERY",
+    "ELECTRONICS",
+    "MEDICINE",
+    "EQUIPMENT",
+    "PLASTICS",
+    "IRON",
+    "COPPER",
+    "ALUMINUM",
+    "FERTILIZERS",
+]
+REFINED = {
+    "IRON": "IRON_ORE",
+    "COPPER": "COPPER_ORE",
+    "SILVER": "SILVER_ORE",
+    "GOLD": "GOLD_ORE",
+    "ALUMINUM": "ALUMINUM_ORE",
+    "PLATINUM": "PLATINUM_ORE",
+    "URANITE": "URANITE_ORE",
+    "MERITIUM": "MERITIUM_ORE",
+    "FUEL": "HYDROCARBON",
+}
+FACTIONS = {
+    "COSMIC": ("Cosmic Engineers", ["INNOVATIVE", "BOLD", "VISIONARY", "CURIOUS"]),
+    "VOID": ("Voidfarers", ["BOLD", "EXPLORATORY", "ADAPTABLE", "FLEETING"]),
+    "GALACTIC": ("Galactic Alliance", ["COOPERATIVE", "UNITED", "STRATEGIC"]),
+    "QUANTUM": ("Quantum Federation", ["INTELLIGENT", "RESEARCH_FOCUSED"]),
+    "DOMINION": ("Stellar Dominion", ["AGGRESSIVE", "IMPERIALISTIC", "BRUTAL"]),
+}
+SYSTEM_TYPES = ["RED_STAR", "ORANGE_STAR", "WHITE_DWARF", "YOUNG_STAR", "BLUE_STAR"]
+
+
+def _part(symbol: str, **fields: Any) -> Dict[str, Any]:
+    return {
+        "symbol": symbol,
+        "name": symbol.split("_", 1)[1].replace("_", " ").title(),
+        "description": f"{symbol.replace('_', ' ').capitalize()}.",
+        "requirements": {"power": 1, "crew": 1, "slots": 1},
+        **fields,
+    }
+
+
+def _hold(capacity: int) -> Dict[str, Any]:
+    return _part("MODULE_CARGO_HOLD_I", capacity=capacity)
+
+
+def _laser(strength: int) -> Dict[str, Any]:
+    return _part(
+        "MOUNT_MINING_LASER_I",
+        strength=strength,
+        deposits=["IRON_ORE", "COPPER_ORE", "ALUMINUM_ORE", "QUARTZ_SAND", "ICE_WATER"],
+    )
+
+
+# ship types sold by shipyards: role, price, frame fields, reactor power output,
+# engine speed, crew required and capacity, modules and mounts
+SHIP_TYPES: Dict[str, Dict[str, Any]] = {
+    "SHIP_PROBE": {
+        "role": "SATELLITE",
+        "price": 20000,
+        "frame": _part("FRAME_PROBE", moduleSlots=0, mountingPoints=0, fuelCapacity=0),
+        "reactor": _part("REACTOR_SOLAR_I", powerOutput=3),
+        "engine": _part("ENGINE_IMPULSE_DRIVE_I", speed=2),
+        "crew": (0, 0),
+        "modules": [],
+        "mounts": [],
+    },
+    "SHIP_MINING_DRONE": {
+        "role": "EXCAVATOR",
+        "price": 40000,
+        "frame": _part(
+            "FRAME_DRONE", moduleSlots=2, mountingPoints=2, fuelCapacity=100
+        ),
+        "reactor": _part("REACTOR_CHEMICAL_I", powerOutput=15),
+        "engine": _part("ENGINE_IMPULSE_DRIVE_I", speed=2),
+        "crew": (0, 0),
+        "modules": [_hold(15), _part("MODULE_MINERAL_PROCESSOR_I")],
+        "mounts": [_laser(10)],
+    },
+    "SHIP_ORE_HOUND": {
+        "role": "EXCAVATOR",
+        "price": 150000,
+        "frame": _part(
+            "FRAME_MINER", moduleSlots=4, mountingPoints=3, fuelCapacity=400
+        ),
+        "reactor": _part("REACTOR_FISSION_I", powerOutput=31),
+        "engine": _part("ENGINE_ION_DRIVE_I", speed=10),
+        "crew": (20, 30),
+        "modules": [_hold(30), _part("MODULE_CREW_QUARTERS_I", capacity=40)],
+        "mounts": [_laser(25), _part("MOUNT_SURVEYOR_I", strength=1, deposits=ORES)],
+    },
+    "SHIP_LIGHT_HAULER": {
+        "role": "HAULER",
+        "price": 120000,
+        "frame": _part(
+            "FRAME_LIGHT_FREIGHTER", moduleSlots=6, mountingPoints=1, fuelCapacity=1700
+        ),
+        "reactor": _part("REACTOR_FISSION_I", powerOutput=31),
+        "engine": _part("ENGINE_ION_DRIVE_I", speed=10),
+        "crew": (20, 40),
+        "modules": [_hold(30), _hold(30), _part("MODULE_CREW_QUARTERS_I", capacity=40)],
+        "mounts": [_part("MOUNT_SENSOR_ARRAY_I", strength=1)],
+    },
+    "SHIP_REFINING_FREIGHTER": {
+        "role": "REFINERY",
+        "price": 300000,
+        "frame": _part(
+            "FRAME_HEAVY_FREIGHTER", moduleSlots=8, mountingPoints=2, fuelCapacity=2000
+        ),
+        "reactor": _part("REACTOR_FUSION_I", powerOutput=40),
+        "engine": _part("ENGINE_ION_DRIVE_II", speed=20),
+        "crew": (40, 80),
+        "modules": [_hold(30), _hold(30), _part("MODULE_ORE_REFINERY_I")],
+        "mounts": [_part("MOUNT_SENSOR_ARRAY_I", strength=1)],
+    },
+    "SHIP_EXPLORER": {
+        "role": "EXPLORER",
+        "price": 250000,
+        "frame": _part(
+            "FRAME_EXPLORER", moduleSlots=6, mountingPoints=2, fuelCapacity=1500
+        ),
+        "reactor": _part("REACTOR_FUSION_I", powerOutput=40),
+        "engine": _part("ENGINE_ION_DRIVE_II", speed=30),
+        "crew": (30, 60),
+        "modules": [_hold(30), _part("MODULE_WARP_DRIVE_I", range=2000)],
+        "mounts": [
+            _part("MOUNT_SENSOR_ARRAY_II", strength=4),
+            _part("MOUNT_SURVEYOR_I", strength=1, deposits=ORES),
+        ],
+    },
+    "SHIP_COMMAND_FRIGATE": {
+        "role": "COMMAND",
+        "price": 500000,
+        "frame": _part(
+            "FRAME_FRIGATE", moduleSlots=8, mountingPoints=5, fuelCapacity=1200
+        ),
+        "reactor": _part("REACTOR_FISSION_I", powerOutput=31),
+        "engine": _part("ENGINE_ION_DRIVE_II", speed=30),
+        "crew": (57, 80),
+        "modules": [
+            _hold(30),
+            _hold(30),
+            _part("MODULE_CREW_QUARTERS_I", capacity=40),
+            _part("MODULE_MINERAL_PROCESSOR_I"),
+        ],
+        "mounts": [_part("MOUNT_SENSOR_ARRAY_I", strength=1), _laser(10)],
+    },
+}
+
+
+class GameError(Exception):
+    """
+    Failed action, answered with an error body like the SpaceTraders API sends.
+    """
+
+    def __init__(
+        self, status: int, code: int, message: str, data: Optional[dict] = None
+    ):
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+        self.data = data
+
+    def body(self) -> Dict[str, Any]:
+        error: Dict[str, Any] = {"message": self.message, "code": self.code}
+        if self.data is not None:
+            error["data"] = self.data
+        return {"error": error}
+
+
+def not_found(kind: str, symbol: str) -> GameError:
+    return GameError(404, 404, f"{kind} {symbol} not found")
+
+
+def _name(symbol: str) -> str:
+    return symbol.replace("_", " ").title()
+
+
+def _good(symbol: str) -> Dict[str, Any]:
+    return {
+        "symbol": symbol,
+        "name": _name(symbol),
+        "description": f"{_name(symbol)}.",
+    }
+
+
+def _distance(a: Mapping[str, Any], b: Mapping[str, Any]) -> float:
+    return math.hypot(a["x"] - b["x"], a["y"] - b["y"])
+
+
+def _round(value: float) -> int:
+    # the game rounds halves up, round() rounds them to even
+    return int(math.floor(value + 0.5))
+
+
+def travel_time(distance: float, speed: float, mode: str) -> int:
+    """
+    Seconds of flight over ``distance`` with engine ``speed``.
+    """
+    distance = _round(max(distance, 1))
+    return _round(distance * (SPEED_MULTIPLIERS[mode] / speed) + 15)
+
+
+def fuel_cost(distance: float, mode: str) -> int:
+    """
+    Fuel consumed by a flight over ``distance``.
+    """
+    distance = _round(distance)
+    if mode == "DRIFT":
+        return 1
+    if mode == "BURN":
+        return max(2 * distance, 2)
+    return max(distance, 1)
+
+
+class MockGame:
+    """
+    In-memory SpaceTraders game of one agent, generated from ``seed``: ``systems`` systems
+    of six waypoints each with markets, shipyards and jump gates, contracts and a fleet
+    of a command frigate, a probe and ``ships - 2`` mining drones.
+
+    Ship actions check the state the real game does: docking, orbit, fuel, cargo space,
+    credits, travel, which finishes at the arrival time, and reactor cooldowns.
+    Payloads are kept in API format, so they are served without conversion.
+    Durations are divided by ``speed`` and time is read from ``clock``,
+    so tests and load tests don't wait for travel and cooldowns.
+    """
+
+    def __init__(
+        self,
+        systems: int = 20,
+        ships: int = 2,
+        seed: int = 0,
+        agent: str = "MOCK-AGENT",
+        faction: str = "COSMIC",
+        credits: int = 150000,
+        speed: float = 1.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        if systems < 1:
+            raise ValueError("a game needs at least one system")
+        self.speed = speed
+        self._clock = clock
+        self._rng = random.Random(seed)
+        self.systems: Dict[str, Dict[str, Any]] = {}
+        self.waypoints: Dict[str, Dict[str, Any]] = {}
+        self.markets: Dict[str, Dict[str, Any]] = {}
+        self.shipyards: Dict[str, Dict[str, Any]] = {}
+        self.factions = {
+            symbol: self._faction(symbol, name, traits)
+            for symbol, (name, traits) in FACTIONS.items()
+        }
+        for index in range(systems):
+            self._generate_system(index, faction)
+        home = next(iter(self.systems))
+        self.agent: Dict[str, Any] = {
+            "accountId": f"{agent.lower()}-account",
+            "symbol": agent,
+            "headquarters": f"{home}-A1",
+            "credits": credits,
+        }
+        homes = list(self.systems)
+        for index, item in enumerate(self.factions.values()):
+            item["headquarters"] = f"{homes[index % len(homes)]}-A1"
+        self.factions[faction]["headquarters"] = self.agent["headquarters"]
+        self.ships: Dict[str, Dict[str, Any]] = {}
+        # ship symbol to arrival and cooldown expiration, as timestamps
+        self._arrivals: Dict[str, float] = {}
+        self._cooldowns: Dict[str, Tuple[float, int]] = {}
+        self.surveys: Dict[str, Tuple[Dict[str, Any], float]] = {}
+        self.contracts: Dict[str, Dict[str, Any]] = {}
+        self.charts = 0
+        hq = self.agent["headquarters"]
+        self.add_ship("SHIP_COMMAND_FRIGATE", hq)
+        self.add_ship("SHIP_PROBE", hq)
+        for _ in range(ships - 2):
+            self.add_ship("SHIP_MINING_DRONE", f"{home}-B1", status="IN_ORBIT")
+        self._add_contract(faction, hq)
+
+    # generation
+
+    @staticmethod
+    def _faction(symbol: str, name: str, traits: List[str]) -> Dict[str, Any]:
+        return {
+            "symbol": symbol,
+            "name": name,
+            "description": f"{name} faction.",
+            "headquarters": "",
+            "traits": [
+                {
+                    "symbol": trait,
+                    "name": _name(trait),
+                    "description": f"{_name(trait)}.",
+                }
+                for trait in traits
+            ],
+        }
+
+    def _generate_system(self, index: int, faction: str) -> None:
+        rng = self._rng
+        symbol = f"X1-M{index}"
+        # systems get sparser away from the start, all within reach of some gate
+        spread = 600 + 40 * index
+        position = {
+            "x": rng.randint(-spread, spread),
+            "y": rng.randint(-spread, spread),
+        }
+        if index == 0:
+            position = {"x": 0, "y": 0}
+        layout: List[Tuple[str, str, List[str]]] = [
+            ("A1", "PLANET", ["MARKETPLACE", "SHIPYARD", "TEMPERATE"]),
+            ("A2", "MOON", ["BARREN"]),
+            ("B1", "ASTEROID_FIELD", ["MINERAL_DEPOSITS"]),
+            ("C1", "GAS_GIANT", ["JOVIAN"]),
+            ("D1", "ORBITAL_STATION", ["MARKETPLACE"]),
+            ("I1", "JUMP_GATE", []),
+        ]
+        system: Dict[str, Any] = {
+            "symbol": symbol,
+            "sectorSymbol": "X1",
+            "type": rng.choice(SYSTEM_TYPES),
+            **position,
+            "waypoints": [],
+            "factions": [{"symbol": faction}],
+        }
+        for suffix, kind, traits in layout:
+            waypoint_symbol = f"{symbol}-{suffix}"
+            x, y = rng.randint(-60, 60), rng.randint(-60, 60)
+            if kind == "MOON":
+                planet = self.waypoints[f"{symbol}-A1"]
+                x, y = planet["x"], planet["y"]
+            if index and kind == "GAS_GIANT":
+                traits = ["UNCHARTED", *traits]
+            if "SHIPYARD" in traits and index % 3:
+                traits = [trait for trait in traits if trait != "SHIPYARD"]
+            system["waypoints"].append(
+                {"symbol": waypoint_symbol, "type": kind, "x": x, "y": y}
+            )
+            waypoint: Dict[str, Any] = {
+                "symbol": waypoint_symbol,
+                "type": kind,
+                "systemSymbol": symbol,
+                "x": x,
+                "y": y,
+                "orbitals": [],
+                "faction": {"symbol": faction},
+                "traits": [
+                    {
+                        "symbol": trait,
+                        "name": _name(trait),
+                        "description": f"{_name(trait)}.",
+                    }
+                    for trait in traits
+                ],
+            }
+            if "UNCHARTED" not in traits:
+                waypoint["chart"] = {
+                    "waypointSymbol": waypoint_symbol,
+                    "submittedBy": faction,
+                    "submittedOn": "2023-06-01T00:00:00.000Z",
+                }
+            self.waypoints[waypoint_symbol] = waypoint
+            if "MARKETPLACE" in traits:
+                self.markets[waypoint_symbol] = self._market(waypoint_symbol, kind)
+            if "SHIPYARD" in traits:
+                self.shipyards[waypoint_symbol] = {
+                    "symbol": waypoint_symbol,
+                    "shipTypes": [{"type": ship_type} for ship_type in SHIP_TYPES],
+                    "transactions": [],
+                }
+        planet = self.waypoints[f"{symbol}-A1"]
+        planet["orbitals"] = [{"symbol": f"{symbol}-A2"}]
+        self.systems[symbol] = system
+
+    def _market(self, symbol: str, kind: str) -> Dict[str, Any]:
+        rng = self._rng
+        if kind == "ORBITAL_STATION":
+            imports, exports = rng.sample(ORES, 6), rng.sample(GOODS, 2)
+        else:
+            imports, exports = rng.sample(ORES, 2), rng.sample(GOODS, 4)
+        goods = []
+        for good in [*exports, *imports, "FUEL"]:
+            base = 72 if good == "FUEL" else rng.randint(20, 400)
+            if good in exports:
+                base = base * 3 // 4
+            goods.append(
+                {
+                    "symbol": good,
+                    "tradeVolume": 100,
+                    "supply": rng.choice(["SCARCE", "LIMITED", "MODERATE", "ABUNDANT"]),
+                    "purchasePrice": base + base // 10 + 1,
+                    "sellPrice": base,
+                }
+            )
+        return {
+            "symbol": symbol,
+            "exports": [_good(good) for good in exports],
+            "imports": [_good(good) for good in imports],
+            "exchange": [_good("FUEL")],
+            "transactions": [],
+            "tradeGoods": goods,
+        }
+
+    def _add_contract(self, faction: str, destination: str) -> None:
+        number = len(self.contracts) + 1
+        contract_id = f"contract-{number}"
+        good = self._rng.choice(ORES[:3])
+        self.contracts[contract_id] = {
+            "id": contract_id,
+            "factionSymbol": faction,
+            "type": "PROCUREMENT",
+            "terms": {
+                "deadline": self._time(7 * 86400),
+                "payment": {"onAccepted": 5000, "onFulfilled": 30000},
+                "deliver": [
+                    {
+                        "tradeSymbol": good,
+                        "destinationSymbol": destination,
+                        "unitsRequired": 50,
+                        "unitsFulfilled": 0,
+                    }
+                ],
+            },
+            "accepted": False,
+            "fulfilled": False,
+            "expiration": self._time(86400),
+        }
+
+    def add_ship(
+        self, ship_type: str, waypoint: str, status: str = "DOCKED"
+    ) -> Dict[str, Any]:
+        """
+        Add a new ship of ``ship_type`` at ``waypoint`` to the fleet.
+        """
+        template = SHIP_TYPES[ship_type]
+        symbol = f"{self.agent['symbol']}-{len(self.ships) + 1:X}"
+        frame = dict(template["frame"], condition=100)
+        capacity = sum(
+            module.get("capacity", 0)
+            for module in template["modules"]
+            if module["symbol"] == "MODULE_CARGO_HOLD_I"
+        )
+        required, crew_capacity = template["crew"]
+        location = self._route_waypoint(waypoint)
+        ship = {
+            "symbol": symbol,
+            "registration": {
+                "name": symbol,
+                "factionSymbol": self._faction_at(waypoint),
+                "role": template["role"],
+            },
+            "nav": {
+                "systemSymbol": location["systemSymbol"],
+                "waypointSymbol": waypoint,
+                "route": {
+                    "destination": location,
+                    "departure": location,
+                    "departureTime": self._time(),
+                    "arrival": self._time(),
+                },
+                "status": status,
+                "flightMode": "CRUISE",
+            },
+            "crew": {
+                "current": required,
+                "required": required,
+                "capacity": crew_capacity,
+                "rotation": "STRICT",
+                "morale": 100,
+                "wages": 0,
+            },
+            "frame": frame,
+            "reactor": dict(template["reactor"], condition=100),
+            "engine": dict(template["engine"], condition=100),
+            "modules": [dict(module) for module in template["modules"]],
+            "mounts": [dict(mount) for mount in template["mounts"]],
+            "cargo": {"capacity": capacity, "units": 0, "inventory": []},
+            "fuel": {
+                "current": frame["fuelCapacity"],
+                "capacity": frame["fuelCapacity"],
+            },
+        }
+        self.ships[symbol] = ship
+        return ship
+
+    def _faction_at(self, waypoint: str) -> str:
+        return self.waypoint(waypoint)["faction"]["symbol"]
+
+    # time
+
+    def now(self) -> float:
+        return self._clock()
+
+    def _time(self, offset: float = 0.0) -> str:
+        moment = datetime.fromtimestamp(self._clock() + offset, timezone.utc)
+        return moment.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+    def _duration(self, seconds: float) -> float:
+        return seconds / self.speed
+
+    # lookups
+
+    def system(self, symbol: str) -> Dict[str, Any]:
+        try:
+            return self.systems[symbol]
+        except KeyError:
+            raise not_found("System", symbol) from None
+
+    def waypoint(self, symbol: str, system: Optional[str] = None) -> Dict[str, Any]:
+        waypoint = self.waypoints.get(symbol)
+        if (
+            waypoint is None
+            or system is not None
+            and waypoint["systemSymbol"] != system
+        ):
+            raise not_found("Waypoint", symbol)
+        return waypoint
+
+    def system_waypoints(self, system: str) -> List[Dict[str, Any]]:
+        return [
+            self.waypoints[item["symbol"]] for item in self.system(system)["waypoints"]
+        ]
+
+    def faction(self, symbol: str) -> Dict[str, Any]:
+        try:
+            return self.factions[symbol]
+        except KeyError:
+            raise not_found("Faction", symbol) from None
+
+    def contract(self, contract_id: str) -> Dict[str, Any]:
+        try:
+            return self.contracts[contract_id]
+        except KeyError:
+            raise not_found("Contract", contract_id) from None
+
+    def _route_waypoint(self, symbol: str) -> Dict[str, Any]:
+        waypoint = self.waypoint(symbol)
+        return {
+            "symbol": symbol,
+            "type": waypoint["type"],
+            "systemSymbol": waypoint["systemSymbol"],
+            "x": waypoint["x"],
+            "y": waypoint["y"],
+        }
+
+    def _present(self, waypoint: str) -> bool:
+        return any(
+            ship["nav"]["waypointSymbol"] == waypoint
+            and ship["nav"]["status"] != "IN_TRANSIT"
+            for ship in map(self._settle, self.ships.values())
+        )
+
+    def market(self, system: str, waypoint: str) -> Dict[str, Any]:
+        """
+        Market of a waypoint, with prices and transactions only while a ship is there.
+        """
+        self.waypoint(waypoint, system)
+        market = self.markets.get(waypoint)
+        if market is None:
+            raise GameError(404, 4603, f"Market not found at {waypoint}")
+        if self._present(waypoint):
+            return market
+        return {
+            key: value
+            for key, value in market.items()
+            if key not in ("transactions", "tradeGoods")
+        }
+
+    def shipyard(self, system: str, waypoint: str) -> Dict[str, Any]:
+        """
+        Shipyard of a waypoint, with ships for sale only while a ship is there.
+        """
+        self.waypoint(waypoint, system)
+        shipyard = self.shipyards.get(waypoint)
+        if shipyard is None:
+            raise not_found("Shipyard", waypoint)
+        if not self._present(waypoint):
+            return {
+                key: value for key, value in shipyard.items() if key != "transactions"
+            }
+        ships = []
+        for ship_type, template in SHIP_TYPES.items():
+            name = _name(ship_type[len("SHIP_") :])
+            ships.append(
+                {
+                    "type": ship_type,
+                    "name": name,
+                    "description": f"{name} ship.",
+                    "purchasePrice": template["price"],
+                    "frame": template["frame"],
+                    "reactor": template["reactor"],
+                    "engine": template["engine"],
+                    "modules": template["modules"],
+                    "mounts": template["mounts"],
+                }
+            )
+        return {**shipyard, "ships": ships}
+
+    def jump_gate(self, system: str, waypoint: str) -> Dict[str, Any]:
+        if self.waypoint(waypoint, system)["type"] != "JUMP_GATE":
+            raise GameError(400, 4001, f"Waypoint {waypoint} is not a jump gate")
+        return {
+            "jumpRange": JUMP_RANGE,
+            "factionSymbol": self._faction_at(waypoint),
+            "connectedSystems": [
+                {
+                    "symbol": other["symbol"],
+                    "sectorSymbol": other["sectorSymbol"],
+                    "type": other["type"],
+                    "factionSymbol": other["factions"][0]["symbol"],
+                    "x": other["x"],
+                    "y": other["y"],
+                    "distance": _round(distance),
+                }
+                for other, distance in self._nearby(system, JUMP_RANGE)
+            ],
+        }
+
+    def _nearby(self, system: str, reach: float) -> List[Tuple[Dict[str, Any], float]]:
+        origin = self.system(system)
+        found = []
+        for other in self.systems.values():
+            distance = _distance(origin, other)
+            if other is not origin and distance <= reach:
+                found.append((other, distance))
+        return sorted(found, key=lambda item: item[1])
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "status": "SpaceTraders is currently online and available to play",
+            "version": "v2",
+            "resetDate": "2023-06-01",
+            "stats": {
+                "agents": 1,
+                "ships": len(self.ships),
+                "systems": len(self.systems),
+                "waypoints": len(self.waypoints),
+            },
+            "leaderboards": {
+                "mostCredits": [
+                    {
+                        "agentSymbol": self.agent["symbol"],
+                        "credits": self.agent["credits"],
+                    }
+                ],
+                "mostSubmittedCharts": [
+                    {"agentSymbol": self.agent["symbol"], "chartCount": self.charts}
+                ],
+            },
+        }
+
+    # ships
+
+    def _settle(self, ship: Dict[str, Any]) -> Dict[str, Any]:
+        # a flight ends in orbit of the destination once its arrival time has passed
+        nav = ship["nav"]
+        if nav["status"] == "IN_TRANSIT":
+            if self._arrivals.get(ship["symbol"], 0.0) <= self._clock():
+                nav["status"] = "IN_ORBIT"
+        return ship
+
+    def ship(self, symbol: str) -> Dict[str, Any]:
+        ship = self.ships.get(symbol)
+        if ship is None:
+            raise not_found("Ship", symbol)
+        return self._settle(ship)
+
+    def cooldown(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """
+        Reactor cooldown of a ship, or None when there is none.
+        """
+        self.ship(symbol)
+        expiration, total = self._cooldowns.get(symbol, (0.0, 0))
+        remaining = expiration - self._clock()
+        if remaining <= 0:
+            return None
+        return {
+            "shipSymbol": symbol,
+            "totalSeconds": total,
+            "remainingSeconds": math.ceil(remaining),
+            "expiration": self._time(remaining),
+        }
+
+    def _idle(self, symbol: str, status: Optional[str] = None) -> Dict[str, Any]:
+        # ship which isn't travelling and, if given, has the ``status``
+        ship = self.ship(symbol)
+        nav = ship["nav"]
+        if nav["status"] == "IN_TRANSIT":
+            remaining = self._arrivals[symbol] - self._clock()
+            raise GameError(
+                400,
+                4214,
+                f"Ship {symbol} is currently in-transit and can not take this action.",
+                {
+                    "departureSymbol": nav["route"]["departure"]["symbol"],
+                    "destinationSymbol": nav["route"]["destination"]["symbol"],
+                    "arrival": nav["route"]["arrival"],
+                    "departureTime": nav["route"]["departureTime"],
+                    "secondsToArrival": math.ceil(remaining),
+                },
+            )
+        if status == "IN_ORBIT" and nav["status"] != status:
+            raise GameError(
+                400, 4236, f"Ship {symbol} must be in orbit to take this action."
+            )
+        if status == "DOCKED" and nav["status"] != status:
+            raise GameError(
+                400, 4244, f"Ship {symbol} must be docked to take this action."
+            )
+        return ship
+
+    def _cool(self, symbol: str, action: str) -> Dict[str, Any]:
+        # check the reactor is ready and start a new cooldown after ``action``
+        cooldown = self.cooldown(symbol)
+        if cooldown is not None:
+            raise GameError(
+                409,
+                4000,
+                f"Ship action is still on cooldown for {cooldown['remainingSeconds']} "
+                "second(s).",
+                {"cooldown": cooldown},
+            )
+        total = COOLDOWNS[action]
+        self._cooldowns[symbol] = (self._clock() + self._duration(total), total)
+        cooldown = self.cooldown(symbol)
+        assert cooldown is not None
+        return cooldown
+
+    @staticmethod
+    def _has(ship: Dict[str, Any], part: str, prefix: str) -> Optional[Dict[str, Any]]:
+        return next(
+            (item for item in ship[part] if item["symbol"].startswith(prefix)), None
+        )
+
+    def orbit(self, symbol: str) -> Dict[str, Any]:
+        ship = self._idle(symbol)
+        ship["nav"]["status"] = "IN_ORBIT"
+        return {"nav": ship["nav"]}
+
+    def dock(self, symbol: str) -> Dict[str, Any]:
+        ship = self._idle(symbol)
+        ship["nav"]["status"] = "DOCKED"
+        return {"nav": ship["nav"]}
+
+    def flight_mode(self, symbol: str, mode: str) -> Dict[str, Any]:
+        if mode not in SPEED_MULTIPLIERS:
+            raise GameError(422, 422, f"Invalid flight mode {mode}")
+        ship = self.ship(symbol)
+        ship["nav"]["flightMode"] = mode
+        return ship["nav"]
+
+    def _fly(
+        self, ship: Dict[str, Any], destination: str, distance: float
+    ) -> Dict[str, Any]:
+        nav, fuel = ship["nav"], ship["fuel"]
+        mode = nav["flightMode"]
+        cost = fuel_cost(distance, mode) if fuel["capacity"] else 0
+        if cost > fuel["current"]:
+            raise GameError(
+                400,
+                4203,
+                f"Navigate request failed. Ship {ship['symbol']} requires {cost} more "
+                f"fuel for navigation.",
+                {"fuelRequired": cost, "fuelAvailable": fuel["current"]},
+            )
+        seconds = self._duration(travel_time(distance, ship["engine"]["speed"], mode))
+        fuel["current"] -= cost
+        fuel["consumed"] = {"amount": cost, "timestamp": self._time()}
+        nav["route"] = {
+            "departure": self._route_waypoint(nav["waypointSymbol"]),
+            "destination": self._route_waypoint(destination),
+            "departureTime": self._time(),
+            "arrival": self._time(seconds),
+        }
+        nav["waypointSymbol"] = destination
+        nav["systemSymbol"] = self.waypoint(destination)["systemSymbol"]
+        nav["status"] = "IN_TRANSIT"
+        self._arrivals[ship["symbol"]] = self._clock() + seconds
+        return {"fuel": fuel, "nav": nav}
+
+    def navigate(self, symbol: str, destination: str) -> Dict[str, Any]:
+        ship = self._idle(symbol, "IN_ORBIT")
+        origin = self.waypoint(ship["nav"]["waypointSymbol"])
+        target = self.waypoint(destination)
+        if target["systemSymbol"] != origin["systemSymbol"]:
+            raise GameError(
+                400, 4202, f"Waypoint {destination} is outside of the ship's system."
+            )
+        if target is origin:
+            raise GameError(
+                400, 4204, f"Ship {symbol} is already at the destination {destination}."
+            )
+        return self._fly(ship, destination, _distance(origin, target))
+
+    def warp(self, symbol: str, destination: str) -> Dict[str, Any]:
+        ship = self._idle(symbol, "IN_ORBIT")
+        if self._has(ship, "modules", "MODULE_WARP_DRIVE") is None:
+            raise GameError(400, 4241, f"Ship {symbol} doesn't have a warp drive.")
+        origin = self.system(ship["nav"]["systemSymbol"])
+        target = self.system(self.waypoint(destination)["systemSymbol"])
+        if target is origin:
+            raise GameError(400, 4235, "Use navigate to travel within a system.")
+        return self._fly(ship, destination, _distance(origin, target))
+
+    def jump(self, symbol: str, system: str) -> Dict[str, Any]:
+        ship = self._idle(symbol, "IN_ORBIT")
+        nav = ship["nav"]
+        if self.waypoint(nav["waypointSymbol"])["type"] != "JUMP_GATE":
+            raise GameError(400, 4211, f"Ship {symbol} must be at a jump gate to jump.")
+        target = self.system(system)
+        if target["symbol"] == nav["systemSymbol"]:
+            raise GameError(400, 4208, f"Ship {symbol} is already in {system}.")
+        reachable = self._nearby(nav["systemSymbol"], JUMP_RANGE)
+        if not any(other is target for other, _ in reachable):
+            raise GameError(400, 4207, f"System {system} is out of the gate's range.")
+        cooldown = self._cool(symbol, "jump")
+        gate = f"{system}-I1"
+        departure = self._route_waypoint(nav["waypointSymbol"])
+        nav["route"] = {
+            "departure": departure,
+            "destination": self._route_waypoint(gate),
+            "departureTime": self._time(),
+            "arrival": self._time(),
+        }
+        nav["systemSymbol"] = system
+        nav["waypointSymbol"] = gate
+        return {"cooldown": cooldown, "nav": nav}
+
+    def refuel(self, symbol: str) -> Dict[str, Any]:
+        ship = self._idle(symbol, "DOCKED")
+        fuel = ship["fuel"]
+        waypoint = ship["nav"]["waypointSymbol"]
+        price = self._price(waypoint, "FUEL", "purchasePrice")
+        # markets sell fuel in units of 100
+        units = math.ceil((fuel["capacity"] - fuel["current"]) / 100)
+        total = units * price
+        self._pay(total)
+        fuel["current"] = fuel["capacity"]
+        self._record(waypoint, symbol, "FUEL", "PURCHASE", units, price)
+        return {"agent": self.agent, "fuel": fuel}
+
+    # cargo
+
+    def _price(self, waypoint: str, good: str, kind: str) -> int:
+        market = self.markets.get(waypoint)
+        if market is None:
+            raise GameError(404, 4603, f"Market not found at {waypoint}")
+        for item in market["tradeGoods"]:
+            if item["symbol"] == good:
+                return item[kind]
+        if kind == "sellPrice":
+            raise GameError(400, 4602, f"Market at {waypoint} doesn't buy {good}.")
+        raise GameError(400, 4601, f"Market at {waypoint} doesn't sell {good}.")
+
+    def _pay(self, total: int) -> None:
+        if total > self.agent["credits"]:
+            raise GameError(
+                400,
+                4600,
+                f"Agent has insufficient funds, {total} credits required.",
+                {"creditsAvailable": self.agent["credits"], "totalPrice": total},
+            )
+        self.agent["credits"] -= total
+
+    def _record(
+        self, waypoint: str, ship: str, good: str, kind: str, units: int, price: int
+    ) -> Dict[str, Any]:
+        transaction = {
+            "waypointSymbol": waypoint,
+            "shipSymbol": ship,
+            "tradeSymbol": good,
+            "type": kind,
+            "units": units,
+            "pricePerUnit": price,
+            "totalPrice": units * price,
+            "timestamp": self._time(),
+        }
+        transactions = self.markets[waypoint]["transactions"]
+        transactions.append(transaction)
+        del transactions[:-50]
+        return transaction
+
+    @staticmethod
+    def _add_cargo(ship: Dict[str, Any], good: str, units: int) -> None:
+        cargo = ship["cargo"]
+        if cargo["units"] + units > cargo["capacity"]:
+            raise GameError(
+                400,
+                4228,
+                f"Ship {ship['symbol']} cargo hold can't fit {units} more units.",
+                {"cargoCapacity": cargo["capacity"], "cargoUnits": cargo["units"]},
+            )
+        cargo["units"] += units
+        for item in cargo["inventory"]:
+            if item["symbol"] == good:
+                item["units"] += units
+                return
+        cargo["inventory"].append({**_good(good), "units": units})
+
+    @staticmethod
+    def _remove_cargo(ship: Dict[str, Any], good: str, units: int) -> None:
+        cargo = ship["cargo"]
+        for index, item in enumerate(cargo["inventory"]):
+            if item["symbol"] == good:
+                break
+        else:
+            raise GameError(
+                400, 4218, f"Ship {ship['symbol']} doesn't have {good} in its cargo."
+            )
+        if units < 1 or units > item["units"]:
+            raise GameError(
+                400,
+                4219,
+                f"Ship {ship['symbol']} has {item['units']} units of {good}, "
+                f"can't remove {units}.",
+            )
+        item["units"] -= units
+        cargo["units"] -= units
+        if not item["units"]:
+            del cargo["inventory"][index]
+
+    def purchase_cargo(self, symbol: str, good: str, units: int) -> Dict[str, Any]:
+        ship = self._idle(symbol, "DOCKED")
+        waypoint = ship["nav"]["waypointSymbol"]
+        price = self._price(waypoint, good, "purchasePrice")
+        if units > 100:
+            raise GameError(400, 4604, "Trade volume of the market is 100 units.")
+        self._add_cargo(ship, good, units)
+        try:
+            self._pay(units * price)
+        except GameError:
+            self._remove_cargo(ship, good, units)
+            raise
+        transaction = self._record(waypoint, symbol, good, "PURCHASE", units, price)
+        return {"agent": self.agent, "cargo": ship["cargo"], "transaction": transaction}
+
+    def sell_cargo(self, symbol: str, good: str, units: int) -> Dict[str, Any]:
+        ship = self._idle(symbol, "DOCKED")
+        waypoint = ship["nav"]["waypointSymbol"]
+        price = self._price(waypoint, good, "sellPrice")
+        self._remove_cargo(ship, good, units)
+        self.agent["credits"] += units * price
+        transaction = self._record(waypoint, symbol, good, "SELL", units, price)
+        return {"agent": self.agent, "cargo": ship["cargo"], "transaction": transaction}
+
+    def jettison(self, symbol: str, good: str, units: int) -> Dict[str, Any]:
+        ship = self._idle(symbol)
+        self._remove_cargo(ship, good, units)
+        return {"cargo": ship["cargo"]}
+
+    def transfer(
+        self, symbol: str, good: str, units: int, target: str
+    ) -> Dict[str, Any]:
+        ship = self._idle(symbol)
+        if target not in self.ships:
+            raise GameError(404, 4231, f"Ship {target} not found.")
+        if target == symbol:
+            raise GameError(400, 4233, "Can't transfer cargo to the same ship.")
+        other = self._idle(target)
+        if other["nav"]["waypointSymbol"] != ship["nav"]["waypointSymbol"]:
+            raise GameError(400, 4234, "Ships must be at the same waypoint.")
+        self._remove_cargo(ship, good, units)
+        try:
+            self._add_cargo(other, good, units)
+        except GameError:
+            self._add_cargo(ship, good, units)
+            raise
+        return {"cargo": ship["cargo"]}
+
+    # extraction
+
+    def survey(self, symbol: str) -> Dict[str, Any]:
+        ship = self._idle(symbol, "IN_ORBIT")
+        surveyor = self._has(ship, "mounts", "MOUNT_SURVEYOR")
+        if surveyor is None:
+            raise GameError(400, 4240, f"Ship {symbol} doesn't have a surveyor.")
+        waypoint = ship["nav"]["waypointSymbol"]
+        if self.waypoint(waypoint)["type"] != "ASTEROID_FIELD":
+            raise GameError(400, 4222, f"Waypoint {waypoint} can't be surveyed.")
+        cooldown = self._cool(symbol, "survey")
+        expiration = self._clock() + self._duration(SURVEY_LIFETIME)
+        surveys = []
+        for _ in range(surveyor["strength"] + 1):
+            survey = {
+                "signature": f"{waypoint}-{self._rng.getrandbits(32):08X}",
+                "symbol": waypoint,
+                "deposits": [{"symbol": self._rng.choice(ORES[:5])} for _ in range(5)],
+                "expiration": self._time(expiration - self._clock()),
+                "size": self._rng.choice(["SMALL", "MODERATE", "LARGE"]),
+            }
+            self.surveys[survey["signature"]] = survey, expiration
+            surveys.append(survey)
+        return {"cooldown": cooldown, "surveys": surveys}
+
+    def extract(
+        self, symbol: str, survey: Optional[Mapping[str, Any]] = None
+    ) -> Dict[str, Any]:
+        ship = self._idle(symbol, "IN_ORBIT")
+        laser = self._has(ship, "mounts", "MOUNT_MINING_LASER")
+        if laser is None:
+            raise GameError(400, 4243, f"Ship {symbol} doesn't have a mining laser.")
+        waypoint = ship["nav"]["waypointSymbol"]
+        if self.waypoint(waypoint)["type"] != "ASTEROID_FIELD":
+            raise GameError(
+                400, 4205, f"Waypoint {waypoint} has no resources to extract."
+            )
+        deposits = laser["deposits"]
+        if survey is not None:
+            known = self.surveys.get(survey.get("signature", ""))
+            if known is None or known[0]["symbol"] != waypoint:
+                raise GameError(400, 4220, "Survey is not valid for this waypoint.")
+            if known[1] <= self._clock():
+                raise GameError(400, 4221, "Survey has expired.")
+            deposits = [deposit["symbol"] for deposit in known[0]["deposits"]]
+        cargo = ship["cargo"]
+        if cargo["units"] >= cargo["capacity"]:
+            raise GameError(
+                400, 4228, f"Ship {symbol} cargo hold is full.", {"shipSymbol": symbol}
+            )
+        cooldown = self._cool(symbol, "extract")
+        good = self._rng.choice(deposits)
+        units = min(
+            cargo["capacity"] - cargo["units"],
+            self._rng.randint(1, laser["strength"]),
+        )
+        self._add_cargo(ship, good, units)
+        return {
+            "cooldown": cooldown,
+            "extraction": {
+                "shipSymbol": symbol,
+                "yield": {"symbol": good, "units": units},
+            },
+            "cargo": cargo,
+        }
+
+    def refine(self, symbol: str, produce: str) -> Dict[str, Any]:
+        ship = self._idle(symbol)
+        if self._has(ship, "modules", "MODULE_ORE_REFINERY") is None:
+            raise GameError(400, 4239, f"Ship {symbol} doesn't have a refinery.")
+        source = REFINED.get(produce)
+        if source is None:
+            raise GameError(400, 4237, f"{produce} can't be refined.")
+        self._cool(symbol, "refine")
+        try:
+            self._remove_cargo(ship, source, REFINE_INPUT)
+            self._add_cargo(ship, produce, REFINE_OUTPUT)
+        except GameError:
+            del self._cooldowns[symbol]
+            raise
+        return {
+            "cargo": ship["cargo"],
+            "cooldown": self.cooldown(symbol),
+            "produced": [{"tradeSymbol": produce, "units": REFINE_OUTPUT}],
+            "consumed": [{"tradeSymbol": source, "units": REFINE_INPUT}],
+        }
+
+    # exploration
+
+    def chart(self, symbol: str) -> Dict[str, Any]:
+        ship = self._idle(symbol)
+        waypoint = self.waypoint(ship["nav"]["waypointSymbol"])
+        if "chart" in waypoint:
+            raise GameError(
+                400, 4230, f"Waypoint {waypoint['symbol']} is already charted."
+            )
+        waypoint["traits"] = [
+            trait for trait in waypoint["traits"] if trait["symbol"] != "UNCHARTED"
+        ]
+        waypoint["chart"] = {
+            "waypointSymbol": waypoint["symbol"],
+            "submittedBy": self.agent["symbol"],
+            "submittedOn": self._time(),
+        }
+        self.charts += 1
+        return {"chart": waypoint["chart"], "waypoint": waypoint}
+
+    def _sensors(self, symbol: str) -> Dict[str, Any]:
+        ship = self._idle(symbol)
+        if self._has(ship, "mounts", "MOUNT_SENSOR_ARRAY") is None:
+            raise GameError(400, 4215, f"Ship {symbol} doesn't have sensor arrays.")
+        return ship
+
+    def scan_systems(self, symbol: str) -> Dict[str, Any]:
+        ship = self._sensors(symbol)
+        cooldown = self._cool(symbol, "scan")
+        systems = [
+            {
+                "symbol": other["symbol"],
+                "sectorSymbol": other["sectorSymbol"],
+                "type": other["type"],
+                "x": other["x"],
+                "y": other["y"],
+                "distance": _round(distance),
+            }
+            for other, distance in self._nearby(ship["nav"]["systemSymbol"], SCAN_RANGE)
+        ]
+        return {"cooldown": cooldown, "systems": systems}
+
+    def scan_waypoints(self, symbol: str) -> Dict[str, Any]:
+        ship = self._sensors(symbol)
+        cooldown = self._cool(symbol, "scan")
+        waypoints = self.system_waypoints(ship["nav"]["systemSymbol"])
+        return {"cooldown": cooldown, "waypoints": waypoints}
+
+    def scan_ships(self, symbol: str) -> Dict[str, Any]:
+        ship = self._sensors(symbol)
+        cooldown = self._cool(symbol, "scan")
+        system = ship["nav"]["systemSymbol"]
+        ships = [
+            {
+                "symbol": other["symbol"],
+                "registration": other["registration"],
+                "nav": other["nav"],
+                "frame": {"symbol": other["frame"]["symbol"]},
+                "reactor": {"symbol": other["reactor"]["symbol"]},
+                "engine": {"symbol": other["engine"]["symbol"]},
+                "mounts": [{"symbol": mount["symbol"]} for mount in other["mounts"]],
+            }
+            for other in map(self._settle, self.ships.values())
+            if other is not ship and other["nav"]["systemSymbol"] == system
+        ]
+        return {"cooldown": cooldown, "ships": ships}
+
+    def purchase_ship(self, ship_type: str, waypoint: str) -> Dict[str, Any]:
+        shipyard = self.shipyards.get(waypoint)
+        if shipyard is None:
+            raise not_found("Shipyard", waypoint)
+        template = SHIP_TYPES.get(ship_type)
+        if template is None:
+            raise GameError(
+                400, 4245, f"Shipyard at {waypoint} doesn't sell {ship_type}."
+            )
+        if not self._present(waypoint):
+            raise GameError(
+                400, 4245, f"A ship must be present at {waypoint} to purchase a ship."
+            )
+        self._pay(template["price"])
+        ship = self.add_ship(ship_type, waypoint)
+        transaction = {
+            "waypointSymbol": waypoint,
+            "shipSymbol": ship["symbol"],
+            "price": template["price"],
+            "agentSymbol": self.agent["symbol"],
+            "timestamp": self._time(),
+        }
+        shipyard["transactions"].append(transaction)
+        del shipyard["transactions"][:-50]
+        return {"agent": self.agent, "ship": ship, "transaction": transaction}
+
+    # contracts
+
+    def accept(self, contract_id: str) -> Dict[str, Any]:
+        contract = self.contract(contract_id)
+        if contract["accepted"]:
+            raise GameError(400, 4501, f"Contract {contract_id} is already accepted.")
+        contract["accepted"] = True
+        self.agent["credits"] += contract["terms"]["payment"]["onAccepted"]
+        return {"agent": self.agent, "contract": contract}
+
+    def deliver(
+        self, contract_id: str, symbol: str, good: str, units: int
+    ) -> Dict[str, Any]:
+        contract = self.contract(contract_id)
+        if not contract["accepted"]:
+            raise GameError(400, 4505, f"Contract {contract_id} is not accepted.")
+        if contract["fulfilled"]:
+            raise GameError(400, 4504, f"Contract {contract_id} is already fulfilled.")
+        ship = self._idle(symbol, "DOCKED")
+        for term in contract["terms"]["deliver"]:
+            if term["tradeSymbol"] == good:
+                break
+        else:
+            raise GameError(
+                400, 4508, f"Contract {contract_id} doesn't require {good}."
+            )
+        if ship["nav"]["waypointSymbol"] != term["destinationSymbol"]:
+            raise GameError(
+                400, 4510, f"{good} must be delivered to {term['destinationSymbol']}."
+            )
+        if term["unitsFulfilled"] + units > term["unitsRequired"]:
+            raise GameError(400, 4509, f"Contract {contract_id} needs fewer units.")
+        self._remove_cargo(ship, good, units)
+        term["unitsFulfilled"] += units
+        return {"contract": contract, "cargo": ship["cargo"]}
+
+    def fulfill(self, contract_id: str) -> Dict[str, Any]:
+        contract = self.contract(contract_id)
+        if not contract["accepted"]:
+            raise GameError(400, 4505, f"Contract {contract_id} is not accepted.")
+        if contract["fulfilled"]:
+            raise GameError(400, 4504, f"Contract {contract_id} is already fulfilled.")
+        if any(
+            term["unitsFulfilled"] < term["unitsRequired"]
+            for term in contract["terms"]["deliver"]
+        ):
+            raise GameError(400, 4502, f"Contract {contract_id} terms are not met.")
+        contract["fulfilled"] = True
+        self.agent["credits"] += contract["terms"]["payment"]["onFulfilled"]
+        return {"agent": self.agent, "contract": contract}
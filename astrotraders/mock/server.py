@@ -0,0 +1,586 @@
+import re
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    NamedTuple,
+    Optional,
+    Pattern,
+    Tuple,
+)
+from urllib.parse import parse_qsl
+
+import httpx
+import orjson
+
+from astrotraders.api.ratelimit import RateLimiter
+from astrotraders.mock.game import GameError, MockGame
+
+# the real API lives under /v2, the mock answers with and without it
+PREFIX = "/v2"
+MAX_LIMIT = 20
+
+
+class Call(NamedTuple):
+    # values of the path placeholders, query parameters and JSON body of a request
+    args: Dict[str, str]
+    params: Mapping[str, str]
+    body: Dict[str, Any]
+
+
+Reply = Tuple[int, Any]
+Handler = Callable[[MockGame, Call], Reply]
+
+
+class Route(NamedTuple):
+    method: str
+    pattern: Pattern[str]
+    handler: Handler
+
+
+ROUTES: List[Route] = []
+
+
+def route(method: str, path: str) -> Callable[[Handler], Handler]:
+    """
+    Register a handler for requests to ``path``, where ``{name}`` matches a path segment.
+    """
+    pattern = re.compile("^" + re.sub(r"{(\w+)}", r"(?P<\1>[^/]+)", path) + "$")
+
+    def register(handler: Handler) -> Handler:
+        ROUTES.append(Route(method, pattern, handler))
+        return handler
+
+    return register
+
+
+def ok(data: Any, status: int = 200) -> Reply:
+    return status, {"data": data}
+
+
+def page(items: List[Any], params: Mapping[str, str]) -> Reply:
+    try:
+        number, limit = int(params.get("page", 1)), int(params.get("limit", 10))
+    except ValueError:
+        raise GameError(422, 422, "page and limit must be integers") from None
+    if number < 1 or not 1 <= limit <= MAX_LIMIT:
+        raise GameError(
+            422, 422, f"page must be positive and limit between 1 and {MAX_LIMIT}"
+        )
+    start = (number - 1) * limit
+    return 200, {
+        "data": items[start : start + limit],
+        "meta": {"total": len(items), "page": number, "limit": limit},
+    }
+
+
+def field(call: Call, name: str, kind: type = str) -> Any:
+    value = call.body.get(name)
+    if not isinstance(value, kind) or isinstance(value, bool):
+        raise GameError(
+            422,
+            422,
+            "Request body failed validation.",
+            {name: [f"{name} must be {kind.__name__}"]},
+        )
+    return value
+
+
+@route("GET", "/")
+def stats(game: MockGame, call: Call) -> Reply:
+    return 200, game.stats()
+
+
+@route("GET", "/my/agent")
+def agent(game: MockGame, call: Call) -> Reply:
+    return ok(game.agent)
+
+
+@route("GET", "/systems")
+def systems(game: MockGame, call: Call) -> Reply:
+    return page(list(game.systems.values()), call.params)
+
+
+@route("GET", "/systems.json")
+def systems_json(game: MockGame, call: Call) -> Reply:
+    return 200, list(game.systems.values())
+
+
+@route("GET", "/systems/{system}")
+def system(game: MockGame, call: Call) -> Reply:
+    return ok(game.system(call.args["system"]))
+
+
+@route("GET", "/systems/{system}/waypoints")
+def waypoints(game: MockGame, call: Call) -> Reply:
+    return page(game.system_waypoints(call.args["system"]), call.params)
+
+
+@route("GET", "/systems/{system}/waypoints/{waypoint}")
+def waypoint(game: MockGame, call: Call) -> Reply:
+    return ok(game.waypoint(call.args["waypoint"], call.args["system"]))
+
+
+@route("GET", "/systems/{system}/waypoints/{waypoint}/market")
+def market(game: MockGame, call: Call) -> Reply:
+    return ok(game.market(call.args["system"], call.args["waypoint"]))
+
+
+@route("GET", "/systems/{system}/waypoints/{waypoint}/shipyard")
+def shipyard(game: MockGame, call: Call) -> Reply:
+    return ok(game.shipyard(call.args["system"], call.args["waypoint"]))
+
+
+@route("GET", "/systems/{system}/waypoints/{waypoint}/jump-gate")
+def jump_gate(game: MockGame, call: Call) -> Reply:
+    return ok(game.jump_gate(call.args["system"], call.args["waypoint"]))
+
+
+@route("GET", "/factions")
+def factions(game: MockGame, call: Call) -> Reply:
+    return page(list(game.factions.values()), call.params)
+
+
+@route("GET", "/factions/{faction}")
+def faction(game: MockGame, call: Call) -> Reply:
+    return ok(game.faction(call.args["faction"]))
+
+
+@route("GET", "/my/contracts")
+def contracts(game: MockGame, call: Call) -> Reply:
+    return page(list(game.contracts.values()), call.params)
+
+
+@route("GET", "/my/contracts/{contract}")
+def contract(game: MockGame, call: Call) -> Reply:
+    return ok(game.contract(call.args["contract"]))
+
+
+@route("POST", "/my/contracts/{contract}/accept")
+def accept(game: MockGame, call: Call) -> Reply:
+    return ok(game.accept(call.args["contract"]))
+
+
+@route("POST", "/my/contracts/{contract}/deliver")
+def deliver(game: MockGame, call: Call) -> Reply:
+    return ok(
+        game.deliver(
+            call.args["contract"],
+            field(call, "shipSymbol"),
+            field(call, "tradeSymbol"),
+            field(call, "units", int),
+        )
+    )
+
+
+@route("POST", "/my/contracts/{contract}/fulfill")
+def fulfill(game: MockGame, call: Call) -> Reply:
+    return ok(game.fulfill(call.args["contract"]))
+
+
+@route("GET", "/my/ships")
+def ships(game: MockGame, call: Call) -> Reply:
+    return page([game.ship(symbol) for symbol in game.ships], call.params)
+
+
+@route("POST", "/my/ships")
+def purchase_ship(game: MockGame, call: Call) -> Reply:
+    result = game.purchase_ship(field(call, "shipType"), field(call, "waypointSymbol"))
+    return ok(result, 201)
+
+
+@route("GET", "/my/ships/{ship}")
+def ship(game: MockGame, call: Call) -> Reply:
+    return ok(game.ship(call.args["ship"]))
+
+
+@route("GET", "/my/ships/{ship}/cargo")
+def cargo(game: MockGame, call: Call) -> Reply:
+    return ok(game.ship(call.args["ship"])["cargo"])
+
+
+@route("GET", "/my/ships/{ship}/nav")
+def nav(game: MockGame, call: Call) -> Reply:
+    return ok(game.ship(call.args["ship"])["nav"])
+
+
+@route("PATCH", "/my/ships/{ship}/nav")
+def flight_mode(game: MockGame, call: Call) -> Reply:
+    return ok(game.flight_mode(call.args["ship"], field(call, "flightMode")))
+
+
+@route("GET", "/my/ships/{ship}/cooldown")
+def cooldown(game: MockGame, call: Call) -> Reply:
+    value = game.cooldown(call.args["ship"])
+    if value is None:
+        return 204, None
+    return ok(value)
+
+
+@route("POST", "/my/ships/{ship}/orbit")
+def orbit(game: MockGame, call: Call) -> Reply:
+    return ok(game.orbit(call.args["ship"]))
+
+
+@route("POST", "/my/ships/{ship}/dock")
+def dock(game: MockGame, call: Call) -> Reply:
+    return ok(game.dock(call.args["ship"]))
+
+
+@route("POST", "/my/ships/{ship}/navigate")
+def navigate(game: MockGame, call: Call) -> Reply:
+    return ok(game.navigate(call.args["ship"], field(call, "waypointSymbol")))
+
+
+@route("POST", "/my/ships/{ship}/warp")
+def warp(game: MockGame, call: Call) -> Reply:
+    return ok(game.warp(call.args["ship"], field(call, "waypointSymbol")))
+
+
+@route("POST", "/my/ships/{ship}/jump")
+def jump(game: MockGame, call: Call) -> Reply:
+    return ok(game.jump(call.args["ship"], field(call, "systemSymbol")))
+
+
+@route("POST", "/my/ships/{ship}/refuel")
+def refuel(game: MockGame, call: Call) -> Reply:
+    return ok(game.refuel(call.args["ship"]))
+
+
+@route("POST", "/my/ships/{ship}/purchase")
+def purchase_cargo(game: MockGame, call: Call) -> Reply:
+    return ok(
+        game.purchase_cargo(
+            call.args["ship"], field(call, "symbol"), field(call, "units", int)
+        ),
+        201,
+    )
+
+
+@route("POST", "/my/ships/{ship}/sell")
+def sell_cargo(game: MockGame, call: Call) -> Reply:
+    return ok(
+        game.sell_cargo(
+            call.args["ship"], field(call, "symbol"), field(call, "units", int)
+        ),
+        201,
+    )
+
+
+@route("POST", "/my/ships/{ship}/jettison")
+def jettison(game: MockGame, call: Call) -> Reply:
+    return ok(
+        game.jettison(
+            call.args["ship"], field(call, "symbol"), field(call, "units", int)
+        )
+    )
+
+
+@route("POST", "/my/ships/{ship}/transfer")
+def transfer(game: MockGame, call: Call) -> Reply:
+    return ok(
+        game.transfer(
+            call.args["ship"],
+            field(call, "tradeSymbol"),
+            field(call, "units", int),
+            field(call, "shipSymbol"),
+        )
+    )
+
+
+@route("POST", "/my/ships/{ship}/survey")
+def survey(game: MockGame, call: Call) -> Reply:
+    return ok(game.survey(call.args["ship"]), 201)
+
+
+@route("POST", "/my/ships/{ship}/extract")
+def extract(game: MockGame, call: Call) -> Reply:
+    survey = call.body.get("survey")
+    if survey is not None and not isinstance(survey, dict):
+        raise GameError(422, 422, "survey must be an object")
+    return ok(game.extract(call.args["ship"], survey), 201)
+
+
+@route("POST", "/my/ships/{ship}/refine")
+def refine(game: MockGame, call: Call) -> Reply:
+    return ok(game.refine(call.args["ship"], field(call, "produce")))
+
+
+@route("POST", "/my/ships/{ship}/chart")
+def chart(game: MockGame, call: Call) -> Reply:
+    return ok(game.chart(call.args["ship"]), 201)
+
+
+@route("POST", "/my/ships/{ship}/scan/systems")
+def scan_systems(game: MockGame, call: Call) -> Reply:
+    return ok(game.scan_systems(call.args["ship"]), 201)
+
+
+@route("POST", "/my/ships/{ship}/scan/waypoints")
+def scan_waypoints(game: MockGame, call: Call) -> Reply:
+    return ok(game.scan_waypoints(call.args["ship"]), 201)
+
+
+@route("POST", "/my/ships/{ship}/scan/ships")
+def scan_ships(game: MockGame, call: Call) -> Reply:
+    return ok(game.scan_ships(call.args["ship"]), 201)
+
+
+Response = Tuple[int, Dict[str, str], bytes]
+
+
+class MockServer:
+    """
+    Local stand-in for the SpaceTraders API serving a :class:`MockGame`.
+
+    It answers every endpoint the resources use, checks the bearer token of ``/my``
+    endpoints and limits requests like the real server does, ``rate`` per second
+    with a pool of ``burst`` extra requests per ``burst_period`` seconds, answering
+    429 with the time to wait. Pass ``rate=None`` to disable the limit.
+
+    The server is an ASGI application, so it runs under any ASGI server
+    or in-process with ``httpx.ASGITransport``. :meth:`transport` serves sync
+    and async httpx clients without a network and :meth:`serve` listens on a socket.
+    """
+
+    def __init__(
+        self,
+        game: Optional[MockGame] = None,
+        rate: Optional[float] = 2.0,
+        burst: int = 30,
+        burst_period: float = 60.0,
+    ):
+        self.game = game if game is not None else MockGame()
+        self.rate_limiter = (
+            RateLimiter(rate, burst, burst_period, clock=self.game.now)
+            if rate is not None
+            else None
+        )
+        self.requests = 0
+        self.rate_limited = 0
+        self._lock = threading.Lock()
+
+    def _limit_headers(self) -> Dict[str, str]:
+        limiter = self.rate_limiter
+        if limiter is None:
+            return {}
+        return {
+            "x-ratelimit-type": "IP-based",
+            "x-ratelimit-limit-per-second": str(limiter.rate),
+            "x-ratelimit-limit-burst": str(limiter.burst),
+            "x-ratelimit-burst-duration": str(limiter.burst_period),
+        }
+
+    def _throttle(self) -> Optional[Reply]:
+        # reject the request, without taking a token, if the budget is spent
+        limiter = self.rate_limiter
+        if limiter is None:
+            return None
+        wait = limiter.delay()
+        if wait <= 0:
+            limiter.reserve()
+            return None
+        self.rate_limited += 1
+        reset = datetime.fromtimestamp(self.game.now() + wait, timezone.utc)
+        error = GameError(
+            429,
+            429,
+            "You have reached your API limit.",
+            {
+                "type": "IP-based",
+                "retryAfter": wait,
+                "limitBurst": limiter.burst,
+                "limitPerSecond": limiter.rate,
+                "remaining": 0,
+                "reset": reset.isoformat(timespec="milliseconds"),
+            },
+        )
+        return error.status, error.body()
+
+    def _dispatch(
+        self,
+        method: str,
+        path: str,
+        query: str,
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> Reply:
+        allowed = False
+        for method_, pattern, handler in ROUTES:
+            match = pattern.match(path)
+            if match is None:
+                continue
+            allowed = True
+            if method_ != method:
+                continue
+            if path.startswith("/my") and not headers.get(
+                "authorization", ""
+            ).startswith("Bearer "):
+                raise GameError(401, 4100, "Missing bearer token in the request.")
+            try:
+                data = orjson.loads(body) if body else {}
+            except orjson.JSONDecodeError:
+                raise GameError(400, 400, "Request body is not valid JSON.") from None
+            if not isinstance(data, dict):
+                raise GameError(400, 400, "Request body must be a JSON object.")
+            return handler(
+                self.game, Call(match.groupdict(), dict(parse_qsl(query)), data)
+            )
+        if allowed:
+            raise GameError(405, 405, f"Method {method} not allowed for {path}")
+        raise GameError(404, 404, f"Route {method}:{path} not found")
+
+    def respond(
+        self,
+        method: str,
+        path: str,
+        query: str,
+        headers: Mapping[str, str],
+        body: bytes,
+    ) -> Response:
+        """
+        Status, headers and body of the answer to a request.
+        ``headers`` must have lowercase names.
+        """
+        if path.startswith(PREFIX):
+            path = path[len(PREFIX) :] or "/"
+        with self._lock:
+            self.requests += 1
+            reply = self._throttle()
+            if reply is None:
+                try:
+                    reply = self._dispatch(method, path, query, headers, body)
+                except GameError as e:
+                    reply = e.status, e.body()
+        status, data = reply
+        response_headers = self._limit_headers()
+        if data is None:
+            return status, response_headers, b""
+        response_headers["content-type"] = "application/json"
+        return status, response_headers, orjson.dumps(data)
+
+    def handle(self, request: httpx.Request) -> httpx.Response:
+        """
+        Answer an httpx request, as a handler for ``httpx.MockTransport``.
+        """
+        headers = {name.lower(): value for name, value in request.headers.items()}
+        status, response_headers, body = self.respond(
+            request.method,
+            request.url.path,
+            request.url.query.decode(),
+            headers,
+            request.content,
+        )
+        return httpx.Response(status, headers=response_headers, content=body)
+
+    def transport(self) -> httpx.MockTransport:
+        """
+        Transport for sync and async httpx clients, which sends requests to this server.
+        """
+        return httpx.MockTransport(self.handle)
+
+    async def __call__(
+        self,
+        scope: MutableMapping[str, Any],
+        receive: Callable[[], Awaitable[MutableMapping[str, Any]]],
+        send: Callable[[MutableMapping[str, Any]], Awaitable[None]],
+    ) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    await send({"type": "lifespan.shutdown.complete"})
+                    return
+        body = b""
+        while True:
+            message = await receive()
+            body += message.get("body", b"")
+            if not message.get("more_body"):
+                break
+        headers = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope["headers"]
+        }
+        status, response_headers, content = self.respond(
+            scope["method"],
+            scope["path"],
+            scope["query_string"].decode("latin-1"),
+            headers,
+            body,
+        )
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (name.encode("latin-1"), value.encode("latin-1"))
+                    for name, value in response_headers.items()
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": content})
+
+    def http_server(
+        self, host: str = "127.0.0.1", port: int = 0
+    ) -> ThreadingHTTPServer:
+        """
+        Standard library HTTP server answering requests on a socket with this server.
+        """
+        server = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # headers and body are written separately, don't hold the body back
+            disable_nagle_algorithm = True
+
+            def _answer(self) -> None:
+                path, _, query = self.path.partition("?")
+                length = int(self.headers.get("content-length") or 0)
+                status, headers, body = server.respond(
+                    self.command,
+                    path,
+                    query,
+                    {name.lower(): value for name, value in self.headers.items()},
+                    self.rfile.read(length),
+                )
+                self.send_response(status)
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header("content-length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = do_POST = do_PATCH = _answer
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        return ThreadingHTTPServer((host, port), RequestHandler)
+
+    @contextmanager
+    def serve(self, host: str = "127.0.0.1", port: int = 0) -> Iterator[str]:
+        """
+        Listen on a socket in a background thread, yielding the base URL of the API.
+        Port 0 picks a free one.
+        """
+        http_server = self.http_server(host, port)
+        thread = threading.Thread(target=http_server.serve_forever, daemon=True)
+        thread.start()
+        try:
+            address, bound = http_server.server_address[:2]
+            yield f"http://{address!s}:{bound}{PREFIX}"
+        finally:
+            http_server.shutdown()
+            http_server.server_close()
+            thread.join()
@@ -0,0 +1,226 @@
+"""
+Synthetic SpaceTraders data for offline benchmarks.
+"""
+
+import random
+from typing import Any
+
+SYSTEM_TYPES = ["RED_STAR", "ORANGE_STAR", "WHITE_DWARF", "NEUTRON_STAR", "BLUE_STAR"]
+WAYPOINT_TYPES = ["PLANET", "MOON", "ASTEROID_FIELD", "GAS_GIANT", "ORBITAL_STATION"]
+
+
+def universe(count: int = 12000, seed: int = 0) -> list[dict[str, Any]]:
+    """
+    Systems in ``/systems.json`` format: a dense core like the starting area,
+    the rest spread over the galaxy, up to 12 waypoints per system
+    and a jump gate in every tenth one.
+    """
+    rng = random.Random(seed)
+    systems = []
+    for index in range(count):
+        symbol = f"X1-B{index}"
+        spread = 2000 if index < count // 10 else 60000
+        waypoints = [
+            {
+                "symbol": f"{symbol}-W{number}",
+                "type": rng.choice(WAYPOINT_TYPES),
+                "x": rng.randint(-80, 80),
+                "y": rng.randint(-80, 80),
+            }
+            for number in range(rng.randint(0, 11))
+        ]
+        if index % 10 == 0:
+            waypoints.append(
+                {"symbol": f"{symbol}-GATE", "type": "JUMP_GATE", "x": 0, "y": 0}
+            )
+        systems.append(
+            {
+                "symbol": symbol,
+                "sectorSymbol": "X1",
+                "type": rng.choice(SYSTEM_TYPES),
+                "x": int(rng.gauss(0, spread)),
+                "y": int(rng.gauss(0, spread)),
+                "waypoints": waypoints,
+                "factions": [],
+            }
+        )
+    return systems
+
+
+def _part(symbol: str, **fields: Any) -> dict[str, Any]:
+    return {
+        "symbol": symbol,
+        "name": symbol.title(),
+        "description": f"{symbol} description",
+        "requirements": {"power": 1, "crew": 1, "slots": 1},
+        **fields,
+    }
+
+
+def _route_waypoint(symbol: str, x: int, y: int) -> dict[str, Any]:
+    return {
+        "symbol": symbol,
+        "type": "PLANET",
+        "systemSymbol": symbol.rsplit("-", 1)[0],
+        "x": x,
+        "y": y,
+    }
+
+
+def ships(count: int = 200, seed: int = 0) -> list[dict[str, Any]]:
+    """
+    Ships in ``/my/ships`` format, with full frames, modules, mounts and cargo
+    like a mining and hauling fleet has.
+    """
+    rng = random.Random(seed)
+    fleet = []
+    for index in range(count):
+        symbol = f"AGENT-{index + 1:X}"
+        status = rng.choice(["DOCKED", "IN_ORBIT", "IN_TRANSIT"])
+        units = rng.randint(0, 60)
+        fleet.append(
+            {
+                "symbol": symbol,
+                "registration": {
+                    "name": symbol,
+                    "factionSymbol": "COSMIC",
+                    "role": rng.choice(["EXCAVATOR", "HAULER", "COMMAND"]),
+                },
+                "nav": {
+                    "systemSymbol": "X1-B0",
+                    "waypointSymbol": f"X1-B0-W{rng.randint(0, 9)}",
+                    "route": {
+                        "destination": _route_waypoint("X1-B0-W1", 10, -4),
+                        "departure": _route_waypoint("X1-B0-W0", -3, 7),
+                        "departureTime": "2023-06-01T10:00:00.000Z",
+                        "arrival": f"2023-06-01T10:{rng.randint(0, 59):02}:13.000Z",
+                    },
+                    "status": status,
+                    "flightMode": "CRUISE",
+                },
+                "crew": {
+                    "current": 57,
+                    "required": 57,
+                    "capacity": 80,
+                    "rotation": "STRICT",
+                    "morale": 100,
+                    "wages": 0,
+                },
+                "frame": _part(
+                    "FRAME_FRIGATE",
+                    condition=100,
+                    moduleSlots=8,
+                    mountingPoints=5,
+                    fuelCapacity=1200,
+                ),
+                "reactor": _part("REACTOR_FISSION_I", condition=100, powerOutput=31),
+                "engine": _part("ENGINE_ION_DRIVE_II", condition=100, speed=30),
+                "modules": [
+                    _part("MODULE_CARGO_HOLD_I", capacity=30),
+                    _part("MODULE_CARGO_HOLD_I", capacity=30),
+                    _part("MODULE_CREW_QUARTERS_I", capacity=40),
+                    _part("MODULE_MINERAL_PROCESSOR_I"),
+                ],
+                "mounts": [
+                    _part("MOUNT_SENSOR_ARRAY_I", strength=1),
+                    _part(
+                        "MOUNT_MINING_LASER_I",
+                        strength=10,
+                        deposits=["IRON_ORE", "COPPER_ORE", "QUARTZ_SAND"],
+                    ),
+                ],
+                "cargo": {
+                    "capacity": 60,
+                    "units": units,
+                    "inventory": (
+                        [
+                            {
+                                "symbol": "IRON_ORE",
+                                "name": "Iron Ore",
+                                "description": "Iron ore",
+                                "units": units,
+                            }
+                        ]
+                        if units
+                        else []
+                    ),
+                },
+                "fuel": {
+                    "current": rng.randint(0, 1200),
+                    "capacity": 1200,
+                    "consumed": {"amount": 38, "timestamp": "2023-06-01T10:00:00.000Z"},
+                },
+            }
+        )
+    return fleet
+
+
+TRADE_SYMBOLS = [
+    "IRON_ORE",
+    "COPPER_ORE",
+    "ALUMINUM_ORE",
+    "SILVER_ORE",
+    "QUARTZ_SAND",
+    "ICE_WATER",
+    "IRON",
+    "COPPER",
+    "ALUMINUM",
+    "FUEL",
+    "FOOD",
+    "FABRICS",
+    "MACHINERY",
+    "EXPLOSIVES",
+    "LAB_INSTRUMENTS",
+    "AMMUNITION",
+]
+
+
+def _trade_good(symbol: str) -> dict[str, Any]:
+    return {"symbol": symbol, "name": symbol.title(), "description": f"{symbol} goods"}
+
+
+def markets(count: int = 100, seed: int = 0) -> list[dict[str, Any]]:
+    """
+    Markets in ``/systems/{system}/waypoints/{waypoint}/market`` format as seen
+    with a ship present: a dozen priced goods and the last 20 transactions.
+    """
+    rng = random.Random(seed)
+    result = []
+    for index in range(count):
+        symbol = f"X1-B{index}-W0"
+        goods = rng.sample(TRADE_SYMBOLS, 12)
+        result.append(
+            {
+                "symbol": symbol,
+                "exports": [_trade_good(good) for good in goods[:4]],
+                "imports": [_trade_good(good) for good in goods[4:8]],
+                "exchange": [_trade_good(good) for good in goods[8:]],
+                "transactions": [
+                    {
+                        "waypointSymbol": symbol,
+                        "shipSymbol": f"AGENT-{rng.randint(1, 200):X}",
+                        "tradeSymbol": rng.choice(goods),
+                        "type": rng.choice(["PURCHASE", "SELL"]),
+                        "units": units,
+                        "pricePerUnit": price,
+                        "totalPrice": units * price,
+                        "timestamp": f"2023-06-01T{hour:02}:{rng.randint(0, 59):02}:00.000Z",
+                    }
+                    for hour in range(20)
+                    for units, price in [(rng.randint(1, 60), rng.randint(5, 500))]
+                ],
+                "tradeGoods": [
+                    {
+                        "symbol": good,
+                        "tradeVolume": rng.choice([10, 100, 1000]),
+                        "supply": rng.choice(
+                            ["SCARCE", "LIMITED", "MODERATE", "ABUNDANT"]
+                        ),
+                        "purchasePrice": rng.randint(10, 500),
+                        "sellPrice": rng.randint(5, 450),
+                    }
+                    for good in goods
+                ],
+            }
+        )
+    return result
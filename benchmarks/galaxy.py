@@ -0,0 +1,77 @@
+"""
+Galaxy store against plain Python loops over ``System`` models at full universe scale.
+
+    python -m benchmarks.galaxy [systems]
+"""
+
+import math
+import sys
+import time
+from typing import Any, Callable
+
+from astrotraders.api.schemas import System
+from astrotraders.game.galaxy import GalaxyStore
+from benchmarks.fixtures import universe
+
+
+def timeit(name: str, func: Callable[[], Any], repeat: int = 1) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    elapsed = (time.perf_counter() - start) / repeat
+    print(f"{name:<40} {elapsed * 1e6:>12.1f} us")
+    return elapsed
+
+
+def main(count: int) -> None:
+    raw = universe(count)
+    models = [System.parse_obj(item) for item in raw]
+    print(f"{count} systems, {sum(len(s['waypoints']) for s in raw)} waypoints")
+
+    timeit("GalaxyStore.from_raw", lambda: GalaxyStore.from_raw(raw))
+    timeit("GalaxyStore.from_systems", lambda: GalaxyStore.from_systems(models))
+    store = GalaxyStore.from_raw(raw)
+    origins = store.system_symbols[:: max(1, count // 200)]
+    gates = store.systems_with_waypoint("JUMP_GATE")
+
+    def python_nearest(origin: System, k: int, gates_only: bool = False) -> list[str]:
+        candidates = [
+            system
+            for system in models
+            if system is not origin
+            and (
+                not gates_only
+                or any(w.type.value == "JUMP_GATE" for w in system.waypoints)
+            )
+        ]
+        candidates.sort(key=lambda s: math.hypot(s.x - origin.x, s.y - origin.y))
+        return [system.symbol for system in candidates[:k]]
+
+    by_symbol = {system.symbol: system for system in models}
+    repeat = len(origins)
+    queries = iter(origins * 4)
+    python = timeit(
+        "python nearest(k=5)",
+        lambda: python_nearest(by_symbol[next(queries)], 5),
+        repeat,
+    )
+    grid = timeit("store.nearest(k=5)", lambda: store.nearest(next(queries), 5), repeat)
+    timeit(
+        "python nearest(k=5, jump gates)",
+        lambda: python_nearest(by_symbol[next(queries)], 5, True),
+        repeat,
+    )
+    timeit(
+        "store.nearest(k=5, mask=jump gates)",
+        lambda: store.nearest(next(queries), 5, mask=gates),
+        repeat,
+    )
+    queries = iter(origins)
+    timeit(
+        "store.within(radius=2000)", lambda: store.within(next(queries), 2000), repeat
+    )
+    print(f"nearest speedup: {python / grid:.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 12000)
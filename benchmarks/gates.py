@@ -0,0 +1,75 @@
+"""
+Jump gate routing on a synthetic full galaxy.
+
+    python -m benchmarks.gates [systems] [jump range]
+"""
+
+import math
+import random
+import sys
+import time
+
+from astrotraders.game.galaxy import GalaxyStore
+from astrotraders.game.gates import GateGraph
+from benchmarks.fixtures import universe
+
+
+def build(count: int, jump_range: float) -> GateGraph:
+    galaxy = GalaxyStore.from_raw(universe(count))
+    gates = galaxy.systems_with_waypoint("JUMP_GATE")
+    graph = GateGraph()
+    for symbol in (galaxy.system_symbols[i] for i in gates.nonzero()[0]):
+        x, y = galaxy.coordinates(symbol)
+        graph.add_connections(
+            symbol,
+            (
+                {
+                    "symbol": other,
+                    "distance": round(math.dist((x, y), galaxy.coordinates(other))),
+                }
+                for other in galaxy.within(symbol, jump_range, mask=gates)
+                if other != symbol
+            ),
+        )
+    return graph
+
+
+def main(count: int, jump_range: float) -> None:
+    start = time.perf_counter()
+    graph = build(count, jump_range)
+    edges = sum(len(graph.neighbours(symbol)) for symbol in graph.systems) // 2
+    print(f"{len(graph)} gates, {edges} connections")
+    print(f"build: {(time.perf_counter() - start) * 1e3:.1f} ms")
+
+    rng = random.Random(0)
+    pairs = [rng.sample(graph.systems, 2) for _ in range(200)]
+    start = time.perf_counter()
+    graph._prepare()
+    print(f"landmarks: {(time.perf_counter() - start) * 1e3:.1f} ms")
+    # landmarks=0 turns A* into plain Dijkstra which stops at the goal
+    plain = GateGraph(landmarks=0)
+    for symbol in graph.systems:
+        plain.add_connections(
+            symbol,
+            ({"symbol": k, "distance": v} for k, v in graph.neighbours(symbol).items()),
+        )
+    reachable = [(a, b) for a, b in pairs if graph.shortest_path(a, b)]
+    print(f"{len(reachable)} of {len(pairs)} random pairs are connected")
+
+    for name, func in (
+        ("shortest_path (ALT A*)", graph.shortest_path),
+        ("shortest_path (dijkstra)", plain.shortest_path),
+        ("fewest_hops", graph.fewest_hops),
+    ):
+        start = time.perf_counter()
+        for a, b in reachable:
+            func(a, b)
+        elapsed = (time.perf_counter() - start) / len(reachable)
+        print(f"{name:<26} {elapsed * 1e3:>8.3f} ms")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 12000,
+        float(sys.argv[2]) if len(sys.argv) > 2 else 12000,
+    )
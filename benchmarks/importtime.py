@@ -0,0 +1,102 @@
+"""
+Import time of the package measured by ``python -X importtime``, from a bare import
+to a client with every resource loaded. Each case runs in a fresh interpreter,
+the best of a few runs is kept.
+
+    python -m benchmarks.importtime [--save FILE] [--compare FILE] [--threshold 0.25]
+
+With ``--compare``, exits with status 1 if time spent in our own modules grew
+by more than ``threshold`` against the saved results.
+"""
+
+import argparse
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+import orjson
+
+CASES: Dict[str, str] = {
+    "package": "import astrotraders",
+    "client": "import astrotraders; astrotraders.AstroTradersClient.set_up('token')",
+    "resources": (
+        "import astrotraders; client = astrotraders.AstroTradersClient.set_up('token'); "
+        "[getattr(client, name) for name in "
+        "('agents', 'systems', 'contracts', 'factions', 'fleet', 'server')]"
+    ),
+}
+
+
+def import_times(statement: str) -> List[Tuple[str, int, int, int]]:
+    """
+    Modules imported by a statement run in a new interpreter, with self and cumulative
+    import times in microseconds and how deep in nested imports they are.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "| cumulative |" in line:
+            continue
+        own, cumulative, name = line[len("import time:") :].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        modules.append((name.strip(), int(own), int(cumulative), depth))
+    return modules
+
+
+def measure(statement: str, repeat: int = 5) -> Dict[str, float]:
+    """
+    Milliseconds spent importing in total and in ``astrotraders`` modules themselves,
+    without modules imported by the interpreter on start.
+    """
+    startup = {name for name, *_ in import_times("pass")}
+    best = {"total": float("inf"), "own": float("inf")}
+    for _ in range(repeat):
+        modules = [item for item in import_times(statement) if item[0] not in startup]
+        total = sum(cumulative for _, _, cumulative, depth in modules if depth == 0)
+        own = sum(
+            own for name, own, _, _ in modules if name.split(".")[0] == "astrotraders"
+        )
+        best["total"] = min(best["total"], total / 1e3)
+        best["own"] = min(best["own"], own / 1e3)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--save", help="write results to a JSON file")
+    parser.add_argument("--compare", help="compare with results saved before")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    results = {name: measure(statement) for name, statement in CASES.items()}
+    baseline = {}
+    if args.compare:
+        with open(args.compare, "rb") as file:
+            baseline = orjson.loads(file.read())
+
+    regressions = []
+    for name, result in results.items():
+        line = f"{name + ':':<11} total {result['total']:7.1f} ms, own {result['own']:6.1f} ms"
+        if name in baseline:
+            before = baseline[name]["own"]
+            change = (result["own"] - before) / before if before else 0.0
+            line += f"  (own was {before:.1f} ms, {change:+.0%})"
+            if change > args.threshold:
+                regressions.append(name)
+        print(line)
+
+    if args.save:
+        with open(args.save, "wb") as file:
+            file.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    if regressions:
+        print(f"import time regressed: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Planning a whole fleet in one call against planning ship by ship.
+
+    python -m benchmarks.navigation [ships] [waypoints]
+"""
+
+import random
+import sys
+import time
+
+from astrotraders.game.navigation import NavigationPlanner
+
+
+def main(ship_count: int, waypoint_count: int) -> None:
+    rng = random.Random(0)
+    waypoints = [
+        {
+            "symbol": f"X1-A-W{index}",
+            "x": rng.randint(-800, 800),
+            "y": rng.randint(-800, 800),
+            "traits": [{"symbol": "MARKETPLACE"}] if index % 4 == 0 else [],
+        }
+        for index in range(waypoint_count)
+    ]
+    planner = NavigationPlanner(waypoints)
+    ships = []
+    for _ in range(ship_count):
+        speed, capacity = rng.choice([(2, 0), (10, 400), (30, 1200), (30, 600)])
+        ships.append(
+            (
+                rng.choice(planner.symbols),
+                rng.choice(planner.symbols),
+                speed,
+                rng.randint(0, capacity),
+                capacity,
+            )
+        )
+    print(f"{ship_count} ships, {waypoint_count} waypoints")
+
+    start = time.perf_counter()
+    plans = planner.plan_many(*zip(*ships))
+    batch = time.perf_counter() - start
+    print(f"plan_many: {batch * 1e3:8.1f} ms")
+
+    start = time.perf_counter()
+    single = [planner.plan(*ship) for ship in ships]
+    one_by_one = time.perf_counter() - start
+    print(f"plan x{ship_count}: {one_by_one * 1e3:8.1f} ms")
+    assert plans == single
+    print(f"speedup: {one_by_one / batch:.1f}x")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 1000,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 80,
+    )
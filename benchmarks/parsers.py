@@ -0,0 +1,55 @@
+"""
+Generated parsers of small fleet schemas against pydantic validation,
+on the responses of fleet actions.
+
+    python -m benchmarks.parsers [count]
+"""
+
+import sys
+from typing import Any
+
+from astrotraders.api.parsers import parser
+from astrotraders.api.schemas import (
+    Cooldown,
+    ShipCargo,
+    ShipFuel,
+    ShipNav,
+    ShipNavRoute,
+)
+from benchmarks.fixtures import ships
+from benchmarks.validation import measure
+
+
+def main(count: int) -> None:
+    fleet = ships(count)
+    cases: list[tuple[Any, list[dict[str, Any]]]] = [
+        (ShipNav, [ship["nav"] for ship in fleet]),
+        (ShipNavRoute, [ship["nav"]["route"] for ship in fleet]),
+        (ShipCargo, [ship["cargo"] for ship in fleet]),
+        (ShipFuel, [ship["fuel"] for ship in fleet]),
+        (
+            Cooldown,
+            [
+                {
+                    "shipSymbol": ship["symbol"],
+                    "totalSeconds": 70,
+                    "remainingSeconds": index % 70,
+                    "expiration": ship["nav"]["route"]["arrival"],
+                }
+                for index, ship in enumerate(fleet)
+            ],
+        ),
+    ]
+    print(f"{count} objects each:")
+    for model, items in cases:
+        parse = parser(model)
+        assert parse is not None
+        slow = measure(lambda: [model(**item) for item in items])
+        fast = measure(lambda: [parse(item) for item in items])
+        print(f"  {model.__name__}:")
+        print(f"    pydantic:  {slow * 1e3:9.2f} ms")
+        print(f"    generated: {fast * 1e3:9.2f} ms  ({slow / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
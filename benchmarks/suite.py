@@ -0,0 +1,333 @@
+"""
+Offline benchmarks of resource methods served by ``httpx.MockTransport`` from synthetic
+data: a fleet, markets and a universe in ``/systems.json`` format. Every method is run
+with every way of building models from responses (pydantic validation, trusted
+construction, lazy models and msgspec structs if installed), measuring calls and objects
+per second and peak memory allocated per call.
+
+Results are saved per commit to ``.benchmarks/`` and can be compared with any saved run.
+
+    python -m benchmarks.suite [--ships 200] [--systems 12000] [--markets 100]
+        [--only fleet.] [--time 0.5] [--no-save] [--compare REF] [--threshold 0.25]
+
+``--compare`` takes a file or a git revision of a saved run and exits with status 1
+if any method got slower or allocates more by over ``threshold``.
+"""
+
+import argparse
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+import httpx
+import orjson
+
+from astrotraders import AstroTradersClient
+from benchmarks.fixtures import markets, ships, universe
+
+RESULTS = Path(".benchmarks")
+
+
+def _page(items: List[Any], params: httpx.QueryParams) -> Dict[str, Any]:
+    page, limit = int(params.get("page", 1)), int(params.get("limit", 20))
+    return {
+        "data": items[(page - 1) * limit : page * limit],
+        "meta": {"total": len(items), "page": page, "limit": limit},
+    }
+
+
+def _waypoint(system: Dict[str, Any], waypoint: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        **waypoint,
+        "systemSymbol": system["symbol"],
+        "orbitals": [],
+        "faction": {"symbol": "COSMIC"},
+        "traits": [
+            {"symbol": trait, "name": trait.title(), "description": trait}
+            for trait in ("MARKETPLACE", "MINERAL_DEPOSITS")
+        ],
+    }
+
+
+class SyntheticApi:
+    """
+    Request handler for ``httpx.MockTransport`` answering the endpoints used by the
+    benchmarked methods. Bodies are encoded once per URL, so the client side is measured.
+    """
+
+    def __init__(self, ship_count: int, system_count: int, market_count: int):
+        self.ships = ships(ship_count)
+        self.systems = universe(system_count)
+        self.markets = markets(market_count)
+        self._ships = {ship["symbol"]: ship for ship in self.ships}
+        self._systems = {system["symbol"]: system for system in self.systems}
+        self._markets = {market["symbol"]: market for market in self.markets}
+        self._bodies: Dict[str, Tuple[int, bytes]] = {}
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        key = str(request.url)
+        if key not in self._bodies:
+            try:
+                status, data = 200, self.route(request.url.path, request.url.params)
+            except (KeyError, IndexError):
+                status, data = 404, {"error": {"message": "Not found", "code": 404}}
+            self._bodies[key] = status, orjson.dumps(data)
+        status, body = self._bodies[key]
+        return httpx.Response(
+            status, content=body, headers={"Content-Type": "application/json"}
+        )
+
+    def route(self, path: str, params: httpx.QueryParams) -> Any:
+        if path == "/systems.json":
+            return self.systems
+        if path == "/systems":
+            return _page(self.systems, params)
+        if path == "/my/ships":
+            return _page(self.ships, params)
+        parts = path.strip("/").split("/")
+        if parts[:2] == ["my", "ships"]:
+            ship = self._ships[parts[2]]
+            if len(parts) == 3:
+                return {"data": ship}
+            if parts[3] == "cooldown":
+                cooldown = {
+                    "shipSymbol": ship["symbol"],
+                    "totalSeconds": 70,
+                    "remainingSeconds": 30,
+                    "expiration": ship["nav"]["route"]["arrival"],
+                }
+                return {"data": cooldown}
+            return {"data": ship[parts[3]]}
+        if parts[0] == "systems" and parts[2:3] == ["waypoints"]:
+            if parts[-1] == "market":
+                return {"data": self._markets[parts[3]]}
+            system = self._systems[parts[1]]
+            waypoints = {item["symbol"]: item for item in system["waypoints"]}
+            return {"data": _waypoint(system, waypoints[parts[3]])}
+        raise KeyError(path)
+
+
+def decoding_paths() -> Dict[str, Dict[str, Any]]:
+    """
+    Client options for every way of building models from responses.
+    """
+    paths: Dict[str, Dict[str, Any]] = {
+        "pydantic": {},
+        "trusted": {"validate": False},
+        "lazy": {"lazy": True},
+    }
+    try:
+        from astrotraders.api.structs import StructBackend
+    except ImportError:
+        pass
+    else:
+        paths["structs"] = {"backend": StructBackend()}
+    return paths
+
+
+class Case(NamedTuple):
+    name: str
+    # objects built by one call
+    objects: int
+    # called with a client and the number of the call, to vary ships and markets
+    call: Callable[[AstroTradersClient, int], Any]
+
+
+def cases(api: SyntheticApi) -> List[Case]:
+    symbols = [ship["symbol"] for ship in api.ships]
+    waypoints = [
+        (system["symbol"], waypoint["symbol"])
+        for system in api.systems[:100]
+        for waypoint in system["waypoints"]
+    ]
+    markets = [
+        (item["symbol"].rsplit("-", 1)[0], item["symbol"]) for item in api.markets
+    ]
+    pages = max(1, len(symbols) // 20)
+
+    def ship(number: int) -> str:
+        return symbols[number % len(symbols)]
+
+    return [
+        Case(
+            "fleet.list",
+            min(20, len(symbols)),
+            lambda c, n: c.fleet.list(page=n % pages + 1),
+        ),
+        Case("fleet.all_ships", len(symbols), lambda c, n: c.fleet.all_ships()),
+        Case("fleet.get", 1, lambda c, n: c.fleet.get(ship(n))),
+        Case("fleet.nav", 1, lambda c, n: c.fleet.nav(ship(n))),
+        Case("fleet.cooldown", 1, lambda c, n: c.fleet.cooldown(ship(n))),
+        Case("fleet.cargo.get", 1, lambda c, n: c.fleet.cargo.get(ship(n))),
+        Case(
+            "waypoints.get",
+            1,
+            lambda c, n: c.systems.waypoints.get(*waypoints[n % len(waypoints)]),
+        ),
+        Case(
+            "waypoints.market",
+            1,
+            lambda c, n: c.systems.waypoints.market(*markets[n % len(markets)]),
+        ),
+        Case("systems.list", 20, lambda c, n: c.systems.list(page=n % 50 + 1)),
+        Case("systems.all", len(api.systems), lambda c, n: c.systems.all()),
+        Case(
+            "systems.stream_all",
+            len(api.systems),
+            lambda c, n: sum(1 for _ in c.systems.stream_all()),
+        ),
+    ]
+
+
+def measure(
+    case: Case, client: AstroTradersClient, min_time: float
+) -> Dict[str, float]:
+    # the first call imports resources, generates parsers and fills the mock's bodies
+    case.call(client, 0)
+    calls = 0
+    start = time.perf_counter()
+    while True:
+        case.call(client, calls)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+    tracemalloc.start()
+    try:
+        case.call(client, calls)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    return {
+        "us_per_call": elapsed / calls * 1e6,
+        "calls_per_s": calls / elapsed,
+        "objects_per_s": calls * case.objects / elapsed,
+        "peak_kib": peak / 1024,
+    }
+
+
+def git(*args: str) -> str:
+    try:
+        return subprocess.run(
+            ["git", *args], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ""
+
+
+def revision() -> str:
+    """
+    Short hash of the checked out commit, marked dirty with uncommitted changes.
+    """
+    commit = git("rev-parse", "--short=10", "HEAD") or "unknown"
+    if git("status", "--porcelain", "--untracked-files=no"):
+        commit += "-dirty"
+    return commit
+
+
+def load(ref: str) -> Dict[str, Any]:
+    path = Path(ref)
+    if not path.exists():
+        path = RESULTS / f"{git('rev-parse', '--short=10', ref) or ref}.json"
+    if not path.exists():
+        sys.exit(f"no saved run for {ref}, expected {path}")
+    return orjson.loads(path.read_bytes())
+
+
+def compare(
+    results: Dict[str, Dict[str, float]],
+    baseline: Dict[str, Dict[str, float]],
+    threshold: float,
+) -> Tuple[Dict[str, str], List[str]]:
+    """
+    Changes of time per call and peak memory against a baseline, formatted per case,
+    and cases which regressed by over ``threshold``.
+    """
+    changes, regressions = {}, []
+    for key, result in results.items():
+        before = baseline.get(key)
+        if before is None:
+            continue
+        time_change = result["us_per_call"] / before["us_per_call"] - 1
+        memory_change = result["peak_kib"] / max(before["peak_kib"], 1e-9) - 1
+        changes[key] = f"{time_change:+7.0%} {memory_change:+7.0%}"
+        if time_change > threshold or memory_change > threshold:
+            regressions.append(key)
+    return changes, regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ships", type=int, default=200)
+    parser.add_argument("--systems", type=int, default=12000)
+    parser.add_argument("--markets", type=int, default=100)
+    parser.add_argument("--only", default="", help="run cases containing this text")
+    parser.add_argument("--time", type=float, default=0.5, help="seconds per case")
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--compare", help="saved file or git revision")
+    parser.add_argument("--threshold", type=float, default=0.25)
+    args = parser.parse_args()
+
+    api = SyntheticApi(args.ships, args.systems, args.markets)
+    baseline: Optional[Dict[str, Any]] = load(args.compare) if args.compare else None
+    results: Dict[str, Dict[str, float]] = {}
+    header = (
+        f"{'case':<20} {'path':<9} {'calls/s':>10} {'objects/s':>11} "
+        f"{'us/call':>11} {'peak KiB':>10}"
+    )
+    if baseline is not None:
+        header += f"  vs {baseline['revision']}: time, memory"
+    print(header)
+    for case in cases(api):
+        if args.only not in case.name:
+            continue
+        for path, options in decoding_paths().items():
+            client = AstroTradersClient(
+                httpx.Client(
+                    base_url="https://api.test", transport=httpx.MockTransport(api)
+                ),
+                **options,
+            )
+            key = f"{case.name}/{path}"
+            result = results[key] = measure(case, client, args.time)
+            line = (
+                f"{case.name:<20} {path:<9} {result['calls_per_s']:>10.1f} "
+                f"{result['objects_per_s']:>11.0f} {result['us_per_call']:>11.1f} "
+                f"{result['peak_kib']:>10.1f}"
+            )
+            if baseline is not None:
+                change, _ = compare({key: result}, baseline["results"], args.threshold)
+                line += f"  {change.get(key, '')}"
+            print(line)
+            client.close()
+
+    run = {
+        "revision": revision(),
+        "date": datetime.now(timezone.utc).isoformat(),
+        "python": platform.python_version(),
+        "scale": {
+            "ships": args.ships,
+            "systems": args.systems,
+            "markets": args.markets,
+        },
+        "results": results,
+    }
+    if not args.no_save:
+        RESULTS.mkdir(exist_ok=True)
+        path = RESULTS / f"{run['revision']}.json"
+        path.write_bytes(orjson.dumps(run, option=orjson.OPT_INDENT_2))
+        print(f"saved to {path}")
+    if baseline is not None:
+        _, regressions = compare(results, baseline["results"], args.threshold)
+        if regressions:
+            print(f"regressed by over {args.threshold:.0%}: {', '.join(regressions)}")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+"""
+Client throughput against the local mock API: every ship of a mining fleet extracts,
+waits for its reactor cooldown and jettisons full cargo, concurrently on an async client,
+while the server limits requests like SpaceTraders does.
+
+    python -m benchmarks.throughput [--ships 20] [--seconds 5] [--speed 1000]
+        [--transport memory|asgi|socket] [--server-rate 2] [--client-rate 2]
+
+A rate of 0 disables the limit on that side. With the client limit off, the server
+answers 429 and the client retries; with both off the client itself is measured.
+"""
+
+import argparse
+import asyncio
+import statistics
+import time
+from contextlib import ExitStack
+from datetime import datetime
+from typing import List, Optional
+
+import httpx
+
+from astrotraders import AsyncAstroTradersClient
+from astrotraders.api.exceptions import APIException
+from astrotraders.mock import MockGame, MockServer
+
+
+def _wait(expiration: datetime) -> float:
+    return max(0.0, expiration.timestamp() - time.time())
+
+
+async def mine(
+    client: AsyncAstroTradersClient,
+    ship: str,
+    until: float,
+    latencies: List[float],
+    failures: List[str],
+) -> int:
+    """
+    Extract with one ship until ``until``, returning the number of extractions.
+    """
+    extractions = 0
+    while time.time() < until:
+        start = time.perf_counter()
+        try:
+            result = await client.fleet.extract(ship)
+        except APIException as e:
+            if e.code == 429:
+                # still limited after every retry
+                failures.append(ship)
+                continue
+            if e.code != 4000 or not isinstance(e.data, dict):
+                raise
+            # another request raced the cooldown, wait for it like a bot would
+            expiration = datetime.fromisoformat(
+                e.data["cooldown"]["expiration"].replace("Z", "+00:00")
+            )
+            await asyncio.sleep(_wait(expiration))
+            continue
+        latencies.append(time.perf_counter() - start)
+        extractions += 1
+        cargo = result.cargo
+        if cargo.units >= cargo.capacity:
+            for item in cargo.inventory:
+                await client.fleet.cargo.jettison(ship, item.symbol, item.units)
+        await asyncio.sleep(_wait(result.cooldown.expiration))
+    return extractions
+
+
+async def run(args: argparse.Namespace) -> None:
+    game = MockGame(ships=args.ships + 2, speed=args.speed)
+    server = MockServer(game, rate=args.server_rate or None, burst=args.burst)
+    drones = list(game.ships)[2:]
+    with ExitStack() as stack:
+        url = "http://mock/v2"
+        transport: Optional[httpx.AsyncBaseTransport] = None
+        if args.transport == "memory":
+            transport = server.transport()
+        elif args.transport == "asgi":
+            transport = httpx.ASGITransport(app=server)
+        else:
+            url = stack.enter_context(server.serve())
+        client = AsyncAstroTradersClient.set_up(
+            "token",
+            url,
+            rate=args.client_rate or None,
+            burst=args.burst,
+            retries=10,
+            transport=transport,
+        )
+        latencies: List[float] = []
+        failures: List[str] = []
+        start = time.time()
+        until = start + args.seconds
+        counts = await asyncio.gather(
+            *(mine(client, ship, until, latencies, failures) for ship in drones)
+        )
+        elapsed = time.time() - start
+        await client.close()
+
+    print(
+        f"{len(drones)} ships, {args.transport} transport, server rate "
+        f"{args.server_rate or 'off'}, client rate {args.client_rate or 'off'}, "
+        f"{elapsed:.1f} s:"
+    )
+    print(f"  requests:    {server.requests:8d}  {server.requests / elapsed:9.1f}/s")
+    print(f"  extractions: {sum(counts):8d}  {sum(counts) / elapsed:9.1f}/s")
+    print(f"  rejected with 429: {server.rate_limited}")
+    print(f"  extractions failed after retries: {len(failures)}")
+    limiter = client.rate_limiter
+    if limiter is not None:
+        print(
+            f"  delayed by the client: {limiter.delayed} requests, "
+            f"{limiter.waited:.1f} s in total"
+        )
+    if latencies:
+        latencies.sort()
+        print(
+            f"  extract latency: median {statistics.median(latencies) * 1e3:.1f} ms, "
+            f"p95 {latencies[int(len(latencies) * 0.95)] * 1e3:.1f} ms"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--ships", type=int, default=20)
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--speed", type=float, default=1000.0, help="game time speedup")
+    parser.add_argument(
+        "--transport", choices=["memory", "asgi", "socket"], default="memory"
+    )
+    parser.add_argument("--server-rate", type=float, default=2.0)
+    parser.add_argument("--client-rate", type=float, default=2.0)
+    parser.add_argument("--burst", type=int, default=30)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
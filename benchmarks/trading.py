@@ -0,0 +1,95 @@
+"""
+Ranking trade routes with price matrices against a Python loop over market pairs.
+
+    python -m benchmarks.trading [markets]
+"""
+
+import math
+import random
+import sys
+import time
+
+from astrotraders.api.markets import PricePoint
+from astrotraders.api.schemas import ShipNavFlightMode, TradeSymbol
+from astrotraders.game.trading import TradeRouteEngine
+
+
+def synthetic(count: int, seed: int = 0) -> tuple[list[PricePoint], list[dict]]:
+    rng = random.Random(seed)
+    waypoints = [
+        {
+            "symbol": f"X1-A-M{i}",
+            "x": rng.randint(-3000, 3000),
+            "y": rng.randint(-3000, 3000),
+        }
+        for i in range(count)
+    ]
+    prices = []
+    for item in waypoints:
+        for symbol in rng.sample(list(TradeSymbol), 8):
+            price = rng.randint(20, 2000)
+            prices.append(
+                PricePoint(
+                    item["symbol"],
+                    symbol.value,
+                    price,
+                    int(price * 0.9),
+                    None,
+                    None,
+                    0.0,
+                )
+            )
+    return prices, waypoints
+
+
+def python_rank(
+    prices: list[PricePoint], waypoints: list[dict], limit: int
+) -> list[float]:
+    coordinates = {item["symbol"]: (item["x"], item["y"]) for item in waypoints}
+    by_symbol: dict[str, list[PricePoint]] = {}
+    for point in prices:
+        by_symbol.setdefault(point.symbol, []).append(point)
+    mode = ShipNavFlightMode.cruise
+    rates = []
+    for points in by_symbol.values():
+        for bought in points:
+            for sold in points:
+                if bought.waypoint == sold.waypoint:
+                    continue
+                profit = 40 * (sold.sell_price - bought.purchase_price)
+                if profit <= 0:
+                    continue
+                distance = math.dist(
+                    coordinates[bought.waypoint], coordinates[sold.waypoint]
+                )
+                # halves round up in game, unlike round()
+                seconds = math.floor(
+                    math.floor(max(1, distance) + 0.5) * 25 / 30 + 15.5
+                )
+                rates.append(profit / seconds)
+    return sorted(rates, reverse=True)[:limit]
+
+
+def main(count: int) -> None:
+    prices, waypoints = synthetic(count)
+    print(f"{count} markets, {len(prices)} prices")
+    start = time.perf_counter()
+    engine = TradeRouteEngine(prices, waypoints)
+    print(f"build:       {(time.perf_counter() - start) * 1e3:9.1f} ms")
+    start = time.perf_counter()
+    routes = engine.rank(capacity=40, speed=30, limit=20)
+    vectorised = time.perf_counter() - start
+    print(f"rank:        {vectorised * 1e3:9.1f} ms")
+
+    start = time.perf_counter()
+    expected = python_rank(prices, waypoints, 20)
+    loop = time.perf_counter() - start
+    print(f"python loop: {loop * 1e3:9.1f} ms")
+    assert [round(r.profit_per_second, 6) for r in routes] == [
+        round(r, 6) for r in expected
+    ]
+    print(f"speedup: {loop / vectorised:.0f}x")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
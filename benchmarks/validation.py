@@ -0,0 +1,69 @@
+"""
+Building models from decoded responses with and without pydantic validation,
+and lazily, reading only the fields a typical fleet loop reads.
+
+    python -m benchmarks.validation [ships] [systems]
+"""
+
+import sys
+import time
+from typing import Any, Callable
+
+from astrotraders.api.construct import construct, lazy
+from astrotraders.api.schemas import PaginatedObject, ShipSchema, System
+from benchmarks.fixtures import ships, universe
+
+
+def measure(build: Callable[[], Any], repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        build()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def hot_fields(page: PaginatedObject[ShipSchema]) -> None:
+    for ship in page.objects:
+        ship.nav.status, ship.cargo.units, ship.fuel.current
+
+
+def main(ship_count: int, system_count: int) -> None:
+    page = {
+        "data": ships(ship_count),
+        "meta": {"total": ship_count, "page": 1, "limit": ship_count},
+    }
+    systems = universe(system_count)
+    ShipPage = PaginatedObject[ShipSchema]
+    cases = [
+        (
+            f"{ship_count} ships",
+            lambda: ShipPage(**page),
+            lambda: construct(ShipPage, page),
+        ),
+        (
+            f"{system_count} systems",
+            lambda: [System(**system) for system in systems],
+            lambda: [construct(System, system) for system in systems],
+        ),
+    ]
+    for name, validated, trusted in cases:
+        slow, fast = measure(validated), measure(trusted)
+        print(f"{name}:")
+        print(f"  validated:     {slow * 1e3:9.1f} ms")
+        print(f"  trusted:       {fast * 1e3:9.1f} ms  ({slow / fast:.1f}x)")
+
+    print(f"{ship_count} ships, reading nav status, cargo units and fuel:")
+    slow = measure(lambda: hot_fields(ShipPage(**page)))
+    print(f"  validated:     {slow * 1e3:9.1f} ms")
+    for validate in (True, False):
+        fast = measure(lambda: hot_fields(lazy(ShipPage, page, validate)))
+        label = "lazy:" if validate else "lazy trusted:"
+        print(f"  {label:<14} {fast * 1e3:9.1f} ms  ({slow / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(
+        int(sys.argv[1]) if len(sys.argv) > 1 else 500,
+        int(sys.argv[2]) if len(sys.argv) > 2 else 12000,
+    )
@@ -1,6 +1,20 @@
+from typing import Any, Callable
+
+import httpx
 import pytest
 
-from astrotraders import AstroTradersClient
+from astrotraders import AstroTradersClient, AsyncAstroTradersClient
+from astrotraders.mock import MockGame, MockServer
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 1_700_000_000.0
+
+    def __call__(self) -> float:
+        return self.now
 
 
 @pytest.fixture(scope="function")
@@ -8,6 +22,56 @@ def api_client() -> AstroTradersClient:
     client = AstroTradersClient.set_up(
         "test",
         # test stoplight mock server for integration tests
-        "https://stoplight.io/mocks/spacetraders/spacetraders/96627693"
+        "https://stoplight.io/mocks/spacetraders/spacetraders/96627693",
     )
     return client
+
+
+@pytest.fixture(scope="function")
+def make_client() -> Callable[..., AstroTradersClient]:
+    """
+    Factory of offline clients whose requests are answered by a handler,
+    with client options passed as keywords.
+    """
+
+    def make(handler: Handler, **options: Any) -> AstroTradersClient:
+        transport = httpx.MockTransport(handler)
+        return AstroTradersClient(
+            httpx.Client(base_url="https://api.test", transport=transport), **options
+        )
+
+    return make
+
+
+@pytest.fixture(scope="function")
+def make_async_client() -> Callable[..., AsyncAstroTradersClient]:
+    """
+    Asyncio version of :func:`make_client`.
+    """
+
+    def make(handler: Handler, **options: Any) -> AsyncAstroTradersClient:
+        transport = httpx.MockTransport(handler)
+        return AsyncAstroTradersClient(
+            httpx.AsyncClient(base_url="https://api.test", transport=transport),
+            **options,
+        )
+
+    return make
+
+
+@pytest.fixture(scope="function")
+def clock() -> FakeClock:
+    return FakeClock()
+
+
+@pytest.fixture(scope="function")
+def mock_server(clock: FakeClock) -> MockServer:
+    # offline stateful stand-in, game time only moves with the clock
+    return MockServer(MockGame(ships=3, clock=clock), rate=None)
+
+
+@pytest.fixture(scope="function")
+def mock_client(mock_server: MockServer) -> AstroTradersClient:
+    return AstroTradersClient.set_up(
+        "test", "http://mock/v2", rate=None, transport=mock_server.transport()
+    )
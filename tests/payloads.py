@@ -0,0 +1,134 @@
+AGENT = {
+    "accountId": "account",
+    "symbol": "AGENT",
+    "headquarters": "X1-DF55-20250Z",
+    "credits": 100000,
+}
+
+ROUTE_WAYPOINT = {
+    "symbol": "X1-DF55-20250Z",
+    "type": "PLANET",
+    "systemSymbol": "X1-DF55",
+    "x": 0,
+    "y": 0,
+}
+
+NAV = {
+    "systemSymbol": "X1-DF55",
+    "waypointSymbol": "X1-DF55-20250Z",
+    "route": {
+        "destination": ROUTE_WAYPOINT,
+        "departure": ROUTE_WAYPOINT,
+        "departureTime": "2023-05-01T00:00:00.000Z",
+        "arrival": "2023-05-01T00:00:00.000Z",
+    },
+    "status": "IN_ORBIT",
+    "flightMode": "CRUISE",
+}
+
+
+def system(index: int) -> dict:
+    return {
+        "symbol": f"X1-S{index}",
+        "sectorSymbol": "X1",
+        "type": "RED_STAR",
+        "x": index,
+        "y": -index,
+        "waypoints": [
+            {"symbol": f"X1-S{index}-A1", "type": "PLANET", "x": 1, "y": 1},
+        ],
+        "factions": [],
+    }
+
+
+def paginated(objects: list, page: int, limit: int) -> dict:
+    start = (page - 1) * limit
+    return {
+        "data": objects[start : start + limit],
+        "meta": {"total": len(objects), "page": page, "limit": limit},
+    }
+
+
+def waypoint(symbol: str, x: int = 0, y: int = 0, traits: tuple = ()) -> dict:
+    return {
+        "symbol": symbol,
+        "type": "PLANET",
+        "systemSymbol": symbol.rsplit("-", 1)[0],
+        "x": x,
+        "y": y,
+        "orbitals": [],
+        "traits": [
+            {"symbol": trait, "name": trait.title(), "description": trait}
+            for trait in traits
+        ],
+    }
+
+
+CARGO = {"capacity": 40, "units": 0, "inventory": []}
+
+
+def trade_good(symbol: str, purchase: int, sell: int, supply: str = "MODERATE") -> dict:
+    return {
+        "symbol": symbol,
+        "tradeVolume": 100,
+        "supply": supply,
+        "purchasePrice": purchase,
+        "sellPrice": sell,
+    }
+
+
+def transaction(
+    waypoint: str, symbol: str, kind: str, price: int, timestamp: str
+) -> dict:
+    return {
+        "waypointSymbol": waypoint,
+        "shipSymbol": "SHIP-1",
+        "tradeSymbol": symbol,
+        "type": kind,
+        "units": 10,
+        "pricePerUnit": price,
+        "totalPrice": price * 10,
+        "timestamp": timestamp,
+    }
+
+
+def market(symbol: str, goods: list, transactions: list = ()) -> dict:
+    return {
+        "symbol": symbol,
+        "exports": [],
+        "imports": [],
+        "exchange": [],
+        "transactions": list(transactions),
+        "tradeGoods": goods,
+    }
+
+
+def ship(symbol: str, status: str = "DOCKED") -> dict:
+    part = {"name": "part", "description": "part", "requirements": {}}
+    return {
+        "symbol": symbol,
+        "registration": {"name": symbol, "factionSymbol": "COSMIC", "role": "HAULER"},
+        "nav": {**NAV, "status": status},
+        "crew": {
+            "current": 0,
+            "required": 0,
+            "capacity": 0,
+            "rotation": "STRICT",
+            "morale": 100,
+            "wages": 0,
+        },
+        "frame": {
+            **part,
+            "symbol": "FRAME_FRIGATE",
+            "condition": 90,
+            "moduleSlots": 0,
+            "mountingPoints": 0,
+            "fuelCapacity": 100,
+        },
+        "reactor": {**part, "symbol": "REACTOR_FUSION_I", "powerOutput": 1},
+        "engine": {**part, "symbol": "ENGINE_ION_DRIVE_I", "speed": 10},
+        "modules": [],
+        "mounts": [],
+        "cargo": CARGO,
+        "fuel": {"current": 100, "capacity": 100},
+    }
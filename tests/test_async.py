@@ -0,0 +1,40 @@
+import asyncio
+
+import httpx
+
+from astrotraders.api.schemas import AgentSchema, ShipNav, ShipNavStatus
+from tests.payloads import AGENT, NAV
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/my/agent":
+        return httpx.Response(200, json={"data": AGENT})
+    if request.url.path.endswith("/orbit"):
+        return httpx.Response(200, json={"data": {"nav": NAV}})
+    return httpx.Response(404, json={"error": {"message": "Not found", "code": 404}})
+
+
+def test_async_agents_info(make_async_client):
+    async def main() -> AgentSchema:
+        client = make_async_client(handler)
+        try:
+            return await client.agents.info()
+        finally:
+            await client.close()
+
+    assert asyncio.run(main()) == AgentSchema(**AGENT)
+
+
+def test_async_fleet_orbit_concurrently(make_async_client):
+    async def main() -> list[ShipNav]:
+        client = make_async_client(handler)
+        try:
+            return await asyncio.gather(
+                *(client.fleet.orbit(f"SHIP-{i}") for i in range(50))
+            )
+        finally:
+            await client.close()
+
+    navs = asyncio.run(main())
+    assert len(navs) == 50
+    assert all(nav.status == ShipNavStatus.in_orbit for nav in navs)
@@ -0,0 +1,54 @@
+import httpx
+
+from astrotraders.api.cache import ResponseCache
+from tests.payloads import AGENT, waypoint
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/my/agent":
+        return httpx.Response(200, json={"data": AGENT})
+    return httpx.Response(200, json={"data": waypoint("X1-A-B")})
+
+
+def recording(paths: list[str]):
+    def recording_handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        return handler(request)
+
+    return recording_handler
+
+
+def test_policies():
+    cache = ResponseCache()
+    assert cache.ttl("/systems/X1-A/waypoints/X1-A-B/market") == 30
+    assert cache.ttl("/systems/X1-A/waypoints/X1-A-B/jump-gate") == 3600
+    assert cache.ttl("/my/ships/SHIP/nav") is None
+
+
+def test_fresh_responses_are_reused_until_expired(clock, make_client):
+    paths: list[str] = []
+    client = make_client(recording(paths), response_cache=ResponseCache(clock=clock))
+
+    for _ in range(3):
+        client.systems.waypoints.get("X1-A", "X1-A-B")
+        client.agents.info()
+    clock.now += 3601
+    client.systems.waypoints.get("X1-A", "X1-A-B")
+
+    assert paths.count("/systems/X1-A/waypoints/X1-A-B") == 2
+    assert paths.count("/my/agent") == 3
+    assert client.response_cache.hits == 2
+    assert client.response_cache.misses == 2
+
+
+def test_lru_eviction_and_invalidation():
+    cache = ResponseCache(maxsize=2)
+    cache.set("a", "/systems/A", 1, 10)
+    cache.set("b", "/systems/B", 2, 10)
+    assert cache.get("a") == 1
+    cache.set("c", "/systems/C", 3, 10)
+
+    assert cache.get("b") is None
+    assert cache.evictions == 1
+    assert cache.invalidate("^/systems/A$") == 1
+    assert len(cache) == 1
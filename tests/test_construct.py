@@ -0,0 +1,152 @@
+import pickle
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from astrotraders.api.construct import construct, lazy
+from astrotraders.api.schemas import (
+    Cooldown,
+    Market,
+    PaginatedObject,
+    ShipNavFlightMode,
+    ShipNavStatus,
+    ShipSchema,
+    System,
+)
+from tests.payloads import (
+    market,
+    paginated,
+    ship,
+    system,
+    trade_good,
+    transaction,
+    waypoint,
+)
+
+COOLDOWN = {
+    "shipSymbol": "SHIP-1",
+    "totalSeconds": 60,
+    "remainingSeconds": 12,
+    "expiration": "2030-01-01T00:01:00.123Z",
+}
+
+
+@pytest.mark.parametrize(
+    "model, data",
+    [
+        (PaginatedObject[ShipSchema], paginated([ship("A"), ship("B")], 1, 20)),
+        (System, system(3)),
+        (
+            Market,
+            market(
+                "X1-A-1",
+                [trade_good("IRON_ORE", 10, 8)],
+                [transaction("X1-A-1", "IRON_ORE", "SELL", 8, "2030-01-01T00:00:00Z")],
+            ),
+        ),
+        (Cooldown, COOLDOWN),
+    ],
+)
+def test_construct_matches_validation(model, data):
+    built = construct(model, data)
+    assert built == model(**data)
+    assert built.__fields_set__ == model(**data).__fields_set__
+
+
+def test_construct_builds_nested_types():
+    built = construct(ShipSchema, ship("A"))
+    assert built.nav.flight_mode is ShipNavFlightMode.cruise
+    assert built.nav.route.arrival.year == 2023
+    # optional fields missing from data get their defaults
+    assert built.fuel.consumed is None
+
+
+@pytest.mark.parametrize("validate", [True, False])
+def test_lazy_model_builds_fields_on_read(validate):
+    data = ship("A")
+    built = lazy(ShipSchema, data, validate)
+
+    assert isinstance(built, ShipSchema)
+    assert built.nav.status is ShipNavStatus.docked
+    assert list(built.__dict__) == ["nav"]
+    assert list(built.nav.__dict__) == ["status"]
+    assert built == ShipSchema(**data)
+    assert list(built.dict()) == list(ShipSchema.__fields__)
+    restored = pickle.loads(pickle.dumps(built))
+    assert type(restored) is ShipSchema and restored == built
+
+
+def test_lazy_model_validates_fields_on_read():
+    data = ship("A")
+    data["fuel"] = {"current": -1, "capacity": 100}
+    built = lazy(ShipSchema, data)
+    assert built.cargo.units == 0
+    fuel = built.fuel
+    assert fuel.capacity == 100
+    with pytest.raises(ValidationError):
+        fuel.current
+
+
+def invalid_ship(request: httpx.Request) -> httpx.Response:
+    data = ship("A")
+    data["fuel"] = {"current": -1, "capacity": 100}
+    return httpx.Response(200, json=paginated([data], 1, 20))
+
+
+def test_validation_can_be_turned_off_per_client_and_per_call(make_client):
+    client = make_client(invalid_ship, validate=False)
+    assert client.fleet.list().objects[0].fuel.current == -1
+    with pytest.raises(ValidationError):
+        client.fleet.list(validate=True)
+
+    client = make_client(invalid_ship, validate=True)
+    assert client.fleet.all_ships(validate=False)[0].fuel.current == -1
+    with pytest.raises(ValidationError):
+        client.fleet.list()
+
+
+def test_validation_can_be_turned_off_per_call_on_reads(make_client):
+    invalid = {**waypoint("X1-A-B"), "x": "far"}
+    stats = {
+        "status": "ok",
+        "stats": {"agents": 1, "ships": "many", "systems": 1, "waypoints": 1},
+        "leaderboards": {"mostCredits": [], "mostSubmittedCharts": []},
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/":
+            return httpx.Response(200, json=stats)
+        if request.url.path.endswith("/waypoints"):
+            return httpx.Response(200, json=paginated([invalid], 1, 20))
+        return httpx.Response(200, json={"data": invalid})
+
+    client = make_client(handler)
+    waypoints = client.systems.waypoints
+    assert waypoints.list("X1-A", validate=False).objects[0].x == "far"
+    assert next(waypoints.iter_waypoints("X1-A", validate=False)).x == "far"
+    assert waypoints.all_waypoints("X1-A", validate=False)[0].x == "far"
+    assert waypoints.get("X1-A", "X1-A-B", validate=False).x == "far"
+    assert client.server.stats(validate=False).stats.ships == "many"
+    with pytest.raises(ValidationError):
+        waypoints.get("X1-A", "X1-A-B")
+    with pytest.raises(ValidationError):
+        client.server.stats()
+
+
+def test_sampled_validation(make_client, monkeypatch):
+    client = make_client(invalid_ship, validate=0.25)
+    monkeypatch.setattr("astrotraders.api.wrapper.random.random", lambda: 0.5)
+    assert client.fleet.list().objects[0].fuel.current == -1
+    monkeypatch.setattr("astrotraders.api.wrapper.random.random", lambda: 0.1)
+    with pytest.raises(ValidationError):
+        client.fleet.list()
+
+
+def test_lazy_client(make_client):
+    client = make_client(invalid_ship, validate=True, lazy=True)
+    page = client.fleet.list()
+    assert page.objects[0].nav.status is ShipNavStatus.docked
+    with pytest.raises(ValidationError):
+        page.objects[0].fuel.current
+    assert client.fleet.list(validate=False).objects[0].fuel.current == -1
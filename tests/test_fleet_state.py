@@ -0,0 +1,162 @@
+import asyncio
+from collections import Counter
+
+import httpx
+
+from astrotraders.api.fleet_state import FleetState
+from astrotraders.api.schemas import ShipNav, ShipNavFlightMode, ShipNavStatus
+from tests.payloads import AGENT, CARGO, NAV, paginated, ship
+
+# 2030-01-01T00:00:00Z
+NOW = 1_893_456_000.0
+
+
+class FleetHandler:
+    def __init__(self) -> None:
+        self.calls: Counter = Counter()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        self.calls[request.method, path] += 1
+        if path == "/my/ships":
+            ships = [ship("SHIP-1"), ship("SHIP-2")]
+            return httpx.Response(200, json=paginated(ships, 1, 20))
+        action = path.rsplit("/", 1)[-1]
+        if action in ("orbit", "dock"):
+            status = "IN_ORBIT" if action == "orbit" else "DOCKED"
+            return httpx.Response(
+                200, json={"data": {"nav": {**NAV, "status": status}}}
+            )
+        if action == "extract":
+            cooldown = {
+                "shipSymbol": "SHIP-1",
+                "totalSeconds": 60,
+                "remainingSeconds": 60,
+                "expiration": "2030-01-01T00:01:00Z",
+            }
+            extraction = {
+                "shipSymbol": "SHIP-1",
+                "yield": {"symbol": "IRON_ORE", "units": 5},
+            }
+            cargo = {**CARGO, "units": 5}
+            body = {"cooldown": cooldown, "extraction": extraction, "cargo": cargo}
+            return httpx.Response(201, json={"data": body})
+        if action == "navigate":
+            route = {**NAV["route"], "arrival": "2030-01-01T00:02:00Z"}
+            nav = {**NAV, "status": "IN_TRANSIT", "route": route}
+            fuel = {"current": 60, "capacity": 100}
+            return httpx.Response(200, json={"data": {"nav": nav, "fuel": fuel}})
+        if action == "transfer":
+            return httpx.Response(200, json={"data": {"cargo": CARGO}})
+        if action == "cooldown":
+            return httpx.Response(204)
+        if action == "cargo":
+            return httpx.Response(200, json={"data": CARGO})
+        if action == "refuel":
+            fuel = {"current": 100, "capacity": 100}
+            return httpx.Response(200, json={"data": {"agent": AGENT, "fuel": fuel}})
+        return httpx.Response(200, json={"data": ship(action)})
+
+
+def test_reads_are_served_from_action_responses(make_client):
+    handler = FleetHandler()
+    client = make_client(handler, fleet_state=FleetState())
+
+    assert client.fleet.get("SHIP-1").nav.status == ShipNavStatus.docked
+    client.fleet.orbit("SHIP-1")
+    assert client.fleet.get("SHIP-1").nav.status == ShipNavStatus.in_orbit
+    assert client.fleet.nav("SHIP-1").status == ShipNavStatus.in_orbit
+    assert handler.calls["GET", "/my/ships/SHIP-1"] == 1
+    assert handler.calls["GET", "/my/ships/SHIP-1/nav"] == 0
+
+    client.fleet.get("SHIP-1", refresh=True)
+    assert handler.calls["GET", "/my/ships/SHIP-1"] == 2
+    assert client.fleet_state.hits == 2
+
+
+def test_cooldown_and_arrival_follow_the_clock(clock, make_client):
+    clock.now = NOW
+    handler = FleetHandler()
+    client = make_client(handler, fleet_state=FleetState(clock=clock))
+
+    client.fleet.extract("SHIP-1")
+    assert client.fleet.cargo.get("SHIP-1").units == 5
+    clock.now += 20
+    assert client.fleet.cooldown("SHIP-1").remaining_seconds == 40
+    clock.now += 40
+    assert client.fleet.cooldown("SHIP-1") is None
+    assert handler.calls["GET", "/my/ships/SHIP-1/cargo"] == 0
+    assert handler.calls["GET", "/my/ships/SHIP-1/cooldown"] == 0
+
+    client.fleet.navigate("SHIP-1", "X1-DF55-20250Z")
+    assert client.fleet.nav("SHIP-1").status == ShipNavStatus.in_transit
+    assert client.fleet_state.fuel("SHIP-1").current == 60
+    clock.now += 60
+    assert client.fleet.nav("SHIP-1").status == ShipNavStatus.in_orbit
+    assert handler.calls["GET", "/my/ships/SHIP-1/nav"] == 0
+
+
+def test_misses_and_stale_parts_are_fetched(clock, make_client):
+    clock.now = NOW
+    handler = FleetHandler()
+    client = make_client(handler, fleet_state=FleetState(max_age=30, clock=clock))
+
+    # no cooldown is remembered as well
+    assert client.fleet.cooldown("SHIP-1") is None
+    assert client.fleet.cooldown("SHIP-1") is None
+    assert handler.calls["GET", "/my/ships/SHIP-1/cooldown"] == 1
+
+    client.fleet.all_ships()
+    client.fleet.get("SHIP-2")
+    client.fleet.dock("SHIP-2")
+    clock.now += 31
+    client.fleet.get("SHIP-2")
+    assert handler.calls["GET", "/my/ships/SHIP-2"] == 1
+
+    # the receiving ship's cargo is unknown after a transfer
+    client.fleet.cargo.get("SHIP-2")
+    client.fleet.cargo.transfer("SHIP-1", "SHIP-2", "IRON_ORE", 5)
+    client.fleet.cargo.get("SHIP-2")
+    assert handler.calls["GET", "/my/ships/SHIP-2/cargo"] == 1
+
+
+def test_async_client_updates_state(make_async_client):
+    handler = FleetHandler()
+    state = FleetState()
+
+    async def main() -> ShipNav:
+        client = make_async_client(handler, fleet_state=state)
+        async for _ in client.fleet.iter_ships():
+            pass
+        await client.fleet.refuel("SHIP-2")
+        await client.fleet.orbit("SHIP-2")
+        ship = await client.fleet.get("SHIP-2")
+        assert ship.fuel.current == 100
+        return await client.fleet.nav("SHIP-2")
+
+    assert asyncio.run(main()).status == ShipNavStatus.in_orbit
+    assert len(state) == 2
+    assert handler.calls["GET", "/my/ships/SHIP-2"] == 0
+
+
+def test_redundant_actions_are_skipped(make_client):
+    handler = FleetHandler()
+    client = make_client(handler, fleet_state=FleetState(skip_redundant=True))
+
+    # unknown ships are always asked
+    client.fleet.orbit("SHIP-1")
+    for _ in range(3):
+        assert client.fleet.orbit("SHIP-1").status == ShipNavStatus.in_orbit
+    client.fleet.dock("SHIP-1")
+    client.fleet.dock("SHIP-1")
+    assert client.fleet.flight_mode("SHIP-1", ShipNavFlightMode.cruise)
+    assert handler.calls["POST", "/my/ships/SHIP-1/orbit"] == 1
+    assert handler.calls["POST", "/my/ships/SHIP-1/dock"] == 1
+    assert handler.calls["PATCH", "/my/ships/SHIP-1/nav"] == 0
+    assert client.fleet_state.saved == {"orbit": 3, "dock": 1, "flight_mode": 1}
+
+    # only opted in states skip actions
+    plain = make_client(handler, fleet_state=FleetState())
+    plain.fleet.orbit("SHIP-2")
+    plain.fleet.orbit("SHIP-2")
+    assert handler.calls["POST", "/my/ships/SHIP-2/orbit"] == 2
@@ -0,0 +1,105 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from astrotraders.api.schemas import System
+from astrotraders.api.universe import UniverseCache
+from astrotraders.game.galaxy import GalaxyStore, GridIndex
+from tests.payloads import system
+
+
+def make_systems(count: int, seed: int = 1) -> list[dict]:
+    rng = random.Random(seed)
+    systems = []
+    for index in range(count):
+        item = system(index)
+        item["x"], item["y"] = rng.randint(-5000, 5000), rng.randint(-5000, 5000)
+        if index % 7 == 0:
+            item["type"] = "NEUTRON_STAR"
+            item["waypoints"].append(
+                {"symbol": f"X1-S{index}-J1", "type": "JUMP_GATE", "x": 5, "y": 5}
+            )
+        systems.append(item)
+    # a dense cluster, like the starting area
+    for item in systems[:50]:
+        item["x"], item["y"] = rng.randint(-20, 20), rng.randint(-20, 20)
+    return systems
+
+
+SYSTEMS = make_systems(1000)
+
+
+def brute_nearest(points, x, y, k, mask=None):
+    distances = np.hypot(points[:, 0] - x, points[:, 1] - y)
+    if mask is not None:
+        distances[~mask] = np.inf
+    return np.sort(distances)[: min(k, len(points) if mask is None else mask.sum())]
+
+
+def test_grid_index_matches_brute_force():
+    rng = np.random.default_rng(2)
+    points = rng.integers(-1000, 1000, (500, 2)).astype(float)
+    index = GridIndex(points)
+    for _ in range(100):
+        x, y = rng.uniform(-1200, 1200, 2)
+        k = int(rng.integers(1, 30))
+        mask = rng.random(len(points)) < 0.05
+        for query_mask in (None, mask):
+            found = index.nearest(x, y, k, query_mask)
+            distances = np.hypot(points[found, 0] - x, points[found, 1] - y)
+            assert np.allclose(distances, brute_nearest(points, x, y, k, query_mask))
+
+        radius = rng.uniform(0, 300)
+        found = index.within(x, y, radius)
+        distances = np.hypot(points[found, 0] - x, points[found, 1] - y)
+        expected = brute_nearest(points, x, y, len(points))
+        assert np.allclose(distances, expected[expected <= radius])
+
+
+def test_empty_index():
+    index = GridIndex(np.empty((0, 2)))
+    assert len(index.nearest(0, 0, 3)) == 0
+    assert len(index.within(0, 0, 10)) == 0
+
+
+def test_store_queries():
+    store = GalaxyStore.from_raw(SYSTEMS)
+    assert len(store) == 1000
+    assert store.coordinates("X1-S100") == (SYSTEMS[100]["x"], SYSTEMS[100]["y"])
+    assert store.waypoints("X1-S7") == ["X1-S7-A1", "X1-S7-J1"]
+
+    nearest = store.nearest("X1-S0", k=5)
+    assert "X1-S0" not in nearest
+    assert store.nearest("X1-S0", k=5, include_self=True)[0] == "X1-S0"
+    distances = store.distances("X1-S0")
+    expected = np.sort(distances)[1:6]
+    assert np.allclose([distances[store.system_index[s]] for s in nearest], expected)
+
+    gates = store.systems_with_waypoint("JUMP_GATE")
+    assert gates.sum() == len(range(0, 1000, 7))
+    assert (gates == store.systems_of_type("NEUTRON_STAR")).all()
+    assert all(
+        int(symbol[4:]) % 7 == 0 for symbol in store.nearest((0, 0), 10, mask=gates)
+    )
+    assert store.within((0, 0), 30, mask=store.mask(["X1-S1", "X1-S999"])) in (
+        ["X1-S1"],
+        [],
+    )
+
+
+def test_store_sources_are_equivalent():
+    cache = UniverseCache()
+    cache.put_many(UniverseCache.SYSTEMS, ((s["symbol"], s) for s in SYSTEMS))
+    models = [System.parse_obj(item) for item in SYSTEMS]
+    stores = [
+        GalaxyStore.from_raw(SYSTEMS),
+        GalaxyStore.from_systems(models),
+        GalaxyStore.from_cache(cache),
+    ]
+    # the cache orders systems by symbol, so systems at equal distance may swap places
+    for store in stores:
+        assert set(store.within("X1-S10", 500)) == set(stores[0].within("X1-S10", 500))
+        assert store.nearest("X1-S500", 3) == stores[0].nearest("X1-S500", 3)
+        assert len(store.waypoint_symbols) == len(stores[0].waypoint_symbols)
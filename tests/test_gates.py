@@ -0,0 +1,115 @@
+import math
+import random
+
+import httpx
+
+from astrotraders.api.schemas import JumpGate
+from astrotraders.api.universe import UniverseCache
+from astrotraders.game.gates import GateGraph
+
+
+def jump_gate(connections: dict[str, int]) -> dict:
+    return {
+        "jumpRange": 2000,
+        "connectedSystems": [
+            {
+                "symbol": symbol,
+                "sectorSymbol": "X1",
+                "type": "RED_STAR",
+                "x": 0,
+                "y": 0,
+                "distance": distance,
+            }
+            for symbol, distance in connections.items()
+        ],
+    }
+
+
+def random_graph(count: int, seed: int) -> GateGraph:
+    rng = random.Random(seed)
+    points = [(rng.uniform(0, 10000), rng.uniform(0, 10000)) for _ in range(count)]
+    graph = GateGraph(landmarks=4)
+    for a in range(count):
+        for b in rng.sample(range(count), 4):
+            distance = round(math.dist(points[a], points[b]))
+            if distance < 4000:
+                graph.add_edge(f"X1-S{a}", f"X1-S{b}", distance)
+    return graph
+
+
+def test_shortest_path_matches_dijkstra():
+    graph = random_graph(300, seed=1)
+    rng = random.Random(2)
+    for _ in range(100):
+        start, goal = rng.sample(graph.systems, 2)
+        route = graph.shortest_path(start, goal)
+        expected = graph._dijkstra(graph._index[start])[graph._index[goal]]
+        if route is None:
+            assert expected == math.inf
+            continue
+        assert route.distance == expected
+        assert (route.systems[0], route.systems[-1]) == (start, goal)
+        legs = zip(route.systems, route.systems[1:])
+        assert sum(graph.neighbours(a)[b] for a, b in legs) == expected
+        assert graph.fewest_hops(start, goal).hops <= route.hops
+
+
+def test_fewest_hops_prefers_shorter_among_equal():
+    graph = GateGraph()
+    graph.add_gate("A", jump_gate({"B": 1, "C": 1, "D": 10}))
+    graph.add_gate("D", JumpGate.parse_obj(jump_gate({"E": 10})))
+    graph.add_connections("B", jump_gate({"C": 1})["connectedSystems"])
+    graph.add_edge("C", "E", 1)
+    graph.add_edge("B", "E", 5)
+
+    assert graph.shortest_path("A", "E") == (["A", "C", "E"], 2)
+    assert graph.fewest_hops("A", "E") == (["A", "C", "E"], 2)
+    graph.add_edge("A", "E", 30)
+    assert graph.fewest_hops("A", "E") == (["A", "E"], 30)
+    assert graph.shortest_path("A", "E").hops == 2
+    assert graph.shortest_path("A", "A") == (["A"], 0)
+
+
+def test_unreachable_and_unknown():
+    graph = GateGraph()
+    graph.add_edge("A", "B", 5)
+    graph.add_edge("C", "D", 5)
+    assert graph.shortest_path("A", "D") is None
+    assert graph.fewest_hops("A", "D") is None
+    assert graph.shortest_path("A", "Z") is None
+    # connecting components invalidates landmarks
+    graph.add_edge("B", "C", 1)
+    assert graph.shortest_path("A", "D") == (["A", "B", "C", "D"], 11)
+
+
+def test_isolated_system_added_after_query():
+    graph = GateGraph()
+    graph.add_edge("A", "B", 5)
+    assert graph.shortest_path("A", "B") == (["A", "B"], 5)
+    graph.add_connections("C", [])
+    assert graph.shortest_path("A", "C") is None
+    assert graph.fewest_hops("C", "A") is None
+    assert graph.shortest_path("C", "C") == (["C"], 0)
+
+
+def test_incremental_build_from_cache(make_client):
+    gates = {
+        "X1-A-GATE": jump_gate({"X1-B": 100}),
+        "X1-B-GATE": jump_gate({"X1-A": 100, "X1-C": 50}),
+    }
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        waypoint = request.url.path.split("/")[4]
+        return httpx.Response(200, json={"data": gates[waypoint]})
+
+    cache = UniverseCache()
+    client = make_client(handler, universe_cache=cache)
+    graph = GateGraph()
+    graph.add_gate("X1-A", client.systems.waypoints.jump_gate("X1-A", "X1-A-GATE"))
+    assert graph.frontier() == ["X1-B"]
+    assert graph.shortest_path("X1-A", "X1-C") is None
+
+    client.systems.waypoints.jump_gate("X1-B", "X1-B-GATE")
+    restored = GateGraph.from_cache(cache)
+    assert restored.is_explored("X1-B") and not restored.is_explored("X1-C")
+    assert restored.shortest_path("X1-A", "X1-C") == (["X1-A", "X1-B", "X1-C"], 150)
@@ -0,0 +1,64 @@
+import subprocess
+import sys
+
+import orjson
+
+# self time of our own modules, far above usual values, but below an eager schemas import
+PACKAGE_BUDGET_MS = 10
+CLIENT_BUDGET_MS = 60
+
+
+def run(statement: str) -> tuple[list[str], float]:
+    """
+    Modules from ``sys.modules`` after a statement, run in a new interpreter,
+    and milliseconds spent importing ``astrotraders`` modules themselves.
+    """
+    code = f"{statement}\nimport json, sys\nprint(json.dumps(list(sys.modules)))"
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    own = 0
+    for line in result.stderr.splitlines():
+        if line.startswith("import time:") and "astrotraders" in line:
+            own += int(line[len("import time:") :].split("|")[0])
+    return orjson.loads(result.stdout), own / 1e3
+
+
+def test_package_import_is_cheap():
+    modules, own = run("import astrotraders")
+    assert not [name for name in modules if name.split(".")[0] in ("httpx", "pydantic")]
+    assert own < PACKAGE_BUDGET_MS
+
+
+def test_client_loads_schemas_with_first_resource():
+    modules, own = run(
+        "import astrotraders\nclient = astrotraders.AstroTradersClient.set_up('token')"
+    )
+    assert "astrotraders.api.schemas" not in modules
+    assert not [
+        name for name in modules if name.startswith("astrotraders.api.resources")
+    ]
+    assert own < CLIENT_BUDGET_MS
+
+    modules, _ = run(
+        "import astrotraders\n"
+        "client = astrotraders.AstroTradersClient.set_up('token')\n"
+        "client.fleet"
+    )
+    assert "astrotraders.api.schemas" in modules
+    assert "astrotraders.api.resources.fleet" in modules
+    assert "astrotraders.api.resources.contracts" not in modules
+
+
+def test_lazy_names():
+    import astrotraders
+    from astrotraders.api import resources
+    from astrotraders.api.client import AstroTradersClient
+    from astrotraders.api.resources.fleet import AsyncFleetResource
+
+    assert astrotraders.AstroTradersClient is AstroTradersClient
+    assert resources.AsyncFleetResource is AsyncFleetResource
+    assert "AsyncAstroTradersClient" in dir(astrotraders)
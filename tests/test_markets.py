@@ -0,0 +1,108 @@
+import httpx
+
+from astrotraders.api.cache import ResponseCache
+from astrotraders.api.markets import MarketStore
+from astrotraders.api.schemas import Market, TradeSymbol
+from tests.payloads import AGENT, CARGO, market, trade_good, transaction
+
+
+def test_latest_prices_and_best_markets(clock):
+    store = MarketStore(clock=clock)
+    store.record_market(
+        Market.parse_obj(
+            market("X1-A-1", [trade_good("IRON_ORE", 10, 8), trade_good("FUEL", 5, 4)])
+        )
+    )
+    clock.now += 100
+    store.record_market(
+        Market.parse_obj(market("X1-A-2", [trade_good("IRON_ORE", 12, 11)]))
+    )
+
+    assert store.cheapest(TradeSymbol.iron_ore).waypoint == "X1-A-1"
+    assert store.best_sell("IRON_ORE").waypoint == "X1-A-2"
+    assert store.cheapest("IRON_ORE", max_age=50).waypoint == "X1-A-2"
+    assert store.cheapest("GOLD") is None
+    assert {point.symbol for point in store.latest(waypoint="X1-A-1")} == {
+        "IRON_ORE",
+        "FUEL",
+    }
+    assert store.symbols() == ["FUEL", "IRON_ORE"]
+    assert store.waypoints() == ["X1-A-1", "X1-A-2"]
+
+
+def test_history_only_keeps_changes(tmp_path, clock):
+    path = tmp_path / "markets.sqlite"
+    store = MarketStore(path, clock=clock)
+    for price in (10, 10, 11, 11, 9):
+        store.record_market(
+            Market.parse_obj(market("X1-A-1", [trade_good("IRON_ORE", price, 8)]))
+        )
+        clock.now += 10
+
+    history = store.history("IRON_ORE", waypoint="X1-A-1")
+    assert [point.purchase_price for point in history] == [10, 11, 9]
+    assert store.latest("IRON_ORE")[0].timestamp == clock.now - 10
+    assert len(store.history("IRON_ORE", since=clock.now - 15)) == 1
+    store.close()
+
+    restored = MarketStore(path)
+    assert restored.cheapest("IRON_ORE").purchase_price == 9
+
+
+def test_transactions_are_recorded_once():
+    store = MarketStore()
+    item = transaction("X1-A-1", "IRON_ORE", "SELL", 15, "2023-06-01T00:00:00Z")
+    payload = market("X1-A-1", [trade_good("IRON_ORE", 10, 8)], [item])
+    store.record_market(Market.parse_obj(payload), timestamp=0)
+    store.record_market(Market.parse_obj(payload), timestamp=0)
+
+    assert len(store.transactions()) == 1
+    assert store.transactions("IRON_ORE", "X1-A-1")[0].price_per_unit == 15
+    # the transaction is newer than the snapshot
+    assert store.best_sell("IRON_ORE").sell_price == 15
+    assert store.transactions(waypoint="X1-A-2") == []
+
+
+def test_store_is_fed_by_resources(make_client):
+    sold = transaction("X1-A-1", "IRON_ORE", "SELL", 20, "2030-01-01T00:00:00Z")
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/market"):
+            goods = [trade_good("IRON_ORE", 10, 8)]
+            return httpx.Response(200, json={"data": market("X1-A-1", goods)})
+        body = {"agent": AGENT, "cargo": CARGO, "transaction": sold}
+        return httpx.Response(201, json={"data": body})
+
+    client = make_client(handler, market_store=MarketStore())
+    client.systems.waypoints.market("X1-A", "X1-A-1")
+    assert client.market_store.best_sell("IRON_ORE").sell_price == 8
+    client.fleet.cargo.sell("SHIP-1", "IRON_ORE", 10)
+    assert client.market_store.best_sell("IRON_ORE").sell_price == 20
+    assert len(client.market_store.transactions()) == 1
+
+
+def test_cached_markets_are_not_recorded_again(clock, make_client):
+    requests = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request)
+        goods = [trade_good("IRON_ORE", 10, 8)]
+        return httpx.Response(200, json={"data": market("X1-A-1", goods)})
+
+    client = make_client(
+        handler,
+        response_cache=ResponseCache(clock=clock),
+        market_store=MarketStore(clock=clock),
+    )
+    client.systems.waypoints.market("X1-A", "X1-A-1")
+    clock.now += 20
+    client.systems.waypoints.market("X1-A", "X1-A-1")
+    assert len(requests) == 1
+    # the cached market doesn't make the prices look fresh
+    assert client.market_store.latest("IRON_ORE", max_age=10) == []
+    assert len(client.market_store.history("IRON_ORE")) == 1
+
+    clock.now += 20
+    client.systems.waypoints.market("X1-A", "X1-A-1")
+    assert len(requests) == 2
+    assert client.market_store.latest("IRON_ORE", max_age=10)
@@ -0,0 +1,198 @@
+import asyncio
+
+import httpx
+import pytest
+
+from astrotraders import AstroTradersClient, AsyncAstroTradersClient
+from astrotraders.api.exceptions import APIException
+from astrotraders.api.fleet_state import FleetState
+from astrotraders.api.schemas import ShipNavFlightMode, ShipNavStatus, ShipType
+from astrotraders.mock import MockGame, MockServer
+from astrotraders.mock.game import COOLDOWNS, fuel_cost, travel_time
+
+FRIGATE = "MOCK-AGENT-1"
+DRONE = "MOCK-AGENT-3"
+
+
+def fly(client: AstroTradersClient, clock, ship: str, waypoint: str) -> None:
+    client.fleet.orbit(ship)
+    route = client.fleet.navigate(ship, waypoint).nav.route
+    clock.now += (route.arrival - route.departure_time).total_seconds()
+    client.fleet.dock(ship)
+
+
+def test_reads_validate(mock_client: AstroTradersClient):
+    stats = mock_client.server.stats()
+    assert stats.stats.systems == 20
+    assert mock_client.agents.info().headquarters == "X1-M0-A1"
+    assert len(mock_client.systems.all_systems()) == 20
+    assert [system.symbol for system in mock_client.systems.stream_all()][:2] == [
+        "X1-M0",
+        "X1-M1",
+    ]
+    waypoints = mock_client.systems.waypoints.all_waypoints("X1-M0")
+    assert {waypoint.type.value for waypoint in waypoints} >= {"PLANET", "JUMP_GATE"}
+    gate = mock_client.systems.waypoints.jump_gate("X1-M0", "X1-M0-I1")
+    assert gate.connected_systems
+    assert mock_client.systems.waypoints.shipyard("X1-M0", "X1-M0-A1").ships
+    assert len(mock_client.factions.all_factions()) == 5
+    assert len(mock_client.contracts.all_contracts()) == 1
+    assert len(mock_client.fleet.all_ships()) == 3
+
+
+def test_market_prices_need_a_ship(mock_client: AstroTradersClient):
+    assert mock_client.systems.waypoints.market("X1-M0", "X1-M0-A1").trade_goods
+    assert mock_client.systems.waypoints.market("X1-M1", "X1-M1-A1").trade_goods is None
+
+
+def test_navigation_takes_fuel_and_time(mock_client: AstroTradersClient, clock):
+    mock_client.fleet.orbit(FRIGATE)
+    mock_client.fleet.flight_mode(FRIGATE, ShipNavFlightMode.burn)
+    result = mock_client.fleet.navigate(FRIGATE, "X1-M0-B1")
+
+    route = result.nav.route
+    distance = (
+        (route.departure.x - route.destination.x) ** 2
+        + (route.departure.y - route.destination.y) ** 2
+    ) ** 0.5
+    assert result.nav.status is ShipNavStatus.in_transit
+    assert result.fuel.consumed.amount == fuel_cost(distance, "BURN")
+    seconds = (route.arrival - route.departure_time).total_seconds()
+    assert seconds == travel_time(distance, 30, "BURN")
+
+    with pytest.raises(APIException) as error:
+        mock_client.fleet.dock(FRIGATE)
+    assert error.value.code == 4214
+    assert error.value.data["secondsToArrival"] == seconds
+
+    clock.now += seconds
+    nav = mock_client.fleet.nav(FRIGATE)
+    assert nav.status is ShipNavStatus.in_orbit
+    assert nav.waypoint_symbol == "X1-M0-B1"
+
+
+def test_travel_matches_planner():
+    pytest.importorskip("numpy")
+    from astrotraders.game import navigation
+
+    for distance in (0, 2.5, 17.49, 140):
+        for mode in ShipNavFlightMode:
+            assert travel_time(distance, 30, mode.value) == navigation.travel_time(
+                distance, 30, mode
+            )
+            assert fuel_cost(distance, mode.value) == navigation.fuel_cost(
+                distance, mode
+            )
+
+
+def test_cooldowns(mock_client: AstroTradersClient, clock):
+    extraction = mock_client.fleet.extract(DRONE)
+    assert extraction.cargo.units == extraction.extraction.yield_.units
+    assert mock_client.fleet.cooldown(DRONE).remaining_seconds == COOLDOWNS["extract"]
+
+    with pytest.raises(APIException) as error:
+        mock_client.fleet.extract(DRONE)
+    assert error.value.code == 4000
+
+    clock.now += COOLDOWNS["extract"]
+    assert mock_client.fleet.cooldown(DRONE) is None
+    assert mock_client.fleet.extract(DRONE).cargo.units > extraction.cargo.units
+
+
+def test_trade_and_contract(mock_client: AstroTradersClient, clock):
+    contract = mock_client.contracts.list().objects[0]
+    term = contract.terms.deliver[0]
+    credits = mock_client.contracts.accept(contract.id).agent.credits
+
+    fly(mock_client, clock, FRIGATE, "X1-M0-D1")
+    purchase = mock_client.fleet.cargo.purchase(FRIGATE, term.trade_symbol, 50)
+    assert purchase.agent.credits == credits - purchase.transaction.total_price
+    with pytest.raises(APIException) as error:
+        mock_client.fleet.cargo.purchase(FRIGATE, term.trade_symbol, 50)
+    assert error.value.code == 4228
+
+    with pytest.raises(APIException) as error:
+        mock_client.contracts.deliver(contract.id, FRIGATE, term.trade_symbol, 50)
+    assert error.value.code == 4510
+    fly(mock_client, clock, FRIGATE, term.destination_symbol)
+    result = mock_client.contracts.deliver(contract.id, FRIGATE, term.trade_symbol, 50)
+    assert result.cargo.units == 0
+    fulfilled = mock_client.contracts.fulfill(contract.id)
+    assert fulfilled.contract.fulfilled
+    assert fulfilled.agent.credits == (
+        purchase.agent.credits + contract.terms.payment.on_fulfilled
+    )
+
+
+def test_delivered_cargo_updates_fleet_state(mock_server: MockServer, clock):
+    client = AstroTradersClient.set_up(
+        "test",
+        "http://mock/v2",
+        rate=None,
+        transport=mock_server.transport(),
+        fleet_state=FleetState(clock=clock),
+    )
+    contract = client.contracts.list().objects[0]
+    term = contract.terms.deliver[0]
+    client.contracts.accept(contract.id)
+    fly(client, clock, FRIGATE, "X1-M0-D1")
+    client.fleet.cargo.purchase(FRIGATE, term.trade_symbol, 50)
+    fly(client, clock, FRIGATE, term.destination_symbol)
+
+    client.contracts.deliver(contract.id, FRIGATE, term.trade_symbol, 30)
+    requests = mock_server.requests
+    cargo = client.fleet.cargo.get(FRIGATE)
+    assert cargo.units == 20
+    assert mock_server.requests == requests
+
+
+def test_purchase_ship(mock_client: AstroTradersClient):
+    result = mock_client.fleet.purchase(ShipType.ship_light_hauler, "X1-M0-A1")
+    assert result.ship.symbol == "MOCK-AGENT-4"
+    assert mock_client.fleet.get("MOCK-AGENT-4").cargo.capacity == 60
+    with pytest.raises(APIException) as error:
+        mock_client.fleet.purchase(ShipType.ship_probe, "X1-M3-A1")
+    assert error.value.code == 4245
+
+
+def test_rate_limit(clock):
+    server = MockServer(MockGame(clock=clock), rate=1, burst=1)
+    client = httpx.Client(base_url="http://mock/v2", transport=server.transport())
+
+    assert [client.get("/systems/X1-M0").status_code for _ in range(3)] == [
+        200,
+        200,
+        429,
+    ]
+    response = client.get("/systems/X1-M0")
+    assert response.json()["error"]["data"]["retryAfter"] == pytest.approx(1.0)
+    assert response.headers["x-ratelimit-limit-per-second"] == "1"
+    clock.now += 1
+    assert client.get("/systems/X1-M0").status_code == 200
+    assert server.rate_limited == 2
+
+
+def test_errors(mock_server: MockServer):
+    client = httpx.Client(base_url="http://mock/v2", transport=mock_server.transport())
+    assert client.get("/my/agent").json()["error"]["code"] == 4100
+    assert client.get("/systems/X1-NOWHERE").status_code == 404
+    assert client.get("/systems", params={"limit": 50}).status_code == 422
+    assert client.delete("/systems").status_code == 405
+
+
+def test_asgi_and_socket():
+    server = MockServer(rate=None)
+
+    async def info() -> str:
+        client = AsyncAstroTradersClient.set_up(
+            "test",
+            "http://mock/v2",
+            rate=None,
+            transport=httpx.ASGITransport(app=server),
+        )
+        return (await client.agents.info()).symbol
+
+    assert asyncio.run(info()) == "MOCK-AGENT"
+    with server.serve() as url:
+        client = AstroTradersClient.set_up("test", url, rate=None)
+        assert client.fleet.nav(FRIGATE).status is ShipNavStatus.docked
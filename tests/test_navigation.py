@@ -0,0 +1,118 @@
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from astrotraders.api.schemas import ShipNavFlightMode, Waypoint
+from astrotraders.game.navigation import NavigationPlanner, fuel_cost, travel_time
+from tests.payloads import waypoint
+
+CRUISE, DRIFT, BURN = (
+    ShipNavFlightMode.cruise,
+    ShipNavFlightMode.drift,
+    ShipNavFlightMode.burn,
+)
+
+WAYPOINTS = [
+    waypoint("X1-A-HOME", 0, 0),
+    waypoint("X1-A-MARKET", 100, 0, traits=("MARKETPLACE",)),
+    waypoint("X1-A-FAR", 200, 0),
+    waypoint("X1-A-MOON", 0, 0),
+]
+
+
+def test_formulas():
+    assert int(travel_time(100, 30, CRUISE)) == 98
+    assert int(travel_time(100, 30, BURN)) == 57
+    assert int(travel_time(100, 30, DRIFT)) == 848
+    assert int(travel_time(0, 30, CRUISE)) == 16
+    assert [int(fuel_cost(100, mode)) for mode in (CRUISE, BURN, DRIFT)] == [
+        100,
+        200,
+        1,
+    ]
+    assert [int(fuel_cost(0, mode)) for mode in (CRUISE, BURN, DRIFT)] == [1, 2, 1]
+    assert travel_time(np.array([1, 2.5]), 10, CRUISE).tolist() == [18, 23]
+
+
+def test_estimate_and_direct_plans():
+    planner = NavigationPlanner([Waypoint.parse_obj(item) for item in WAYPOINTS])
+    assert planner.estimate("X1-A-HOME", "X1-A-MARKET", 30, BURN) == (57, 200)
+
+    plan = planner.plan("X1-A-HOME", "X1-A-MARKET", 30, fuel=400, capacity=400)
+    assert [(leg.mode, leg.fuel, leg.refuel) for leg in plan.legs] == [
+        (BURN, 200, False)
+    ]
+    plan = planner.plan("X1-A-HOME", "X1-A-MARKET", 30, fuel=150, capacity=400)
+    assert plan.legs[0].mode == CRUISE and plan.time == 98
+    # probes have no fuel tank and always burn
+    plan = planner.plan("X1-A-HOME", "X1-A-FAR", 30, fuel=0, capacity=0)
+    assert plan.legs[0].mode == BURN and plan.fuel == 0
+    assert planner.plan("X1-A-HOME", "X1-A-HOME", 30, 0, 100).legs == []
+
+
+def test_refuel_stops():
+    planner = NavigationPlanner(WAYPOINTS)
+    plan = planner.plan("X1-A-HOME", "X1-A-FAR", 30, fuel=100, capacity=200)
+    assert [(leg.destination, leg.mode) for leg in plan.legs] == [
+        ("X1-A-MARKET", CRUISE),
+        ("X1-A-FAR", BURN),
+    ]
+    assert plan.refuels == ["X1-A-MARKET"]
+    assert plan.time == 98 + 57
+
+    # no market nearby, drifting is the only way
+    plan = NavigationPlanner(WAYPOINTS, markets=[]).plan(
+        "X1-A-HOME", "X1-A-FAR", 30, fuel=100, capacity=200
+    )
+    assert [leg.mode for leg in plan.legs] == [DRIFT]
+    assert planner.plan("X1-A-HOME", "X1-A-FAR", 30, fuel=0, capacity=200) is None
+    # empty tank at a market is fine
+    plan = planner.plan("X1-A-MARKET", "X1-A-FAR", 30, fuel=0, capacity=200)
+    assert plan.refuels == ["X1-A-MARKET"]
+
+    with pytest.raises(ValueError):
+        planner.plan("X1-B-HOME", "X1-A-FAR", 30, 100, 100)
+
+
+def test_fleet_plans_match_single_plans():
+    rng = random.Random(4)
+    waypoints = [
+        waypoint(
+            f"X1-A-W{i}",
+            rng.randint(-300, 300),
+            rng.randint(-300, 300),
+            traits=("MARKETPLACE",) if i % 5 == 0 else (),
+        )
+        for i in range(40)
+    ]
+    planner = NavigationPlanner(waypoints)
+    symbols = planner.symbols
+    ships = [
+        (
+            rng.choice(symbols),
+            rng.choice(symbols),
+            rng.choice([2, 10, 30]),
+            rng.randint(0, 400),
+            rng.choice([0, 100, 400]),
+        )
+        for _ in range(200)
+    ]
+    ships = [ship[:3] + (min(ship[3], ship[4]), ship[4]) for ship in ships]
+    plans = planner.plan_many(*zip(*ships))
+    for ship, plan in zip(ships, plans):
+        assert plan == planner.plan(*ship)
+        if plan is None:
+            continue
+        origin, destination, _, fuel, capacity = ship
+        position = origin
+        for leg in plan.legs:
+            assert leg.origin == position
+            if leg.refuel:
+                assert planner.index[leg.origin] in planner.markets
+                fuel = capacity
+            fuel -= leg.fuel
+            assert fuel >= 0 or capacity == 0
+            position = leg.destination
+        assert position == destination
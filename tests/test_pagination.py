@@ -0,0 +1,71 @@
+import asyncio
+from itertools import islice
+
+import httpx
+
+from tests.payloads import system, paginated
+
+SYSTEMS = [system(i) for i in range(45)]
+
+
+class PagesHandler:
+    def __init__(self) -> None:
+        self.pages: list[int] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        page = int(request.url.params["page"])
+        limit = int(request.url.params["limit"])
+        self.pages.append(page)
+        return httpx.Response(200, json=paginated(SYSTEMS, page, limit))
+
+
+def test_iter_walks_every_page(make_client):
+    handler = PagesHandler()
+    client = make_client(handler)
+
+    symbols = [item.symbol for item in client.systems.iter_systems()]
+
+    assert symbols == [item["symbol"] for item in SYSTEMS]
+    assert handler.pages == [1, 2, 3]
+
+
+def test_iter_stops_early(make_client):
+    handler = PagesHandler()
+    client = make_client(handler)
+
+    assert len(list(islice(client.systems.iter_systems(limit=10), 15))) == 15
+    assert handler.pages == [1, 2]
+
+
+def test_async_iter_walks_every_page(make_async_client):
+    handler = PagesHandler()
+
+    async def main() -> list[str]:
+        client = make_async_client(handler)
+        return [item.symbol async for item in client.systems.iter_systems()]
+
+    assert len(asyncio.run(main())) == 45
+    assert handler.pages == [1, 2, 3]
+
+
+def test_all_fetches_remaining_pages_concurrently(make_client):
+    handler = PagesHandler()
+    client = make_client(handler)
+
+    systems = client.systems.all_systems(limit=5, concurrency=4)
+
+    assert [item.symbol for item in systems] == [item["symbol"] for item in SYSTEMS]
+    assert handler.pages[0] == 1
+    assert sorted(handler.pages) == list(range(1, 10))
+
+
+def test_async_all_keeps_listing_order(make_async_client):
+    handler = PagesHandler()
+
+    async def main() -> list[str]:
+        client = make_async_client(handler)
+        systems = await client.systems.all_systems(limit=5, concurrency=3)
+        return [item.symbol for item in systems]
+
+    assert asyncio.run(main()) == [item["symbol"] for item in SYSTEMS]
+    assert sorted(handler.pages) == list(range(1, 10))
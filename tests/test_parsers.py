@@ -0,0 +1,104 @@
+import httpx
+import pytest
+from pydantic import ValidationError
+from pydantic.datetime_parse import parse_datetime as pydantic_datetime
+
+from astrotraders.api import parsers
+from astrotraders.api.parsers import generate, parse_datetime, parser
+from astrotraders.api.schemas import (
+    Cooldown,
+    ShipCargo,
+    ShipFuel,
+    ShipNav,
+    ShipNavRoute,
+    ShipNavStatus,
+    ShipSchema,
+)
+from tests.payloads import CARGO, NAV
+from tests.test_construct import COOLDOWN
+
+FULL_CARGO = {
+    **CARGO,
+    "units": 7,
+    "inventory": [
+        {"symbol": "IRON_ORE", "name": "Iron ore", "description": "Ore", "units": 7}
+    ],
+}
+FUEL = {
+    "current": 60,
+    "capacity": 100,
+    "consumed": {"amount": 40, "timestamp": "2030-01-01T00:00:00.5+02:00"},
+}
+
+
+@pytest.mark.parametrize(
+    "model, data",
+    [
+        (ShipNav, NAV),
+        (ShipNavRoute, NAV["route"]),
+        (Cooldown, COOLDOWN),
+        (ShipCargo, FULL_CARGO),
+        (ShipFuel, FUEL),
+        (ShipFuel, {"current": 60, "capacity": 100}),
+    ],
+)
+def test_parsers_match_pydantic(model, data):
+    parsed = parser(model)(data)
+    expected = model(**data)
+    assert type(parsed) is model
+    assert parsed == expected
+    assert parsed.__fields_set__ == expected.__fields_set__
+
+
+def test_unusual_data_is_left_to_pydantic():
+    parse = parser(ShipCargo)
+    # coerced by pydantic
+    assert parse({**CARGO, "units": "3"}).units == 3
+    with pytest.raises(ValidationError):
+        parse({**CARGO, "units": -1})
+    with pytest.raises(ValidationError):
+        parser(ShipNav)({**NAV, "status": "LANDED"})
+    with pytest.raises(ValidationError):
+        parser(Cooldown)({key: COOLDOWN[key] for key in ("shipSymbol", "expiration")})
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2030-01-01T00:01:00Z",
+        "2030-01-01T00:01:00.1Z",
+        "2030-01-01T00:01:00.123456Z",
+        "2030-01-01T00:01:00-05:30",
+    ],
+)
+def test_datetimes(value):
+    parsed = parse_datetime(value)
+    assert parsed == pydantic_datetime(value)
+    assert parsed.utcoffset() == pydantic_datetime(value).utcoffset()
+    assert parse_datetime(value) is parsed
+
+
+def test_only_fast_models_have_parsers():
+    assert parser(ShipSchema) is None
+    assert parser(ShipNav) is parser(ShipNav)
+    # any model can be generated on request
+    assert generate(ShipSchema)
+
+
+def test_fleet_resource_uses_parsers(monkeypatch, make_client):
+    parsed = []
+
+    def spy(model):
+        parse = parser(model)
+        if parse is not None:
+            parsed.append(model)
+        return parse
+
+    monkeypatch.setattr(parsers, "parser", spy)
+    client = make_client(
+        lambda request: httpx.Response(
+            200, json={"data": {"nav": {**NAV, "status": "IN_ORBIT"}}}
+        )
+    )
+    assert client.fleet.orbit("SHIP-1").status is ShipNavStatus.in_orbit
+    assert parsed == [ShipNav]
@@ -0,0 +1,66 @@
+import httpx
+import pytest
+
+from astrotraders import AstroTradersClient
+from astrotraders.api.ratelimit import RateLimiter
+
+
+def test_steady_pool_then_burst_pool_then_wait(clock):
+    limiter = RateLimiter(rate=2, burst=3, burst_period=60, clock=clock)
+
+    delays = [limiter.reserve() for _ in range(5)]
+    assert delays == [0, 0, 0, 0, 0]
+
+    # both pools are empty, so the next requests queue up behind each other
+    assert limiter.reserve() == pytest.approx(0.5)
+    assert limiter.reserve() == pytest.approx(1.0)
+    assert limiter.delayed == 2
+    assert limiter.waited == pytest.approx(1.5)
+    assert limiter.requests == 7
+
+
+def test_refilled_burst_does_not_jump_the_queue(clock):
+    limiter = RateLimiter(rate=2, burst=1, burst_period=0.2, clock=clock)
+    assert [limiter.reserve() for _ in range(3)] == [0, 0, 0]
+    # two requests wait for steady tokens, to be sent at 0.5 and 1.0
+    start = clock.now
+    sends = [limiter.reserve() for _ in range(2)]
+
+    clock.now += 0.4
+    # the burst pool is full again, but the steady pool still owes the waiters
+    assert limiter.delay() > 0
+    sends.append(clock.now - start + limiter.reserve())
+    assert sends == sorted(sends)
+    assert sends[-1] == pytest.approx(1.5)
+
+
+def test_pools_refill_over_time(clock):
+    limiter = RateLimiter(rate=2, burst=6, burst_period=60, clock=clock)
+    for _ in range(8):
+        limiter.reserve()
+
+    clock.now += 10
+    # steady pool is capped at one second of requests, burst pool got 1 token
+    assert [limiter.reserve() for _ in range(3)] == [0, 0, 0]
+    assert limiter.reserve() > 0
+
+
+def test_wrapper_takes_token_for_each_request(make_client):
+    limiter = RateLimiter(rate=1000, burst=0)
+    client = make_client(
+        lambda request: httpx.Response(200, json={"status": "ok"}), rate_limiter=limiter
+    )
+    for _ in range(3):
+        client._client.raw_request("GET", "/")
+    assert client.rate_limiter is limiter
+    assert limiter.requests == 3
+
+
+def test_set_up_neither_throttles_nor_retries_by_default():
+    client = AstroTradersClient.set_up("token")
+    assert client.rate_limiter is None
+    assert client._client.retry_policy is None
+
+    client = AstroTradersClient.set_up("token", rate=2, retries=3)
+    assert client.rate_limiter.rate == 2
+    assert client._client.retry_policy.max_retries == 3
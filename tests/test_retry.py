@@ -0,0 +1,75 @@
+from typing import Iterator
+
+import httpx
+import pytest
+
+from astrotraders import AstroTradersClient
+from astrotraders.api.retry import RetryPolicy
+from tests.payloads import NAV
+
+
+def retrying_client(
+    make_client, responses: Iterator[httpx.Response], sleeps: list[float], monkeypatch
+) -> AstroTradersClient:
+    monkeypatch.setattr("astrotraders.api.wrapper.time.sleep", sleeps.append)
+    return make_client(
+        lambda request: next(responses),
+        retry_policy=RetryPolicy(max_retries=3, random_func=lambda: 0.5),
+    )
+
+
+def rate_limited(retry_after: float) -> httpx.Response:
+    error = {
+        "message": "Rate limited",
+        "code": 429,
+        "data": {"retryAfter": retry_after},
+    }
+    return httpx.Response(429, json={"error": error})
+
+
+def test_429_is_retried_after_server_delay(make_client, monkeypatch):
+    sleeps: list[float] = []
+    responses = iter(
+        [
+            rate_limited(1.5),
+            httpx.Response(429, headers={"Retry-After": "2"}),
+            httpx.Response(200, json={"data": {"nav": NAV}}),
+        ]
+    )
+    client = retrying_client(make_client, responses, sleeps, monkeypatch)
+
+    assert client.fleet.orbit("SHIP").system_symbol == "X1-DF55"
+    # server delay plus jitter of half the backoff
+    assert sleeps == [pytest.approx(1.75), pytest.approx(2.25)]
+
+
+def test_5xx_is_retried_for_idempotent_actions(make_client, monkeypatch):
+    sleeps: list[float] = []
+    responses = iter(
+        [
+            httpx.Response(503),
+            httpx.Response(502),
+            httpx.Response(200, json={"data": {"nav": NAV}}),
+        ]
+    )
+    client = retrying_client(make_client, responses, sleeps, monkeypatch)
+
+    client.fleet.dock("SHIP")
+    assert sleeps == [pytest.approx(0.25), pytest.approx(0.5)]
+
+
+def test_5xx_is_not_retried_for_other_actions(make_client, monkeypatch):
+    sleeps: list[float] = []
+    responses = iter([httpx.Response(503), httpx.Response(200)])
+    client = retrying_client(make_client, responses, sleeps, monkeypatch)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.fleet.navigate("SHIP", "X1-DF55-20250Z")
+    assert sleeps == []
+
+
+def test_retries_are_limited():
+    policy = RetryPolicy(max_retries=2)
+    response = httpx.Response(503, request=httpx.Request("GET", "https://api.test"))
+    assert policy.delay(response, 1) is not None
+    assert policy.delay(response, 2) is None
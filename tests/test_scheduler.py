@@ -0,0 +1,133 @@
+import asyncio
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from astrotraders.api.ratelimit import RateLimiter
+from astrotraders.api.schemas import Cooldown, ShipJumpResult, ShipNav
+from astrotraders.game.scheduler import AsyncShipScheduler, ShipScheduler, ready_at
+from tests.payloads import NAV
+
+
+def cooldown(expiration: datetime) -> Cooldown:
+    return Cooldown.parse_obj(
+        {
+            "shipSymbol": "SHIP-1",
+            "totalSeconds": 60,
+            "remainingSeconds": 30,
+            "expiration": expiration.isoformat(),
+        }
+    )
+
+
+def test_ready_at():
+    now = 1_700_000_000.0
+    moment = datetime.fromtimestamp(now + 30, timezone.utc)
+    arrival = moment + timedelta(seconds=60)
+    in_transit = dict(NAV, status="IN_TRANSIT")
+    in_transit["route"] = dict(NAV["route"], arrival=arrival.isoformat())
+
+    assert ready_at(None, now) is None
+    assert ready_at(5, now) == now + 5
+    assert ready_at(moment, now) == now + 30
+    assert ready_at(cooldown(moment), now) == now + 30
+    assert ready_at(ShipNav.parse_obj(NAV), now) == now
+    assert ready_at(ShipNav.parse_obj(in_transit), now) == now + 90
+    jump = ShipJumpResult(cooldown=cooldown(moment), nav=ShipNav.parse_obj(in_transit))
+    assert ready_at(jump, now) == now + 90
+    with pytest.raises(TypeError):
+        ready_at("soon", now)
+
+
+def test_ships_wake_in_ready_order():
+    scheduler = ShipScheduler(workers=2)
+    runs: list[tuple[str, float]] = []
+    lock = threading.Lock()
+    start = time.time()
+
+    def handler(ship: str):
+        with lock:
+            runs.append((ship, time.time() - start))
+            count = sum(1 for name, _ in runs if name == ship)
+        if count == 3:
+            return None
+        return {"A": 0.03, "B": 0.08}[ship]
+
+    scheduler.add("A", handler)
+    scheduler.add("B", handler, at=0.01)
+    scheduler.run()
+
+    assert len(scheduler) == 0 and scheduler.dispatched == 6
+    assert [ship for ship, _ in runs] == ["A", "B", "A", "A", "B", "B"]
+    b_runs = [moment for ship, moment in runs if ship == "B"]
+    assert b_runs[0] >= 0.01 and b_runs[2] - b_runs[0] >= 0.16
+
+
+def test_errors_and_removal():
+    failures = []
+
+    def on_error(ship: str, error: Exception):
+        failures.append(ship)
+        return None if len(failures) > 1 else 0
+
+    scheduler = ShipScheduler(on_error=on_error)
+
+    def failing(ship: str):
+        raise RuntimeError(ship)
+
+    scheduler.add("A", failing)
+    scheduler.add("B", lambda ship: "not a time")
+    scheduler.add("C", lambda ship: 0, at=60)
+    scheduler.remove("C")
+    scheduler.run()
+
+    assert failures == ["A", "A"]
+    assert list(scheduler.errors) == ["B"]
+    assert len(scheduler) == 0
+
+
+def test_async_scheduler_scales_to_many_ships():
+    scheduler = AsyncShipScheduler(workers=64)
+    runs: dict[str, int] = {}
+
+    async def handler(ship: str):
+        runs[ship] = runs.get(ship, 0) + 1
+        await asyncio.sleep(0)
+        if runs[ship] == 3:
+            return None
+        return datetime.now(timezone.utc) + timedelta(milliseconds=20)
+
+    async def main():
+        for index in range(2000):
+            scheduler.add(f"SHIP-{index}", handler, at=index / 100000)
+        await scheduler.run()
+
+    start = time.perf_counter()
+    asyncio.run(main())
+    assert time.perf_counter() - start < 5
+    assert scheduler.dispatched == 6000
+    assert set(runs.values()) == {3}
+
+
+def test_async_stop_and_rate_limiter_peek():
+    limiter = RateLimiter(rate=100, burst=0)
+    scheduler = AsyncShipScheduler(rate_limiter=limiter)
+    calls = []
+
+    async def handler(ship: str):
+        limiter.acquire()
+        calls.append(ship)
+        if len(calls) == 5:
+            scheduler.stop()
+        return 0
+
+    async def main():
+        scheduler.add("A", handler)
+        await scheduler.run()
+
+    asyncio.run(main())
+    assert calls == ["A"] * 5
+    # peeking doesn't take tokens
+    assert limiter.requests == 5
@@ -0,0 +1,48 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from tests.payloads import AGENT
+
+
+def test_concurrent_gets_share_one_request(make_client):
+    requests: list[str] = []
+    release = threading.Event()
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        release.wait(5)
+        return httpx.Response(200, json={"data": AGENT})
+
+    client = make_client(handler)
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(client.agents.info) for _ in range(8)]
+        deadline = time.monotonic() + 5
+        while client._client.single_flight.coalesced < 7:
+            assert time.monotonic() < deadline
+            time.sleep(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert requests == ["/my/agent"]
+    assert all(result == results[0] for result in results)
+
+
+def test_async_concurrent_gets_share_one_request(make_async_client):
+    requests: list[str] = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        requests.append(request.url.path)
+        await asyncio.sleep(0.01)
+        return httpx.Response(200, json={"data": AGENT})
+
+    async def main() -> None:
+        client = make_async_client(handler)
+        await asyncio.gather(*(client.agents.info() for _ in range(20)))
+        await client.agents.info()
+
+    asyncio.run(main())
+    assert requests == ["/my/agent", "/my/agent"]
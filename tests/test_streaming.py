@@ -0,0 +1,70 @@
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from astrotraders.api.utils import JSONArrayParser
+from tests.payloads import system
+
+SYSTEMS = [system(i) for i in range(100)]
+RAW = orjson.dumps(SYSTEMS)
+
+
+def chunks(data: bytes, size: int):
+    for index in range(0, len(data), size):
+        yield data[index : index + size]
+
+
+@pytest.mark.parametrize("size", [1, 3, 7, 4096])
+def test_parser_handles_any_chunk_boundaries(size):
+    data = [
+        {"escaped": 'quote " and ] } , [ {', "slash": "\\", "nested": [[], {}]},
+        "string, with ] brackets",
+        12.5e3,
+        -1,
+        True,
+        None,
+        [1, [2, [3]]],
+    ]
+    raw = b" \n" + orjson.dumps(data, option=orjson.OPT_INDENT_2) + b"\n"
+    parser = JSONArrayParser()
+    items = [item for chunk in chunks(raw, size) for item in parser.feed(chunk)]
+    parser.close()
+    assert items == data
+
+
+def test_parser_rejects_incomplete_array():
+    parser = JSONArrayParser()
+    assert parser.feed(b'[{"a": 1}, {"a"') == [{"a": 1}]
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_parser_rejects_data_after_array():
+    with pytest.raises(ValueError, match="after the end"):
+        JSONArrayParser().feed(b"[1, 2] 3")
+
+    parser = JSONArrayParser()
+    assert parser.feed(b"[1, 2] \n") == [1, 2]
+    with pytest.raises(ValueError, match="after the end"):
+        parser.feed(b"3")
+
+
+def test_stream_all_yields_systems(make_client):
+    client = make_client(lambda request: httpx.Response(200, content=chunks(RAW, 512)))
+
+    systems = client.systems.stream_all()
+
+    assert next(systems).symbol == "X1-S0"
+    assert [item.symbol for item in systems] == [
+        item["symbol"] for item in SYSTEMS[1:]
+    ]
+
+
+def test_async_stream_all_yields_systems(make_async_client):
+    async def main() -> list[str]:
+        client = make_async_client(lambda request: httpx.Response(200, content=RAW))
+        return [item.symbol async for item in client.systems.stream_all()]
+
+    assert len(asyncio.run(main())) == len(SYSTEMS)
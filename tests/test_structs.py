@@ -0,0 +1,160 @@
+import asyncio
+
+import httpx
+import orjson
+import pytest
+from pydantic import ValidationError
+
+from astrotraders.api.exceptions import APIException
+from astrotraders.api.fleet_state import FleetState
+from astrotraders.api.schemas import (
+    Cooldown,
+    Market,
+    PaginatedObject,
+    ShipNav,
+    ShipNavigateResult,
+    ShipNavStatus,
+    ShipSchema,
+    System,
+    Waypoint,
+)
+from astrotraders.api.utils import model_type
+from astrotraders.game.scheduler import ready_at
+from tests.payloads import (
+    NAV,
+    market,
+    paginated,
+    ship,
+    system,
+    trade_good,
+    transaction,
+    waypoint,
+)
+from tests.test_construct import COOLDOWN
+
+msgspec = pytest.importorskip("msgspec")
+
+from astrotraders.api.structs import StructBackend, struct_type  # noqa: E402
+
+CASES = [
+    (ShipSchema, ship("A", status="IN_TRANSIT")),
+    (ShipNav, NAV),
+    (Cooldown, COOLDOWN),
+    (
+        Market,
+        market(
+            "X1-A-1",
+            [trade_good("IRON_ORE", 10, 8)],
+            [transaction("X1-A-1", "IRON_ORE", "SELL", 8, "2030-01-01T00:00:00Z")],
+        ),
+    ),
+    (System, system(3)),
+    (Waypoint, waypoint("X1-A-1", 3, -4, ("MARKETPLACE", "SHIPYARD"))),
+    (PaginatedObject[ShipSchema], paginated([ship("A"), ship("B")], 2, 20)),
+    (PaginatedObject[System], paginated([system(1), system(2)], 1, 20)),
+]
+
+
+def plain(value):
+    """
+    Structs as dicts keyed by field names, like ``BaseModel.dict()`` gives.
+    """
+    if isinstance(value, msgspec.Struct):
+        return {name: plain(getattr(value, name)) for name in value.__struct_fields__}
+    if isinstance(value, list):
+        return [plain(item) for item in value]
+    return value
+
+
+@pytest.mark.parametrize("model, data", CASES)
+def test_structs_match_models(model, data):
+    backend = StructBackend()
+    assert backend.supports(model)
+    expected = model(**data).dict()
+
+    converted = backend.convert(model, data)
+    assert plain(converted) == expected
+    assert model_type(converted) is model
+
+    envelope = not issubclass(model, PaginatedObject)
+    body = orjson.dumps({"data": data} if envelope else data)
+    decoded = backend.decoder(model, envelope)(body)
+    assert plain(decoded.data if envelope else decoded) == expected
+
+
+def test_structs_keep_types_and_constraints():
+    built = StructBackend().convert(ShipSchema, ship("A"))
+    assert built.nav.status is ShipNavStatus.docked
+    assert built.nav.route.arrival == ShipSchema(**ship("A")).nav.route.arrival
+    # custom root models become their root type
+    assert built.frame.condition == 90
+    assert model_type(built.nav) is ShipNav and model_type(built) is ShipSchema
+
+    data = ship("A")
+    data["fuel"] = {"current": -1, "capacity": 100}
+    with pytest.raises(ValidationError):
+        ShipSchema(**data)
+    with pytest.raises(msgspec.ValidationError):
+        StructBackend().convert(ShipSchema, data)
+
+
+def test_structs_are_not_models():
+    backend = StructBackend()
+    nav = backend.convert(ShipNav, NAV)
+    assert not isinstance(nav, ShipNav)
+    with pytest.raises(ValidationError):
+        ShipNavigateResult(nav=nav, fuel={"current": 1, "capacity": 100})
+
+    cooldown = backend.convert(Cooldown, COOLDOWN)
+    assert ready_at(cooldown, 0) == Cooldown(**COOLDOWN).expiration.timestamp()
+
+
+def test_only_chosen_models_are_supported():
+    backend = StructBackend([ShipNav])
+    assert backend.supports(ShipNav)
+    assert not backend.supports(ShipSchema)
+    assert not backend.supports(PaginatedObject[ShipSchema])
+    assert struct_type(ShipNav) is struct_type(ShipNav)
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    path = request.url.path
+    if path == "/my/ships":
+        return httpx.Response(200, json=paginated([ship("SHIP-1")], 1, 20))
+    if path.endswith("/cooldown"):
+        return httpx.Response(204)
+    if path.endswith("/orbit"):
+        return httpx.Response(
+            200, json={"data": {"nav": {**NAV, "status": "IN_ORBIT"}}}
+        )
+    if path.startswith("/my/ships/"):
+        return httpx.Response(200, json={"data": ship(path.rsplit("/", 1)[-1])})
+    if path == "/systems/X1-A":
+        return httpx.Response(200, json={"data": system(1)})
+    return httpx.Response(404, json={"error": {"message": "not found", "code": 404}})
+
+
+def test_client_returns_structs(make_client):
+    client = make_client(handler, fleet_state=FleetState(), backend=StructBackend())
+    page = client.fleet.list()
+    assert isinstance(page.objects[0], msgspec.Struct)
+    assert page.meta.total == 1
+    assert client.fleet.cooldown("SHIP-1") is None
+    assert client.fleet.orbit("SHIP-1").status is ShipNavStatus.in_orbit
+    # fleet state updates structs in place of models
+    ship_ = client.fleet.get("SHIP-1")
+    assert isinstance(ship_, msgspec.Struct)
+    assert ship_.nav.status is ShipNavStatus.in_orbit
+    assert isinstance(client.systems.get("X1-A"), msgspec.Struct)
+    with pytest.raises(APIException):
+        client.systems.get("X1-B")
+
+
+def test_async_client_returns_structs(make_async_client):
+    async def main() -> None:
+        client = make_async_client(handler, backend=StructBackend())
+        ships = await client.fleet.all_ships()
+        assert plain(ships[0]) == ShipSchema(**ship("SHIP-1")).dict()
+        assert isinstance(await client.fleet.get("SHIP-2"), msgspec.Struct)
+
+    asyncio.run(main())
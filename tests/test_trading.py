@@ -0,0 +1,100 @@
+import math
+import random
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from astrotraders.api.markets import MarketStore, PricePoint
+from astrotraders.api.schemas import Market, ShipNavFlightMode, TradeSymbol
+from astrotraders.game.navigation import fuel_cost, travel_time
+from astrotraders.game.trading import TradeRouteEngine
+from tests.payloads import market, trade_good, waypoint
+
+WAYPOINTS = [
+    waypoint("X1-A-1", 0, 0),
+    waypoint("X1-A-2", 30, 40),
+    waypoint("X1-A-3", 300, 400),
+    waypoint("X1-A-HOME", 0, 50),
+]
+MARKETS = [
+    market("X1-A-1", [trade_good("IRON_ORE", 10, 8), trade_good("FUEL", 5, 4)]),
+    market("X1-A-2", [trade_good("IRON_ORE", 30, 25)]),
+    market("X1-A-3", [trade_good("IRON_ORE", 60, 50), trade_good("FUEL", 7, 6)]),
+]
+
+
+def test_rank_small_market():
+    engine = TradeRouteEngine.from_markets(
+        [Market.parse_obj(item) for item in MARKETS], WAYPOINTS
+    )
+    assert engine.symbols == ["FUEL", "IRON_ORE"]
+    assert np.isnan(engine.buy[0, 1])
+
+    routes = engine.rank(capacity=10, speed=30)
+    best = routes[0]
+    # 50 units away for 150 credits beats 500 units away for 400 credits
+    assert (best.buy_waypoint, best.sell_waypoint) == ("X1-A-1", "X1-A-2")
+    assert best.profit == 150 and best.time == 57
+    assert all(route.profit > 0 for route in routes)
+    assert [r.profit_per_second for r in routes] == sorted(
+        (r.profit_per_second for r in routes), reverse=True
+    )
+
+    only_fuel = engine.rank(10, 30, symbols=[TradeSymbol.fuel])
+    assert [(r.buy_waypoint, r.sell_waypoint) for r in only_fuel] == [
+        ("X1-A-1", "X1-A-3")
+    ]
+    # the way to the first market counts, and fuel isn't free
+    from_home = engine.rank(10, 30, origin="X1-A-HOME", fuel_price=1.0)[0]
+    assert from_home.time == 57 + int(travel_time(50, 30, ShipNavFlightMode.cruise))
+    assert from_home.profit == 150 - 50 - 50
+
+
+def test_rank_matches_brute_force():
+    rng = random.Random(5)
+    waypoints = [
+        waypoint(f"X1-A-{i}", rng.randint(-500, 500), rng.randint(-500, 500))
+        for i in range(60)
+    ]
+    prices = [
+        PricePoint(f"X1-A-{i}", symbol, buy, buy - rng.randint(0, 5), None, None, 0)
+        for i in range(60)
+        for symbol in ("IRON_ORE", "COPPER", "FUEL")
+        if rng.random() < 0.5
+        for buy in [rng.randint(10, 100)]
+    ]
+    engine = TradeRouteEngine(prices, waypoints)
+    coordinates = {item["symbol"]: (item["x"], item["y"]) for item in waypoints}
+
+    expected = []
+    for bought in prices:
+        for sold in prices:
+            if bought.symbol != sold.symbol or bought.waypoint == sold.waypoint:
+                continue
+            distance = math.dist(
+                coordinates[bought.waypoint], coordinates[sold.waypoint]
+            )
+            mode = ShipNavFlightMode.burn
+            profit = 20 * (sold.sell_price - bought.purchase_price) - 2 * float(
+                fuel_cost(distance, mode)
+            )
+            if profit > 0:
+                expected.append(profit / float(travel_time(distance, 10, mode)))
+    expected.sort(reverse=True)
+
+    routes = engine.rank(20, 10, ShipNavFlightMode.burn, limit=25, fuel_price=2)
+    assert np.allclose([r.profit_per_second for r in routes], expected[:25])
+
+
+def test_from_store_skips_stale_prices():
+    clock_time = [0.0]
+    store = MarketStore(clock=lambda: clock_time[0])
+    store.record_market(Market.parse_obj(MARKETS[0]))
+    clock_time[0] = 1000
+    store.record_market(Market.parse_obj(MARKETS[2]))
+
+    assert len(TradeRouteEngine.from_store(store, WAYPOINTS).markets) == 2
+    fresh = TradeRouteEngine.from_store(store, WAYPOINTS, max_age=60)
+    assert fresh.markets == ["X1-A-3"]
+    assert fresh.rank(10, 30) == []
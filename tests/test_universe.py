@@ -0,0 +1,66 @@
+import httpx
+import orjson
+
+from astrotraders.api.universe import UniverseCache
+from tests.payloads import system, waypoint
+
+SYSTEMS = [system(i) for i in range(10)]
+
+
+class CountingHandler:
+    def __init__(self) -> None:
+        self.paths: list[str] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.paths.append(request.url.path)
+        if request.url.path == "/systems.json":
+            return httpx.Response(200, content=orjson.dumps(SYSTEMS))
+        symbol = request.url.path.rsplit("/", 1)[1]
+        return httpx.Response(200, json={"data": waypoint(symbol)})
+
+
+def test_cache_survives_restart(tmp_path):
+    path = tmp_path / "universe.sqlite"
+    cache = UniverseCache(path)
+    cache.put(UniverseCache.WAYPOINTS, "X1-A-B", {"symbol": "X1-A-B"})
+    cache.close()
+
+    assert UniverseCache(path).get(UniverseCache.WAYPOINTS, "X1-A-B") == {
+        "symbol": "X1-A-B"
+    }
+
+
+def test_new_version_resets_cache():
+    cache = UniverseCache()
+    assert not cache.set_version("2023-05-20")
+    cache.put(UniverseCache.FACTIONS, "COSMIC", {})
+
+    assert not cache.set_version("2023-05-20")
+    assert cache.count(UniverseCache.FACTIONS) == 1
+    assert cache.set_version("2023-05-27")
+    assert cache.count(UniverseCache.FACTIONS) == 0
+
+
+def test_waypoint_is_read_through(make_client):
+    handler = CountingHandler()
+    client = make_client(handler, universe_cache=UniverseCache())
+
+    first = client.systems.waypoints.get("X1-A", "X1-A-B")
+    second = client.systems.waypoints.get("X1-A", "X1-A-B")
+
+    assert first == second
+    assert handler.paths == ["/systems/X1-A/waypoints/X1-A-B"]
+
+
+def test_universe_is_downloaded_once(make_client, tmp_path):
+    path = tmp_path / "universe.sqlite"
+    handler = CountingHandler()
+
+    client = make_client(handler, universe_cache=UniverseCache(path))
+    assert len(client.systems.all()) == 10
+    restarted = make_client(handler, universe_cache=UniverseCache(path))
+    assert [item.symbol for item in restarted.systems.stream_all()] == sorted(
+        item["symbol"] for item in SYSTEMS
+    )
+    assert restarted.systems.get("X1-S3").x == 3
+    assert handler.paths == ["/systems.json"]
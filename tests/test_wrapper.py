@@ -0,0 +1,32 @@
+import httpx
+import pytest
+
+from astrotraders.api.exceptions import APIException
+from astrotraders.api.schemas import AgentSchema
+from tests.payloads import AGENT
+
+
+def test_api_error_is_raised(make_client):
+    error = {"message": "Ship not found", "code": 404, "data": {"shipSymbol": "X"}}
+    client = make_client(lambda request: httpx.Response(404, json={"error": error}))
+
+    with pytest.raises(APIException) as exc_info:
+        client.fleet.get("X")
+    assert exc_info.value.code == 404
+    assert exc_info.value.message == "Ship not found"
+    assert exc_info.value.data == {"shipSymbol": "X"}
+
+
+def test_body_is_decoded_once(monkeypatch, make_client):
+    def fail(*args, **kwargs):
+        raise AssertionError("response body was decoded through httpx")
+
+    monkeypatch.setattr(httpx.Response, "json", fail)
+    client = make_client(lambda request: httpx.Response(200, json={"data": AGENT}))
+
+    assert client.agents.info() == AgentSchema(**AGENT)
+
+
+def test_empty_response_is_none(make_client):
+    client = make_client(lambda request: httpx.Response(204))
+    assert client.fleet.cooldown("SHIP") is None